@@ -16,9 +16,28 @@ from .exceptions import (
     YouTubeDownloadError,
     YTAudioFilterError,
 )
-from .ffmpeg_path import setup_ffmpeg_path
-from .pipeline import process_video
-from .youtube import download_youtube_video, is_youtube_url
+
+# Public names re-exported from submodules. They are imported on first access
+# (process_video pulls in torch/demucs) so that importing any submodule, e.g.
+# the CLI for --help, stays lightweight.
+_LAZY_EXPORTS = {
+    "process_video": ".pipeline",
+    "download_youtube_video": ".youtube",
+    "is_youtube_url": ".youtube",
+    "setup_ffmpeg_path": ".ffmpeg_path",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "process_video",
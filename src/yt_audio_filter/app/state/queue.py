@@ -1,6 +1,8 @@
 """Processing queue state management."""
 
 import json
+import os
+import re
 import threading
 import time
 from dataclasses import dataclass, field, asdict
@@ -14,6 +16,16 @@ from uuid import uuid4
 # Queue persistence file
 QUEUE_FILE = Path(__file__).parent.parent.parent.parent.parent / "data" / "queue.json"
 
+_YT_ID_RE = re.compile(r"(?:v=|youtu\.be/|/shorts/)([A-Za-z0-9_-]{11})")
+
+
+def _default_thumbnail(url: str) -> str:
+    """Derive the hqdefault thumbnail URL for a YouTube URL ("" if no id)."""
+    match = _YT_ID_RE.search(url)
+    if not match:
+        return ""
+    return f"https://i.ytimg.com/vi/{match.group(1)}/hqdefault.jpg"
+
 
 class QueueStatus(Enum):
     """Status of a queue item."""
@@ -65,6 +77,18 @@ class QueueItem:
         return cls(**data)
 
 
+def _tracked_fields(item: QueueItem) -> tuple:
+    """Fields update_status() can change, used to detect no-op updates."""
+    return (
+        item.status,
+        item.progress,
+        item.current_stage,
+        item.error_message,
+        item.output_path,
+        item.uploaded_url,
+    )
+
+
 class QueueManager:
     """Manages the processing queue with persistence."""
 
@@ -85,11 +109,22 @@ class QueueManager:
             except Exception:
                 self._items = []
 
-    def _save(self) -> None:
-        """Save queue to file."""
+    def _save(self, durable: bool = True) -> None:
+        """Save queue to file.
+
+        Writes to a sibling temp file and atomically swaps it in, so a crash
+        mid-write never leaves a truncated queue.json behind. ``durable``
+        also fsyncs the data first; progress-only updates skip that, since
+        losing a tick to a power cut costs nothing.
+        """
         QUEUE_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(QUEUE_FILE, "w", encoding="utf-8") as f:
+        tmp = QUEUE_FILE.with_suffix(".json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
             json.dump([item.to_dict() for item in self._items], f, indent=2)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, QUEUE_FILE)
 
     def add(self, url: str, title: str, thumbnail_url: str = "") -> QueueItem:
         """
@@ -103,13 +138,13 @@ class QueueManager:
         Returns:
             Created QueueItem
         """
+        item = QueueItem(
+            id=str(uuid4()),
+            url=url,
+            title=title,
+            thumbnail_url=thumbnail_url or _default_thumbnail(url),
+        )
         with self._lock:
-            item = QueueItem(
-                id=str(uuid4()),
-                url=url,
-                title=title,
-                thumbnail_url=thumbnail_url or f"https://i.ytimg.com/vi/{url.split('v=')[-1].split('&')[0]}/hqdefault.jpg",
-            )
             self._items.append(item)
             self._save()
             return item
@@ -124,17 +159,17 @@ class QueueManager:
         Returns:
             List of created QueueItems
         """
-        items = []
+        items = [
+            QueueItem(
+                id=str(uuid4()),
+                url=video["url"],
+                title=video["title"],
+                thumbnail_url=video.get("thumbnail_url") or _default_thumbnail(video["url"]),
+            )
+            for video in videos
+        ]
         with self._lock:
-            for video in videos:
-                item = QueueItem(
-                    id=str(uuid4()),
-                    url=video["url"],
-                    title=video["title"],
-                    thumbnail_url=video.get("thumbnail_url", ""),
-                )
-                self._items.append(item)
-                items.append(item)
+            self._items.extend(items)
             self._save()
         return items
 
@@ -170,6 +205,33 @@ class QueueManager:
             pending = [item for item in self._items if item.status == QueueStatus.PENDING]
             return pending[:max_items]
 
+    def claim_pending_batch(self, max_items: int = 2) -> List[QueueItem]:
+        """
+        Atomically claim up to max_items pending items for processing.
+
+        Claimed items are flipped to PROCESSING under the lock, so a second
+        caller can never pick up the same item.
+
+        Args:
+            max_items: Maximum number of items to claim
+
+        Returns:
+            List of claimed QueueItems (possibly empty)
+        """
+        with self._lock:
+            claimed = []
+            for item in self._items:
+                if len(claimed) >= max_items:
+                    break
+                if item.status == QueueStatus.PENDING:
+                    item.status = QueueStatus.PROCESSING
+                    item.current_stage = "Starting..."
+                    item.progress = 0
+                    claimed.append(item)
+            if claimed:
+                self._save()
+            return claimed
+
     def count_processing(self) -> int:
         """Count currently processing items."""
         with self._lock:
@@ -189,6 +251,7 @@ class QueueManager:
         with self._lock:
             for item in self._items:
                 if item.id == item_id:
+                    before = _tracked_fields(item)
                     item.status = status
                     if progress is not None:
                         item.progress = progress
@@ -200,9 +263,16 @@ class QueueManager:
                         item.output_path = output_path
                     if uploaded_url is not None:
                         item.uploaded_url = uploaded_url
+                    after = _tracked_fields(item)
+                    if after == before:
+                        # Idempotent update (e.g. repeated progress tick): nothing to persist
+                        break
                     if status in (QueueStatus.COMPLETED, QueueStatus.FAILED, QueueStatus.CANCELLED):
                         item.completed_at = datetime.now().isoformat()
-                    self._save()
+                    # Only status/stage/result changes are fsynced; progress
+                    # ticks arrive several times a second and hold the lock
+                    progress_only = after[:1] + after[2:] == before[:1] + before[2:]
+                    self._save(durable=not progress_only)
                     break
 
     def remove(self, item_id: str) -> bool:
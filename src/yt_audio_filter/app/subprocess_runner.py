@@ -8,17 +8,25 @@ Supports both single-video and parallel batch processing.
 """
 
 import os
+import signal
 import subprocess
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 # Path to run_filter.bat (in the project root)
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 RUN_FILTER_BAT = PROJECT_ROOT / "run_filter.bat"
 
+# Resolved once: .bat files are run as `cmd.exe /c <bat>` without shell=True
+COMSPEC = os.environ.get("ComSpec", r"C:\Windows\System32\cmd.exe")
+CREATE_NEW_PROCESS_GROUP = getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0)
+
+# Minimum interval between same-stage progress writes per queue item
+PROGRESS_THROTTLE_SECONDS = 0.25
+
 
 def run_processing_subprocess(
     url: str,
@@ -26,6 +34,7 @@ def run_processing_subprocess(
     device: str = "cuda",
     bitrate: str = "192k",
     progress_callback: Optional[Callable[[dict], None]] = None,
+    on_process: Optional[Callable[[subprocess.Popen], None]] = None,
 ) -> dict:
     """
     Run video processing by calling run_filter.bat directly.
@@ -42,13 +51,15 @@ def run_processing_subprocess(
         device: Ignored - CLI auto-detects CUDA
         bitrate: Ignored - CLI uses default
         progress_callback: Optional callback for progress updates
+        on_process: Optional callback receiving the child process once started
+            (lets callers interrupt it, see :func:`interrupt_process`)
 
     Returns:
         dict with keys: success, video_id, error, uploaded_url
     """
     # Call run_filter.bat with just the URL
     # The bat file handles: FFmpeg path, venv activation, --upload --privacy public
-    cmd = [str(RUN_FILTER_BAT), url]
+    cmd = [COMSPEC, "/c", str(RUN_FILTER_BAT), url]
 
     result = {
         "success": False,
@@ -58,8 +69,9 @@ def run_processing_subprocess(
     }
 
     try:
-        # Run run_filter.bat as a subprocess
-        # Use shell=True on Windows to properly execute .bat files
+        # Run run_filter.bat via cmd.exe /c directly (no shell=True), so there is
+        # no intermediate shell and the child gets its own process group for
+        # clean CTRL_BREAK cancellation
         process = subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
@@ -67,8 +79,10 @@ def run_processing_subprocess(
             text=True,
             bufsize=0,  # Unbuffered
             cwd=str(PROJECT_ROOT),  # Run from project root
-            shell=True,  # Required for .bat files on Windows
+            creationflags=CREATE_NEW_PROCESS_GROUP,
         )
+        if on_process:
+            on_process(process)
 
         # Read output character by character to handle tqdm's \r progress updates
         # tqdm uses \r (carriage return) to update the same line, not \n
@@ -119,6 +133,23 @@ def run_processing_subprocess(
     return result
 
 
+def interrupt_process(process: subprocess.Popen) -> None:
+    """Ask a running run_filter.bat child to stop.
+
+    On Windows the child leads its own process group, so CTRL_BREAK reaches
+    cmd.exe and the Python CLI under it; elsewhere it is terminated.
+    """
+    if process.poll() is not None:
+        return
+    try:
+        if os.name == "nt":
+            process.send_signal(signal.CTRL_BREAK_EVENT)
+        else:
+            process.terminate()
+    except OSError:
+        pass  # Exited in the meantime
+
+
 def parse_cli_output(line: str) -> Optional[dict]:
     """Parse CLI output to extract progress info."""
     line = line.strip()
@@ -245,10 +276,23 @@ class ParallelBatchProcessor:
         self._executor: Optional[ThreadPoolExecutor] = None
         self._active_futures: Dict = {}
         self._lock = threading.Lock()
+        # Running run_filter.bat children by item id
+        self._processes: Dict[str, subprocess.Popen] = {}
 
     def stop(self):
-        """Signal the processor to stop accepting new items."""
+        """Stop accepting new items and interrupt the running subprocesses."""
         self._stop_flag.set()
+        with self._lock:
+            running = list(self._processes.values())
+        for process in running:
+            interrupt_process(process)
+
+    def _track_process(self, item_id: str, process: subprocess.Popen) -> None:
+        with self._lock:
+            self._processes[item_id] = process
+        if self._stop_flag.is_set():
+            # stop() ran before this child was registered
+            interrupt_process(process)
 
     def is_stopped(self) -> bool:
         """Check if stop has been requested."""
@@ -276,10 +320,15 @@ class ParallelBatchProcessor:
             if self.on_item_progress:
                 self.on_item_progress(item_id, info)
 
-        result = run_processing_subprocess(
-            url=url,
-            progress_callback=progress_callback,
-        )
+        try:
+            result = run_processing_subprocess(
+                url=url,
+                progress_callback=progress_callback,
+                on_process=lambda process: self._track_process(item_id, process),
+            )
+        finally:
+            with self._lock:
+                self._processes.pop(item_id, None)
 
         if self.on_item_complete:
             self.on_item_complete(item_id, result)
@@ -334,18 +383,19 @@ class ParallelBatchProcessor:
 
     def start_background_processor(
         self,
-        get_next_items: Callable[[], List[Dict[str, str]]],
+        get_next_items: Callable[[int], List[Dict[str, str]]],
         on_all_complete: Optional[Callable[[], None]] = None,
     ) -> threading.Thread:
         """Start a background thread that continuously processes items.
 
         This creates a collector pattern that:
-        1. Polls for pending items via get_next_items()
+        1. Claims pending items via get_next_items(free_slots)
         2. Spawns up to max_workers parallel subprocesses
         3. Continues until no more items or stop() is called
 
         Args:
-            get_next_items: Function that returns list of {'id': ..., 'url': ...}
+            get_next_items: Function(max_items) that claims and returns at most
+                           max_items dicts of {'id': ..., 'url': ...}.
                            Should return empty list when no more items
             on_all_complete: Optional callback when all processing is done
 
@@ -353,8 +403,6 @@ class ParallelBatchProcessor:
             The background thread (already started)
         """
         def worker():
-            active_ids = set()
-
             with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
                 self._executor = executor
                 futures = {}
@@ -363,35 +411,25 @@ class ParallelBatchProcessor:
                     # Clean up completed futures
                     completed = [f for f in futures if f.done()]
                     for future in completed:
-                        item_id = futures.pop(future)
-                        active_ids.discard(item_id)
+                        futures.pop(future)
 
                     # Calculate available slots
                     slots_available = self.max_workers - len(futures)
 
                     if slots_available > 0:
-                        # Get next items (excluding already active)
-                        items = get_next_items()
-                        new_items = [
-                            item for item in items
-                            if item["id"] not in active_ids
-                        ][:slots_available]
-
-                        # Submit new items
-                        for item in new_items:
+                        # Claimed items are already marked as taken, so every
+                        # returned item must be submitted here.
+                        for item in get_next_items(slots_available):
                             future = executor.submit(
                                 self._process_single_item,
                                 item["id"],
                                 item["url"],
                             )
                             futures[future] = item["id"]
-                            active_ids.add(item["id"])
 
-                    # Check if done (no active and no pending)
+                    # Done when nothing is running and nothing could be claimed
                     if len(futures) == 0:
-                        items = get_next_items()
-                        if not items:
-                            break
+                        break
 
                     time.sleep(1)  # Check periodically
 
@@ -412,6 +450,67 @@ class ParallelBatchProcessor:
         return thread
 
 
+class _ProgressThrottle:
+    """Per-item progress filter: drops repeats and rate-limits same-stage updates.
+
+    Demucs/tqdm emit many ticks, so same-stage updates closer together than
+    ``interval`` are held back. The latest held update is delivered when the
+    interval runs out (trailing edge), so a stage's last percentage is never
+    lost. Stage changes and 100% go through immediately.
+    """
+
+    def __init__(self, push: Callable[[str, str, int], None], interval: float):
+        self._push = push
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._last: Dict[str, Tuple[str, int]] = {}
+        self._last_time: Dict[str, float] = {}
+        self._pending: Dict[str, Tuple[str, int]] = {}
+        self._timers: Dict[str, threading.Timer] = {}
+
+    def update(self, item_id: str, stage: str, pct: int) -> None:
+        with self._lock:
+            previous = self._last.get(item_id)
+            if previous == (stage, pct):
+                self._pending.pop(item_id, None)
+                return
+            now = time.monotonic()
+            wait = self._last_time.get(item_id, 0.0) + self._interval - now
+            if previous is not None and previous[0] == stage and pct < 100 and wait > 0:
+                self._pending[item_id] = (stage, pct)
+                if item_id not in self._timers:
+                    timer = threading.Timer(wait, self._flush, args=(item_id,))
+                    timer.daemon = True
+                    self._timers[item_id] = timer
+                    timer.start()
+                return
+            self._pending.pop(item_id, None)
+            self._send(item_id, stage, pct, now)
+
+    def _flush(self, item_id: str) -> None:
+        with self._lock:
+            self._timers.pop(item_id, None)
+            pending = self._pending.pop(item_id, None)
+            if pending is not None:
+                self._send(item_id, *pending, time.monotonic())
+
+    def _send(self, item_id: str, stage: str, pct: int, now: float) -> None:
+        # Called with the lock held, so updates reach the queue in order
+        self._last[item_id] = (stage, pct)
+        self._last_time[item_id] = now
+        self._push(item_id, stage, pct)
+
+    def forget(self, item_id: str) -> None:
+        """Drop an item's state (and any held update) once it has finished."""
+        with self._lock:
+            timer = self._timers.pop(item_id, None)
+            if timer is not None:
+                timer.cancel()
+            self._pending.pop(item_id, None)
+            self._last.pop(item_id, None)
+            self._last_time.pop(item_id, None)
+
+
 def create_queue_processor(
     queue_manager,
     config,
@@ -431,10 +530,7 @@ def create_queue_processor(
     """
     from yt_audio_filter.app.state.queue import QueueStatus
 
-    def on_item_progress(item_id: str, info: dict):
-        """Update queue item with progress."""
-        stage = info.get("stage", "Processing")
-        pct = info.get("percent", 0)
+    def push_progress(item_id: str, stage: str, pct: int):
         queue_manager.update_status(
             item_id,
             QueueStatus.PROCESSING,
@@ -442,6 +538,12 @@ def create_queue_processor(
             progress=pct,
         )
 
+    throttle = _ProgressThrottle(push_progress, PROGRESS_THROTTLE_SECONDS)
+
+    def on_item_progress(item_id: str, info: dict):
+        """Update queue item with progress."""
+        throttle.update(item_id, info.get("stage", "Processing"), info.get("percent", 0))
+
     def on_item_complete(item_id: str, result: dict):
         """Update queue item when complete."""
         if result["success"]:
@@ -459,52 +561,21 @@ def create_queue_processor(
                 error_message=result.get("error", "Unknown error"),
             )
 
-    # Track items that are currently being processed to prevent double-pickup
-    processing_ids = set()
-    processing_lock = threading.Lock()
-
-    def get_next_items():
-        """Get pending items from queue."""
+    def get_next_items(max_items: int):
+        """Claim up to max_items pending items from the queue."""
         if stop_flag.is_set():
             return []
-        pending = queue_manager.get_next_pending_batch(config.max_parallel_workers)
-        # Return only items not already being processed
-        with processing_lock:
-            result = [
-                {"id": item.id, "url": item.url}
-                for item in pending
-                if item.id not in processing_ids
-            ]
-        return result
-
-    def on_item_start(item_id: str):
-        """Called when an item actually starts processing."""
-        with processing_lock:
-            processing_ids.add(item_id)
-        queue_manager.update_status(
-            item_id,
-            QueueStatus.PROCESSING,
-            current_stage="Starting...",
-            progress=0,
-        )
-
-    def on_item_finish(item_id: str):
-        """Called when an item finishes (success or fail)."""
-        with processing_lock:
-            processing_ids.discard(item_id)
-
-    # Wrap callbacks to track start/finish
-    original_on_complete = on_item_complete
+        claimed = queue_manager.claim_pending_batch(max_items)
+        return [{"id": item.id, "url": item.url} for item in claimed]
 
     def on_item_complete_wrapper(item_id: str, result: dict):
-        on_item_finish(item_id)
-        original_on_complete(item_id, result)
+        throttle.forget(item_id)
+        on_item_complete(item_id, result)
 
     processor = ParallelBatchProcessor(
         max_workers=config.max_parallel_workers,
         on_item_progress=on_item_progress,
         on_item_complete=on_item_complete_wrapper,
-        on_item_start=on_item_start,
     )
 
     def on_all_complete():
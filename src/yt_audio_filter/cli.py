@@ -1,30 +1,30 @@
 """Command-line interface for YT Audio Filter."""
 
 import argparse
+import functools
 import sys
 from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Optional
 
 from . import __version__
 from .exceptions import YTAudioFilterError
-from .ffmpeg_path import setup_ffmpeg_path
-from .logger import setup_logger
-from .pipeline import process_video
-from .utils import create_temp_dir, generate_output_path
-from .youtube import (
-    VideoMetadata,
-    download_video_with_metadata,
-    ensure_ytdlp_available,
-    is_youtube_url,
-)
+from .logger import setup_logger, shutdown_logging
+from .url_patterns import YOUTUBE_URL_PATTERN
 
+if TYPE_CHECKING:
+    import re
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create and configure the argument parser."""
-    parser = argparse.ArgumentParser(
-        prog="yt-audio-filter",
-        description="Remove background music from MP4 videos using AI (Demucs)",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+    from .youtube import VideoMetadata
+
+# Heavy modules (pipeline -> torch/demucs, youtube -> yt-dlp) are imported
+# inside the branches that need them so -h / --version / --list-playlists
+# stay fast.
+
+_DEVICE_CHOICES = ("auto", "cpu", "cuda")
+_PRIVACY_CHOICES = ("public", "unlisted", "private")
+
+_EPILOG = """
 Examples:
   yt-audio-filter video.mp4                        Process local video file
   yt-audio-filter "https://youtube.com/watch?v=..." Process YouTube video
@@ -40,7 +40,23 @@ Notes:
   - YouTube URLs require yt-dlp (pip install yt-dlp)
   - YouTube upload requires: pip install google-api-python-client google-auth-oauthlib
   - GPU acceleration requires CUDA-capable GPU and PyTorch with CUDA support
-        """
+"""
+
+# Parser singleton (building it is the expensive part of parse_args)
+_PARSER: Optional[argparse.ArgumentParser] = None
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Create and configure the argument parser (built once, then reused)."""
+    global _PARSER
+    if _PARSER is not None:
+        return _PARSER
+
+    parser = argparse.ArgumentParser(
+        prog="yt-audio-filter",
+        description="Remove background music from MP4 videos using AI (Demucs)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG,
     )
 
     parser.add_argument(
@@ -53,7 +69,7 @@ Notes:
 
     parser.add_argument(
         "-o", "--output",
-        type=Path,
+        type=str,
         default=None,
         help="Path for output video file (default: input_filtered.mp4)"
     )
@@ -61,7 +77,7 @@ Notes:
     parser.add_argument(
         "-d", "--device",
         type=str,
-        choices=["auto", "cpu", "cuda"],
+        choices=_DEVICE_CHOICES,
         default="auto",
         help="Device for AI processing (default: auto)"
     )
@@ -97,7 +113,7 @@ Notes:
 
     parser.add_argument(
         "--output-dir",
-        type=Path,
+        type=str,
         default=None,
         help="Directory for output files (default: ./output/)"
     )
@@ -119,7 +135,7 @@ Notes:
     parser.add_argument(
         "--privacy",
         type=str,
-        choices=["public", "unlisted", "private"],
+        choices=_PRIVACY_CHOICES,
         default="unlisted",
         help="YouTube video privacy setting (default: unlisted)"
     )
@@ -159,6 +175,26 @@ Notes:
         help="[EXPERIMENTAL] Use mixed precision (FP16) for GPU inference. WARNING: Currently causes 7-8x slowdown with Demucs. Do not use."
     )
 
+    parser.add_argument(
+        "--bf16",
+        action="store_true",
+        help="[EXPERIMENTAL] Run Demucs under BF16 autocast on GPUs that support it (Ampere or newer). Takes precedence over --fp16."
+    )
+
+    parser.add_argument(
+        "--skip-speech-only",
+        action="store_true",
+        help="Skip Demucs when a quick pre-screen finds the audio is already bare speech (no music bed). A false positive leaves the music in place."
+    )
+
+    parser.add_argument(
+        "--ffmpeg-filter",
+        type=str,
+        default=None,
+        metavar="GRAPH",
+        help="Apply this FFmpeg audio filter (e.g. 'highpass=f=120,lowpass=f=6000') in a single pass instead of running Demucs"
+    )
+
     parser.add_argument(
         "--compile",
         action="store_true",
@@ -222,11 +258,16 @@ Notes:
              "Use this when you know those methods will fail due to bot detection."
     )
 
+    _PARSER = parser
     return parser
 
 
 def parse_args(args=None) -> argparse.Namespace:
-    """Parse and validate command-line arguments."""
+    """Parse and validate command-line arguments.
+
+    Every call returns a fresh Namespace; relative paths are resolved
+    against the current working directory at call time.
+    """
     parser = create_parser()
     parsed = parser.parse_args(args)
 
@@ -240,32 +281,82 @@ def parse_args(args=None) -> argparse.Namespace:
         parser.error("the following arguments are required: input")
 
     # Check if input is a YouTube URL or local file
-    parsed.is_youtube_url = is_youtube_url(parsed.input)
+    parsed.is_youtube_url = _is_youtube_url(parsed.input)
 
     # Resolve paths to absolute (only for local files)
     if not parsed.is_youtube_url:
-        parsed.input = Path(parsed.input).resolve()
+        parsed.input = _fast_resolve(Path(parsed.input))
 
+    # --output / --output-dir are parsed as str; build Paths only past the early exits
     if parsed.output is not None:
-        parsed.output = parsed.output.resolve()
+        parsed.output = _fast_resolve(Path(parsed.output))
 
     # Resolve output directory
     if parsed.output_dir is not None:
-        parsed.output_dir = parsed.output_dir.resolve()
+        parsed.output_dir = _fast_resolve(Path(parsed.output_dir))
 
     return parsed
 
 
+@functools.cache
+def _youtube_url_re() -> "re.Pattern[str]":
+    """The shared YouTube URL pattern, compiled on first use."""
+    import re
+
+    return re.compile(YOUTUBE_URL_PATTERN, re.IGNORECASE)
+
+
+def _is_youtube_url(input_str: str) -> bool:
+    """Same check as youtube.is_youtube_url, without importing that module."""
+    input_str = input_str.strip()
+    if "youtu" not in input_str.lower():
+        return False
+    return _youtube_url_re().match(input_str) is not None
+
+
+@functools.cache
+def _uploader() -> ModuleType:
+    """Import the uploader module on first use.
+
+    Only ``--upload`` / ``--list-playlists`` need it, and its Google API
+    client dependencies are optional.
+    """
+    from . import uploader
+
+    return uploader
+
+
+def _fast_resolve(path: Path) -> Path:
+    """Resolve a path, skipping the filesystem walk when it is already absolute
+    and has no ``..`` segments to collapse."""
+    if path.is_absolute() and ".." not in path.parts:
+        return path
+    return path.resolve()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create ``path`` if missing; a single stat() when it already exists."""
+    if not path.is_dir():
+        path.mkdir(parents=True, exist_ok=True)
+
+
 def get_output_dir(parsed) -> Path:
-    """Determine the output directory based on arguments."""
+    """Determine the output directory based on arguments.
+
+    The result is stored on ``parsed`` so repeated calls are free.
+    """
+    cached = getattr(parsed, "_resolved_output_dir", None)
+    if cached is not None:
+        return cached
+
     if parsed.output_dir is not None:
         output_dir = parsed.output_dir
     else:
         # Default to ./output/ relative to current directory
         output_dir = Path.cwd() / "output"
 
-    # Create directory if it doesn't exist
-    output_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(output_dir)
+    parsed._resolved_output_dir = output_dir
     return output_dir
 
 
@@ -286,14 +377,14 @@ def main(args=None) -> int:
         # Setup logging
         logger = setup_logger(verbose=parsed.verbose, quiet=parsed.quiet)
 
-        # Auto-detect and configure FFmpeg
-        setup_ffmpeg_path()
-
         # Handle --list-playlists special command
         if parsed.list_playlists:
-            from .uploader import list_playlists
+            uploader = _uploader()
+            # Listing only works through the Google API client (no binary
+            # fallback), so fail early with install instructions.
+            uploader.ensure_upload_dependencies()
 
-            playlists = list_playlists()
+            playlists = uploader.list_playlists()
             if playlists:
                 print("\nYour YouTube Playlists:")
                 print("-" * 50)
@@ -305,16 +396,24 @@ def main(args=None) -> int:
                 print("No playlists found (or authentication required)")
             return 0
 
+        from .ffmpeg_path import setup_ffmpeg_path
+        from .pipeline import process_video
+
+        # Auto-detect and configure FFmpeg
+        setup_ffmpeg_path()
+
         # Track video metadata for YouTube uploads
-        video_metadata: VideoMetadata | None = None
+        video_metadata: Optional["VideoMetadata"] = None
 
         if parsed.is_youtube_url:
+            from .youtube import download_video_with_metadata, ensure_ytdlp_available
+
             # YouTube URL flow: download first, then process
             ensure_ytdlp_available()
 
             # Use persistent cache directory for YouTube downloads (enables reuse)
             cache_dir = Path.cwd() / "cache" / "youtube"
-            cache_dir.mkdir(parents=True, exist_ok=True)
+            _ensure_dir(cache_dir)
 
             # Download the video and get metadata via the SHARED chain
             # (pytubefix → yt-dlp), the same one ``yt-quran-overlay`` uses.
@@ -328,67 +427,44 @@ def main(args=None) -> int:
                 cache_dir,
                 use_cache=True,
             )
-            downloaded_path = video_metadata.file_path
-            logger.debug(f"Using video file: {downloaded_path}")
-
-            # Generate output path
-            if parsed.output is not None:
-                output_path = parsed.output
-            else:
-                # Use output directory with _filtered suffix
-                output_dir = get_output_dir(parsed)
-                output_path = output_dir / f"{downloaded_path.stem}_filtered.mp4"
-
-            # Run the processing pipeline
-            result = process_video(
-                input_path=downloaded_path,
-                output_path=output_path,
-                device=parsed.device,
-                model_name=parsed.model,
-                audio_bitrate=parsed.bitrate,
-                segment=parsed.segment,
-                shifts=parsed.shifts,
-                watermark=parsed.watermark,
-                fp16=parsed.fp16,
-                compile_model=parsed.compile,
-                chunk_duration=parsed.chunk_duration,
-                parallel_chunks=parsed.parallel_chunks,
-            )
+            input_path = video_metadata.file_path
+            logger.debug(f"Using video file: {input_path}")
         else:
             # Local file flow
             input_path = parsed.input
 
-            if parsed.output is not None:
-                output_path = parsed.output
-            else:
-                # Use output directory with _filtered suffix
-                output_dir = get_output_dir(parsed)
-                output_path = output_dir / f"{input_path.stem}_filtered.mp4"
-
-            # Run the processing pipeline
-            result = process_video(
-                input_path=input_path,
-                output_path=output_path,
-                device=parsed.device,
-                model_name=parsed.model,
-                audio_bitrate=parsed.bitrate,
-                segment=parsed.segment,
-                shifts=parsed.shifts,
-                watermark=parsed.watermark,
-                fp16=parsed.fp16,
-                compile_model=parsed.compile,
-                chunk_duration=parsed.chunk_duration,
-                parallel_chunks=parsed.parallel_chunks,
-            )
+        if parsed.output is not None:
+            output_path = parsed.output
+        else:
+            # Use output directory with _filtered suffix
+            output_dir = get_output_dir(parsed)
+            output_path = output_dir / f"{input_path.stem}_filtered.mp4"
+
+        # Run the processing pipeline
+        result = process_video(
+            input_path=input_path,
+            output_path=output_path,
+            device=parsed.device,
+            model_name=parsed.model,
+            audio_bitrate=parsed.bitrate,
+            segment=parsed.segment,
+            shifts=parsed.shifts,
+            watermark=parsed.watermark,
+            fp16=parsed.fp16,
+            bf16=parsed.bf16,
+            skip_speech_only=parsed.skip_speech_only,
+            compile_model=parsed.compile,
+            chunk_duration=parsed.chunk_duration,
+            parallel_chunks=parsed.parallel_chunks,
+            ffmpeg_filter=parsed.ffmpeg_filter,
+        )
 
         logger.info(f"Success! Output saved to: {result}")
 
         # Handle YouTube upload if requested
         if parsed.upload:
-            from .uploader import upload_to_youtube
-
             logger.info("Uploading to YouTube...")
-            video_id = upload_to_youtube(
+            video_id = _uploader().upload_to_youtube(
                 video_path=result,
                 original_metadata=video_metadata,
                 privacy=parsed.privacy,
@@ -407,14 +483,20 @@ def main(args=None) -> int:
         return 1
 
     except KeyboardInterrupt:
+        shutdown_logging()
         print("\nOperation cancelled by user", file=sys.stderr)
         return 130
 
     except Exception as e:
         # Handle unexpected errors
+        shutdown_logging()
         print(f"Unexpected error: {e}", file=sys.stderr)
         return 1
 
+    finally:
+        # Flush queued log output before the caller exits
+        shutdown_logging()
+
 
 if __name__ == "__main__":
     sys.exit(main())
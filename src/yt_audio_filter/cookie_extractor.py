@@ -4,16 +4,224 @@ This bypasses bot detection by using a real browser session.
 """
 
 import asyncio
+import atexit
+import io
 import json
+import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from .logger import get_logger
 
 logger = get_logger()
 
 
+class _LoopBrowser:
+    """The Playwright driver + Chromium owned by one event loop.
+
+    Playwright objects are bound to the loop that created them. A parked
+    async generator ties their lifetime to that loop: ``asyncio.run`` (and
+    ``loop.shutdown_asyncgens()``) closes it on the way out, which closes
+    the browser and stops the driver.
+    """
+
+    def __init__(self, on_close):
+        self.playwright = None
+        self.browser = None
+        self.lock = asyncio.Lock()
+        self._on_close = on_close
+        self._guard = self._close_with_loop()
+
+    async def start(self) -> None:
+        await self._guard.asend(None)
+
+    async def _close_with_loop(self):
+        try:
+            yield
+        finally:
+            self._on_close(self)
+            browser, playwright = self.browser, self.playwright
+            self.browser = self.playwright = None
+            if browser is not None:
+                await browser.close()
+            if playwright is not None:
+                await playwright.stop()
+
+    async def close(self) -> None:
+        await self._guard.aclose()
+
+
+class _PlaywrightPool:
+    """One Playwright driver + Chromium per event loop, kept alive while it runs.
+
+    Launching the browser costs far more than opening a fresh context, so
+    repeated extractions on a loop share the browser and each gets its own
+    context. Each loop's browser is closed when that loop shuts down.
+    """
+
+    def __init__(self):
+        self._by_loop: Dict[asyncio.AbstractEventLoop, _LoopBrowser] = {}
+
+    def _forget(self, loop: asyncio.AbstractEventLoop, entry: _LoopBrowser) -> None:
+        if self._by_loop.get(loop) is entry:
+            del self._by_loop[loop]
+
+    async def get_browser(self):
+        loop = asyncio.get_running_loop()
+        entry = self._by_loop.get(loop)
+        if entry is None:
+            entry = _LoopBrowser(lambda closed: self._forget(loop, closed))
+            self._by_loop[loop] = entry
+            await entry.start()
+
+        async with entry.lock:
+            if entry.browser is None or not entry.browser.is_connected():
+                from playwright.async_api import async_playwright
+
+                if entry.playwright is None:
+                    entry.playwright = await async_playwright().start()
+                entry.browser = await entry.playwright.chromium.launch(
+                    headless=True,
+                    args=[
+                        "--disable-blink-features=AutomationControlled",
+                        "--disable-dev-shm-usage",
+                        "--no-sandbox",
+                    ]
+                )
+            return entry.browser
+
+    async def shutdown(self):
+        entry = self._by_loop.get(asyncio.get_running_loop())
+        if entry is not None:
+            await entry.close()
+
+
+_pool = _PlaywrightPool()
+
+# Event loop used by extract_cookies_sync; kept open so the pooled browser
+# survives between synchronous calls
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def get_browser():
+    """Return the shared headless Chromium, launching it on first use."""
+    return await _pool.get_browser()
+
+
+async def shutdown_pool():
+    """Close the shared browser and stop the Playwright driver."""
+    await _pool.shutdown()
+
+
+@atexit.register
+def _shutdown_sync_loop():
+    global _sync_loop
+    if _sync_loop is None or _sync_loop.is_closed():
+        return
+    try:
+        _sync_loop.run_until_complete(shutdown_pool())
+        _sync_loop.run_until_complete(_sync_loop.shutdown_asyncgens())
+    except Exception:
+        pass
+    finally:
+        _sync_loop.close()
+        _sync_loop = None
+
+
+# Cookie domains worth exporting for yt-dlp (str.endswith accepts the tuple)
+_YT_SUFFIXES = (
+    ".youtube.com",
+    "youtube.com",
+    ".google.com",
+    "google.com",
+    ".ytimg.com",
+    ".googlevideo.com",
+)
+
+# Subresources that never set cookies; skipping them saves most of the page weight
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+
+# Ad / telemetry endpoints hit by every YouTube page load
+BLOCKED_URL_PARTS = (
+    "doubleclick.net",
+    "googlesyndication.com",
+    "google-analytics.com",
+    "youtubei.googleapis.com/youtubei/v1/log_event",
+    "/youtubei/v1/log_event",
+)
+
+
+async def block_heavy_resources(
+    context, resource_types: frozenset = BLOCKED_RESOURCE_TYPES
+) -> None:
+    """Abort image/media/font/CSS and ad requests for every page in ``context``.
+
+    Documents, scripts and XHRs still load, so the responses that set
+    cookies run normally.
+    """
+
+    async def _route(route):
+        request = route.request
+        if request.resource_type in resource_types or any(
+            part in request.url for part in BLOCKED_URL_PARTS
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await context.route("**/*", _route)
+
+
+# Cookies YouTube sets for every visitor; once present the session is usable
+_SESSION_COOKIES = frozenset({"VISITOR_INFO1_LIVE", "YSC"})
+
+
+async def _wait_for_cookies(
+    context, names: frozenset, timeout: float = 10.0, interval: float = 0.25
+) -> bool:
+    """Poll the browser context until one of ``names`` is set (or timeout)."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        if any(c.get("name") in names for c in await context.cookies()):
+            return True
+        if loop.time() >= deadline:
+            logger.debug("Timed out waiting for YouTube session cookies")
+            return False
+        await asyncio.sleep(interval)
+
+
+async def _accept_consent(page) -> None:
+    """Click through the cookie consent dialog if this page shows one."""
+    try:
+        accept_button = page.locator("button:has-text('Accept all')")
+        if await accept_button.count() > 0:
+            await accept_button.click()
+    except Exception:
+        pass  # No consent dialog
+
+
+async def _visit_home(page) -> None:
+    # YouTube keeps long-polling connections open, so "networkidle" would only
+    # fire at the timeout; wait for the app shell (or the consent form) instead.
+    await page.goto("https://www.youtube.com", wait_until="domcontentloaded", timeout=30000)
+    try:
+        await page.wait_for_selector("ytd-app, form[action*='consent']", timeout=10000)
+    except Exception:
+        logger.debug("YouTube app shell did not appear, continuing")
+    await _accept_consent(page)
+
+
+async def _visit_video(page, url: str) -> None:
+    try:
+        await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+        await page.wait_for_selector("ytd-app, form[action*='consent']", timeout=10000)
+        await _accept_consent(page)
+    except Exception as e:
+        logger.warning(f"Could not visit video page: {e}")
+
+
 async def extract_youtube_cookies(output_path: Optional[Path] = None) -> Path:
     """
     Launch a headless browser, visit YouTube, and extract cookies.
@@ -25,7 +233,7 @@ async def extract_youtube_cookies(output_path: Optional[Path] = None) -> Path:
         Path to the cookies file
     """
     try:
-        from playwright.async_api import async_playwright
+        import playwright.async_api  # noqa: F401
     except ImportError:
         logger.error("Playwright not installed. Run: pip install playwright && playwright install chromium")
         raise
@@ -35,61 +243,38 @@ async def extract_youtube_cookies(output_path: Optional[Path] = None) -> Path:
 
     logger.info("Launching headless browser to extract YouTube cookies...")
 
-    async with async_playwright() as p:
-        # Launch with realistic browser settings
-        browser = await p.chromium.launch(
-            headless=True,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--disable-dev-shm-usage",
-                "--no-sandbox",
-            ]
-        )
-
-        # Create context with realistic fingerprint
-        context = await browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            locale="en-US",
-            timezone_id="America/New_York",
-        )
-
-        page = await context.new_page()
+    browser = await get_browser()
 
-        # Visit YouTube homepage first
-        logger.debug("Visiting YouTube homepage...")
-        await page.goto("https://www.youtube.com", wait_until="networkidle", timeout=30000)
+    # Create context with realistic fingerprint
+    context = await browser.new_context(
+        viewport={"width": 1920, "height": 1080},
+        user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        locale="en-US",
+        timezone_id="America/New_York",
+    )
 
-        # Wait a bit to let cookies settle
-        await asyncio.sleep(2)
+    try:
+        await block_heavy_resources(context)
+        page_home, page_video = await asyncio.gather(context.new_page(), context.new_page())
+
+        # Cookies live on the context, so the homepage and a video page can
+        # load side by side and both contribute to the same jar.
+        logger.debug("Visiting YouTube homepage and a sample video page...")
+        await asyncio.gather(
+            _visit_home(page_home),
+            # "Me at the zoo" - first YT video
+            _visit_video(page_video, "https://www.youtube.com/watch?v=jNQXAC9IVRw"),
+        )
 
-        # Accept cookies consent if present
-        try:
-            accept_button = page.locator("button:has-text('Accept all')")
-            if await accept_button.count() > 0:
-                await accept_button.click()
-                await asyncio.sleep(1)
-        except Exception:
-            pass  # No consent dialog
-
-        # Visit a video page to get more cookies
-        logger.debug("Visiting a sample video page...")
-        try:
-            # Visit a popular/safe video
-            await page.goto(
-                "https://www.youtube.com/watch?v=jNQXAC9IVRw",  # "Me at the zoo" - first YT video
-                wait_until="domcontentloaded",
-                timeout=30000
-            )
-            await asyncio.sleep(3)
-        except Exception as e:
-            logger.warning(f"Could not visit video page: {e}")
+        await _wait_for_cookies(context, _SESSION_COOKIES)
 
         # Get all cookies
         cookies = await context.cookies()
         logger.info(f"Extracted {len(cookies)} cookies from YouTube")
 
-        await browser.close()
+    finally:
+        # Keep the pooled browser alive; only the per-call context goes away
+        await context.close()
 
     # Convert to Netscape cookie format for yt-dlp
     write_netscape_cookies(cookies, output_path)
@@ -100,12 +285,13 @@ async def extract_youtube_cookies(output_path: Optional[Path] = None) -> Path:
 
 def write_netscape_cookies(cookies: list, output_path: Path):
     """Write cookies in Netscape format that yt-dlp understands."""
-    lines = ["# Netscape HTTP Cookie File", "# https://curl.se/docs/http-cookies.html", ""]
+    buf = io.StringIO()
+    buf.write("# Netscape HTTP Cookie File\n# https://curl.se/docs/http-cookies.html\n\n")
 
     for cookie in cookies:
         # Filter to YouTube cookies only
         domain = cookie.get("domain", "")
-        if "youtube" not in domain and "google" not in domain:
+        if not domain.endswith(_YT_SUFFIXES):
             continue
 
         # Netscape format: domain, subdomain_access, path, secure, expiry, name, value
@@ -113,23 +299,38 @@ def write_netscape_cookies(cookies: list, output_path: Path):
         secure = "TRUE" if cookie.get("secure", False) else "FALSE"
         expiry = int(cookie.get("expires", 0)) if cookie.get("expires") else 0
 
-        line = "\t".join([
-            domain,
-            domain_initial_dot,
-            cookie.get("path", "/"),
-            secure,
-            str(expiry),
-            cookie.get("name", ""),
-            cookie.get("value", ""),
-        ])
-        lines.append(line)
+        buf.write(
+            f"{domain}\t{domain_initial_dot}\t{cookie.get('path', '/')}\t{secure}\t{expiry}\t"
+            f"{cookie.get('name', '')}\t{cookie.get('value', '')}\n"
+        )
+
+    write_private_file(output_path, buf.getvalue().encode("utf-8"))
+
 
-    output_path.write_text("\n".join(lines), encoding="utf-8")
+def write_private_file(path: Path, data: bytes) -> None:
+    """Write ``data`` with a single os.write, readable by the owner only.
+
+    Cookie files carry session tokens, so they are created 0600 (and an
+    existing file is tightened to 0600 where the platform supports it).
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(str(path), flags, 0o600)
+    try:
+        if hasattr(os, "fchmod"):
+            os.fchmod(fd, 0o600)
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
 
 def extract_cookies_sync(output_path: Optional[Path] = None) -> Path:
     """Synchronous wrapper for extract_youtube_cookies."""
-    return asyncio.run(extract_youtube_cookies(output_path))
+    global _sync_loop
+    if _sync_loop is None or _sync_loop.is_closed():
+        _sync_loop = asyncio.new_event_loop()
+    return _sync_loop.run_until_complete(extract_youtube_cookies(output_path))
 
 
 def main():
@@ -5,29 +5,105 @@ fresh cookies in Netscape format for use with yt-dlp.
 """
 
 import asyncio
+import io
+import json
 import os
 import sys
 from pathlib import Path
 from datetime import datetime, timezone
+from typing import Optional
+
+from .cookie_extractor import _YT_SUFFIXES, block_heavy_resources, write_private_file
 
 # Cookie file path
 COOKIE_FILE = Path("cookies.txt")
 
+# Saved Playwright session (cookies + localStorage) reused across runs
+STATE_FILE = Path("yt_state.json")
+
+
+def _load_state(state_path: Path) -> Optional[dict]:
+    """Read a saved storage state; an unreadable file is deleted."""
+    try:
+        state = json.loads(state_path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        state = e
+    if isinstance(state, dict):
+        return state
+    print(f"WARNING: Saved browser session is unusable ({state}), signing in again")
+    state_path.unlink(missing_ok=True)
+    return None
+
+
+async def _open_youtube(page) -> bool:
+    """Load the YouTube homepage and report whether the account UI is present."""
+    await page.goto("https://www.youtube.com", wait_until="domcontentloaded")
+    try:
+        # "networkidle" never settles on YouTube; wait for the account UI instead
+        await page.wait_for_selector('#avatar-btn, button[aria-label*="Account"]', timeout=10000)
+    except Exception:
+        pass  # Not logged in; handled by the check below
+
+    # Check if logged in by looking for avatar or sign-in button
+    if await page.query_selector('button[aria-label*="Account"]') is not None:
+        return True
+    # Alternative check
+    return await page.query_selector('#avatar-btn') is not None
+
+
+async def _login(page, email: str, password: str) -> None:
+    """Walk through the Google sign-in form."""
+    # Go to YouTube login
+    print("Navigating to YouTube...")
+    await page.goto(
+        "https://accounts.google.com/signin/v2/identifier?service=youtube",
+        wait_until="domcontentloaded",
+    )
+    await page.wait_for_selector('input[type="email"]', timeout=10000)
+
+    # Enter email
+    print("Entering email...")
+    await page.fill('input[type="email"]', email)
+    await page.click('button:has-text("Next")')
+    await page.wait_for_timeout(3000)
+
+    # Enter password
+    print("Entering password...")
+    await page.wait_for_selector('input[type="password"]', timeout=10000)
+    await page.fill('input[type="password"]', password)
+    await page.click('button:has-text("Next")')
+    await page.wait_for_timeout(5000)
+
+    # Check if we need to handle 2FA or other challenges
+    current_url = page.url
+    if "challenge" in current_url or "signin" in current_url:
+        print("WARNING: Additional authentication required (2FA?)")
+        print(f"Current URL: {current_url}")
+        # Wait a bit more in case it's just loading
+        await page.wait_for_timeout(5000)
+
 
 async def refresh_youtube_cookies(
     email: str,
     password: str,
     output_path: Path = COOKIE_FILE,
     headless: bool = True,
+    state_path: Path = STATE_FILE,
 ) -> bool:
     """
     Log into YouTube and export fresh cookies.
 
+    If ``state_path`` holds a saved browser session that is still logged in,
+    the sign-in form is skipped entirely.
+
     Args:
         email: YouTube/Google account email
         password: Account password
         output_path: Path to save cookies.txt
         headless: Run browser in headless mode
+        state_path: Playwright storage-state file reused between runs
 
     Returns:
         True if successful, False otherwise
@@ -38,54 +114,44 @@ async def refresh_youtube_cookies(
         print("ERROR: playwright not installed. Run: pip install playwright && playwright install chromium")
         return False
 
-    print(f"Starting YouTube login for {email[:3]}***@***")
+    state = _load_state(state_path)
+    has_state = state is not None
+    user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 
     async with async_playwright() as p:
         # Launch browser
         browser = await p.chromium.launch(headless=headless)
-        context = await browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
+        try:
+            context = await browser.new_context(user_agent=user_agent, storage_state=state)
+        except Exception as e:
+            if not has_state:
+                await browser.close()
+                raise
+            # Valid JSON that Playwright still rejects: drop it and sign in
+            print(f"WARNING: Saved browser session rejected ({e}), signing in again")
+            state_path.unlink(missing_ok=True)
+            has_state = False
+            context = await browser.new_context(user_agent=user_agent)
+        # Keep stylesheets here: the sign-in form is clicked through and
+        # needs its layout to be visible/clickable.
+        await block_heavy_resources(context, frozenset({"image", "media", "font"}))
         page = await context.new_page()
 
         try:
-            # Go to YouTube login
-            print("Navigating to YouTube...")
-            await page.goto("https://accounts.google.com/signin/v2/identifier?service=youtube")
-            await page.wait_for_load_state("networkidle")
-
-            # Enter email
-            print("Entering email...")
-            await page.fill('input[type="email"]', email)
-            await page.click('button:has-text("Next")')
-            await page.wait_for_timeout(3000)
-
-            # Enter password
-            print("Entering password...")
-            await page.wait_for_selector('input[type="password"]', timeout=10000)
-            await page.fill('input[type="password"]', password)
-            await page.click('button:has-text("Next")')
-            await page.wait_for_timeout(5000)
-
-            # Check if we need to handle 2FA or other challenges
-            current_url = page.url
-            if "challenge" in current_url or "signin" in current_url:
-                print("WARNING: Additional authentication required (2FA?)")
-                print(f"Current URL: {current_url}")
-                # Wait a bit more in case it's just loading
-                await page.wait_for_timeout(5000)
-
-            # Navigate to YouTube to ensure cookies are set
-            print("Navigating to YouTube...")
-            await page.goto("https://www.youtube.com")
-            await page.wait_for_load_state("networkidle")
-            await page.wait_for_timeout(3000)
-
-            # Check if logged in by looking for avatar or sign-in button
-            is_logged_in = await page.query_selector('button[aria-label*="Account"]') is not None
-            if not is_logged_in:
-                # Alternative check
-                is_logged_in = await page.query_selector('#avatar-btn') is not None
+            is_logged_in = False
+            if has_state:
+                print("Checking saved browser session...")
+                is_logged_in = await _open_youtube(page)
+
+            if is_logged_in:
+                print("Saved session is still logged in, skipping sign-in")
+            else:
+                print(f"Starting YouTube login for {email[:3]}***@***")
+                await _login(page, email, password)
+
+                # Navigate to YouTube to ensure cookies are set
+                print("Navigating to YouTube...")
+                is_logged_in = await _open_youtube(page)
 
             if not is_logged_in:
                 print("WARNING: May not be fully logged in, but will try to export cookies anyway")
@@ -96,7 +162,7 @@ async def refresh_youtube_cookies(
             cookies = await context.cookies()
 
             # Filter to YouTube/Google cookies
-            youtube_cookies = [c for c in cookies if 'youtube' in c['domain'] or 'google' in c['domain']]
+            youtube_cookies = [c for c in cookies if c['domain'].endswith(_YT_SUFFIXES)]
 
             if not youtube_cookies:
                 print("ERROR: No YouTube cookies found!")
@@ -108,9 +174,15 @@ async def refresh_youtube_cookies(
             netscape_cookies = cookies_to_netscape(youtube_cookies)
 
             # Write to file
-            output_path.write_text(netscape_cookies)
+            write_private_file(output_path, netscape_cookies.encode("utf-8"))
             print(f"Cookies saved to {output_path}")
 
+            # Save the session so the next run can skip the sign-in form. It
+            # holds the same session tokens as cookies.txt, so it is 0600 too.
+            if is_logged_in:
+                state = await context.storage_state()
+                write_private_file(state_path, json.dumps(state).encode("utf-8"))
+
             return True
 
         except Exception as e:
@@ -129,9 +201,14 @@ async def refresh_youtube_cookies(
 
 def cookies_to_netscape(cookies: list) -> str:
     """Convert Playwright cookies to Netscape format."""
-    lines = ["# Netscape HTTP Cookie File"]
-    lines.append("# This file was generated automatically by cookie_refresh.py")
-    lines.append("")
+    buf = io.StringIO()
+    buf.write(
+        "# Netscape HTTP Cookie File\n"
+        "# This file was generated automatically by cookie_refresh.py\n"
+        "\n"
+    )
+    # Session cookies get a far-future expiry: 1 year from now
+    session_expiry = int(datetime.now(timezone.utc).timestamp()) + 365 * 24 * 60 * 60
 
     for cookie in cookies:
         domain = cookie.get('domain', '')
@@ -139,21 +216,16 @@ def cookies_to_netscape(cookies: list) -> str:
         include_subdomains = "TRUE" if domain.startswith('.') else "FALSE"
         path = cookie.get('path', '/')
         secure = "TRUE" if cookie.get('secure', False) else "FALSE"
-        # Expiry: use a far future date if not set
         expires = cookie.get('expires', -1)
-        if expires == -1:
-            # Session cookie - use 1 year from now
-            expires = int(datetime.now(timezone.utc).timestamp()) + 365 * 24 * 60 * 60
-        else:
-            expires = int(expires)
+        expires = session_expiry if expires == -1 else int(expires)
         name = cookie.get('name', '')
         value = cookie.get('value', '')
 
         # Format: domain, include_subdomains, path, secure, expires, name, value
-        line = f"{domain}\t{include_subdomains}\t{path}\t{secure}\t{expires}\t{name}\t{value}"
-        lines.append(line)
+        buf.write("\t".join((domain, include_subdomains, path, secure, str(expires), name, value)))
+        buf.write("\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def main():
@@ -167,8 +239,9 @@ def main():
 
     headless = os.environ.get("HEADLESS", "true").lower() == "true"
     output = Path(os.environ.get("COOKIE_OUTPUT", "cookies.txt"))
+    state = Path(os.environ.get("COOKIE_STATE", str(STATE_FILE)))
 
-    success = asyncio.run(refresh_youtube_cookies(email, password, output, headless))
+    success = asyncio.run(refresh_youtube_cookies(email, password, output, headless, state))
     sys.exit(0 if success else 1)
 
 
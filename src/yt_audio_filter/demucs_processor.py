@@ -1,9 +1,14 @@
 """Demucs AI model integration for vocal isolation."""
 
-from contextlib import nullcontext
+import functools
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Dict, Iterator, Optional, Tuple
 
+import numpy as np
 import torch
 import torchaudio
 import soundfile as sf
@@ -14,8 +19,10 @@ from .logger import get_logger
 
 logger = get_logger()
 
-# Global model cache to avoid reloading
-_model_cache = {}
+# Global model cache to avoid reloading. Bounded LRU: a long-running worker
+# that switches models/devices would otherwise keep every one on the GPU.
+_MODEL_CACHE_SIZE = 2
+_model_cache: "OrderedDict[tuple, object]" = OrderedDict()
 
 
 def clear_model_cache() -> None:
@@ -31,8 +38,61 @@ def clear_model_cache() -> None:
         if torch.cuda.is_available():
             torch.cuda.empty_cache()
 
-# Global progress callback for tqdm interception
-_progress_callback = None
+# (apply_model, demucs.apply module), resolved on first use
+_demucs_apply_cache = None
+_availability_cache: Optional[bool] = None
+
+
+def _get_demucs_apply():
+    """Import ``demucs.apply`` once and return ``(apply_model, demucs.apply)``."""
+    global _demucs_apply_cache
+    if _demucs_apply_cache is None:
+        from demucs.apply import apply_model
+        import demucs.apply as demucs_apply
+        _demucs_apply_cache = (apply_model, demucs_apply)
+    return _demucs_apply_cache
+
+
+# Resample modules keyed by (orig_freq, new_freq); building the sinc kernel is
+# the expensive part and the rate pairs seen in practice are few
+_resampler_cache: Dict[Tuple[int, int], torchaudio.transforms.Resample] = {}
+
+
+def _get_resampler(orig_freq: int, new_freq: int) -> torchaudio.transforms.Resample:
+    """Return a cached ``Resample`` transform for the given rate pair."""
+    key = (orig_freq, new_freq)
+    resampler = _resampler_cache.get(key)
+    if resampler is None:
+        resampler = _resampler_cache[key] = torchaudio.transforms.Resample(orig_freq, new_freq)
+    return resampler
+
+
+def _evict_oldest_model() -> None:
+    """Drop the least recently used model and release its GPU memory."""
+    key, model = _model_cache.popitem(last=False)
+    logger.debug(f"Evicting cached model: {key[0]} ({key[1]})")
+    try:
+        model.cpu()
+    except Exception:
+        pass
+    del model
+    if torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+
+# Progress callback for tqdm interception, per thread: separate_vocals may run
+# on several threads at once (one per CUDA stream)
+_progress_state = threading.local()
+
+# demucs' tqdm is patched once for all concurrent separations
+_tqdm_patch_lock = threading.Lock()
+_tqdm_patch_users = 0
+_tqdm_original = None
+
+
+def _current_progress_callback() -> Optional[Callable[[dict], None]]:
+    """Return the progress callback of the calling thread's separation."""
+    return getattr(_progress_state, "callback", None)
 
 
 def enable_cuda_optimizations() -> None:
@@ -51,15 +111,20 @@ def enable_cuda_optimizations() -> None:
 class ProgressCaptureTqdm(original_tqdm):
     """Custom tqdm that captures progress and reports to a callback."""
 
+    # Minimum seconds between callbacks; tqdm ticks far more often than a UI needs
+    REPORT_INTERVAL = 0.1
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._last_reported_pct = -1
         self._start_time = None
+        self._next_report_t = float("-inf")
+        # Bars are created on the separating thread; bind its callback now
+        self._callback = _current_progress_callback()
 
     def __iter__(self):
         """Override __iter__ to capture progress on every iteration."""
-        import time as time_module
-        self._start_time = time_module.time()
+        self._start_time = time.monotonic()
 
         iterable = self.iterable
         if self.disable:
@@ -72,51 +137,102 @@ class ProgressCaptureTqdm(original_tqdm):
             for obj in iterable:
                 yield obj
                 n += 1
-                self._report_progress(n, time_module.time())
+                self._report_progress(n, time.monotonic())
         finally:
             self.n = n
             self.close()
 
     def _report_progress(self, current_n, current_time):
-        """Report progress to callback."""
+        """Report progress to callback (at most every REPORT_INTERVAL seconds)."""
         try:
-            if _progress_callback and self.total and self.total > 0:
-                pct = int(100 * current_n / self.total)
-                # Only report on significant changes (every 1%)
-                if pct != self._last_reported_pct:
-                    self._last_reported_pct = pct
-
-                    elapsed = current_time - self._start_time if self._start_time else 0
-                    rate = current_n / elapsed if elapsed > 0 else 0
-                    remaining = (self.total - current_n) / rate if rate > 0 else 0
-
-                    progress_info = {
-                        'percent': pct,
-                        'current': current_n,
-                        'total': self.total,
-                        'elapsed_seconds': elapsed,
-                        'remaining_seconds': remaining,
-                        'rate': rate,
-                        'unit': getattr(self, 'unit', 's'),
-                    }
-                    _progress_callback(progress_info)
+            total = self.total
+            if not (self._callback and total and total > 0):
+                return
+            # Always let the final tick through so the bar reaches 100%
+            if current_time < self._next_report_t and current_n < total:
+                return
+
+            pct = int(100 * current_n / total)
+            # Only report on significant changes (every 1%)
+            if pct == self._last_reported_pct:
+                return
+            self._last_reported_pct = pct
+            self._next_report_t = current_time + self.REPORT_INTERVAL
+
+            elapsed = current_time - self._start_time if self._start_time is not None else 0
+            rate = current_n / elapsed if elapsed > 0 else 0
+            remaining = (total - current_n) / rate if rate > 0 else 0
+
+            progress_info = {
+                'percent': pct,
+                'current': current_n,
+                'total': total,
+                'elapsed_seconds': elapsed,
+                'remaining_seconds': remaining,
+                'rate': rate,
+                'unit': getattr(self, 'unit', 's'),
+            }
+            self._callback(progress_info)
         except Exception:
             # Don't let progress reporting break the actual processing
             pass
 
     def update(self, n=1):
         """Also capture progress when update() is called manually."""
-        import time as time_module
+        now = time.monotonic()
         if self._start_time is None:
-            self._start_time = time_module.time()
+            self._start_time = now
         super().update(n)
-        self._report_progress(self.n, time_module.time())
+        self._report_progress(self.n, now)
+
+
+class SilentTqdm(original_tqdm):
+    """tqdm that never renders: disabled bars skip all display/refresh work."""
+
+    def __init__(self, *args, **kwargs):
+        kwargs["disable"] = True
+        super().__init__(*args, **kwargs)
+
+
+def _demucs_tqdm(*args, **kwargs):
+    """tqdm factory for demucs: a reporting bar if this thread has a callback."""
+    cls = ProgressCaptureTqdm if _current_progress_callback() else SilentTqdm
+    return cls(*args, **kwargs)
 
 
+@contextmanager
+def _patched_demucs_tqdm(demucs_apply) -> Iterator[None]:
+    """
+    Route demucs' progress bars through _demucs_tqdm while separating.
+
+    demucs.apply does `import tqdm` then uses `tqdm.tqdm(...)`, so the patch
+    lands on the tqdm module itself. It is reference counted: the first
+    concurrent separation installs it and the last one restores the original.
+    """
+    global _tqdm_patch_users, _tqdm_original
+
+    with _tqdm_patch_lock:
+        if _tqdm_patch_users == 0:
+            _tqdm_original = demucs_apply.tqdm.tqdm
+            demucs_apply.tqdm.tqdm = _demucs_tqdm
+        _tqdm_patch_users += 1
+    try:
+        yield
+    finally:
+        with _tqdm_patch_lock:
+            _tqdm_patch_users -= 1
+            if _tqdm_patch_users == 0:
+                demucs_apply.tqdm.tqdm = _tqdm_original
+                _tqdm_original = None
+
+
+@functools.lru_cache(maxsize=8)
 def get_device(device: str = "auto") -> torch.device:
     """
     Get the appropriate torch device.
 
+    Cached per device string, so the CUDA probe runs once per process.
+
     Args:
         device: Device specification ("auto", "cpu", "cuda", "cuda:0", etc.)
 
@@ -153,10 +269,11 @@ def _load_model(model_name: str = "htdemucs", device: torch.device = None, compi
     if device is None:
         device = get_device("auto")
 
-    cache_key = (model_name, str(device), compile_model)
+    cache_key = (model_name, device.type, device.index or 0, compile_model)
 
     if cache_key in _model_cache:
         logger.debug(f"Using cached model: {model_name}")
+        _model_cache.move_to_end(cache_key)
         return _model_cache[cache_key]
 
     logger.debug(f"Loading Demucs model: {model_name}")
@@ -178,6 +295,8 @@ def _load_model(model_name: str = "htdemucs", device: torch.device = None, compi
             )
 
         _model_cache[cache_key] = model
+        while len(_model_cache) > _MODEL_CACHE_SIZE:
+            _evict_oldest_model()
         logger.debug(f"Model loaded successfully (sample rate: {model.samplerate})")
         return model
 
@@ -190,6 +309,84 @@ def _load_model(model_name: str = "htdemucs", device: torch.device = None, compi
         raise DemucsError(f"Failed to load Demucs model '{model_name}'", str(e))
 
 
+def preload_model(
+    model_name: str = "htdemucs", device: str = "auto", compile_model: bool = False
+) -> None:
+    """
+    Load a Demucs model into this process's model cache ahead of use.
+
+    Later isolate_vocals() calls with the same model/device/compile settings
+    reuse it instead of paying the load on their first chunk.
+    """
+    enable_cuda_optimizations()
+    _load_model(model_name, get_device(device), compile_model=compile_model)
+
+
+def _read_audio_channels_first(
+    audio_path: Path, blocksize: int = 1 << 20
+) -> Tuple[np.ndarray, int]:
+    """
+    Read an audio file straight into a ``(channels, samples)`` float32 array.
+
+    soundfile yields ``(samples, channels)``; filling a preallocated
+    channels-first buffer block by block avoids a second full-size copy
+    for the transpose.
+    """
+    with sf.SoundFile(str(audio_path)) as f:
+        out = np.empty((f.channels, f.frames), dtype=np.float32)
+        pos = 0
+        for block in f.blocks(blocksize, dtype='float32', always_2d=True):
+            out[:, pos:pos + block.shape[0]] = block.T
+            pos += block.shape[0]
+        sample_rate = f.samplerate
+    # frames can over-report for some containers; trim to what was read
+    return out[:, :pos] if pos != out.shape[1] else out, sample_rate
+
+
+# Tracks longer than this stay in (pinned) host memory during separation and
+# only the segment being processed is moved to the GPU
+HOST_RESIDENT_SECONDS = 600
+
+# Fraction of sampled frames that must look like speech to skip Demucs
+SPEECH_ONLY_RATIO = 0.9
+
+
+def _speech_ratio(audio_data: np.ndarray, sample_rate: int, max_frames: int = 2000) -> float:
+    """
+    Estimate how much of the audio is bare speech (no music bed).
+
+    Looks at up to ``max_frames`` evenly spaced 30 ms frames. A frame counts
+    as speech-like when it is silent (a pause) or when most of its energy sits
+    in the 300-3400 Hz voice band. Music keeps energy outside that band and
+    rarely goes quiet, so it scores low. Returns a value in [0, 1].
+    """
+    mono = audio_data.mean(axis=1) if audio_data.ndim > 1 else audio_data
+    frame_len = max(int(sample_rate * 0.03), 1)
+    n_frames = len(mono) // frame_len
+    if n_frames == 0:
+        return 0.0
+
+    frames = mono[: n_frames * frame_len].reshape(n_frames, frame_len)
+    if n_frames > max_frames:
+        frames = frames[np.linspace(0, n_frames - 1, max_frames).astype(int)]
+
+    spectrum = np.abs(np.fft.rfft(frames, axis=1)) ** 2
+    freqs = np.fft.rfftfreq(frame_len, 1.0 / sample_rate)
+    band = (freqs >= 300) & (freqs <= 3400)
+
+    total = spectrum.sum(axis=1)
+    peak = total.max()
+    if peak <= 0:
+        return 0.0
+
+    silent = total < peak * 1e-4  # more than 40 dB below the loudest frame
+    voiced = spectrum[:, band].sum(axis=1) >= 0.6 * np.maximum(total, 1e-12)
+    # Continuous sound with no pauses at all is not conversational speech
+    if silent.mean() < 0.05:
+        return float((voiced & ~silent).mean()) * 0.5
+    return float((silent | voiced).mean())
+
+
 def isolate_vocals(
     audio_path: Path,
     output_path: Path,
@@ -200,6 +397,8 @@ def isolate_vocals(
     shifts: int = 1,
     fp16: bool = False,
     compile_model: bool = False,
+    bf16: bool = False,
+    skip_when_vocals_only: bool = False,
 ) -> Path:
     """
     Isolate vocals from an audio file using Demucs.
@@ -223,6 +422,13 @@ def isolate_vocals(
         fp16: Use mixed precision (FP16) for faster inference on modern GPUs.
             Recommended for RTX 20xx/30xx/40xx series. Reduces VRAM and increases speed.
         compile_model: Compile model with torch.compile() (PyTorch 2.0+) for faster inference.
+        bf16: Run inference under BF16 autocast on GPUs that support it (Ampere+).
+            Same exponent range as FP32, so no overflow risk; takes precedence over fp16.
+            Model weights stay FP32 since Demucs' STFT does not accept BF16 input.
+        skip_when_vocals_only: Run a cheap speech pre-screen first and, if the
+            input already looks like speech only (podcasts, recitation without
+            background), write it through unchanged instead of running Demucs.
+            Off by default: a false positive leaves background music in place.
 
     Returns:
         Path to the isolated vocals file
@@ -230,11 +436,8 @@ def isolate_vocals(
     Raises:
         DemucsError: If vocal isolation fails
     """
-    global _progress_callback
-
     try:
-        from demucs.apply import apply_model
-        import demucs.apply as demucs_apply
+        _get_demucs_apply()
     except ImportError:
         raise PrerequisiteError(
             "Demucs not installed",
@@ -246,6 +449,93 @@ def isolate_vocals(
 
     logger.debug(f"Isolating vocals from {audio_path}")
 
+    try:
+        # Load audio using soundfile (more compatible than torchaudio default backend)
+        logger.debug("Loading audio file...")
+        audio_data, sample_rate = _read_audio_channels_first(audio_path)
+    except Exception as e:
+        raise DemucsError(f"Vocal isolation failed: {e}")
+
+    vocals, vocals_rate = separate_vocals(
+        audio_data,
+        sample_rate,
+        device=device,
+        model_name=model_name,
+        progress_callback=progress_callback,
+        segment=segment,
+        shifts=shifts,
+        fp16=fp16,
+        compile_model=compile_model,
+        bf16=bf16,
+        skip_when_vocals_only=skip_when_vocals_only,
+    )
+
+    try:
+        # Save vocals to file using soundfile
+        # Transpose from (channels, samples) to (samples, channels) for soundfile
+        sf.write(
+            str(output_path),
+            vocals.T,
+            vocals_rate,
+            subtype='PCM_16'
+        )
+    except Exception as e:
+        raise DemucsError(f"Vocal isolation failed: {e}")
+
+    logger.debug(f"Vocals saved to {output_path}")
+    return output_path
+
+
+def separate_vocals(
+    audio_data: np.ndarray,
+    sample_rate: int,
+    device: str = "auto",
+    model_name: str = "htdemucs",
+    progress_callback: Optional[Callable[[dict], None]] = None,
+    segment: Optional[int] = None,
+    shifts: int = 1,
+    fp16: bool = False,
+    compile_model: bool = False,
+    bf16: bool = False,
+    skip_when_vocals_only: bool = False,
+) -> Tuple[np.ndarray, int]:
+    """
+    Isolate vocals from an in-memory mix using Demucs.
+
+    The in-memory core of :func:`isolate_vocals`, for callers that already
+    hold the PCM (e.g. piped from ffmpeg) and want no WAV round trip.
+
+    Args:
+        audio_data: ``(channels, samples)`` mix, float32 or int16 PCM (as
+            returned by :func:`extract_audio_array`)
+        sample_rate: Sample rate of ``audio_data``
+        Other arguments as for :func:`isolate_vocals`.
+
+    Returns:
+        ``(vocals, sample_rate)``: ``(channels, samples)`` int16 vocals at the
+        model's sample rate (the input rate when the speech pre-screen skips
+        Demucs)
+
+    Raises:
+        DemucsError: If vocal isolation fails
+    """
+    try:
+        apply_model, demucs_apply = _get_demucs_apply()
+    except ImportError:
+        raise PrerequisiteError(
+            "Demucs not installed",
+            "Please install demucs: pip install demucs"
+        )
+
+    if skip_when_vocals_only:
+        ratio = _speech_ratio(audio_data.T, sample_rate)
+        logger.debug(f"Speech pre-screen ratio: {ratio:.2f}")
+        if ratio >= SPEECH_ONLY_RATIO:
+            logger.info("Audio is already speech-only, skipping Demucs")
+            if not np.issubdtype(audio_data.dtype, np.integer):
+                audio_data = (np.clip(audio_data, -1.0, 1.0) * 32767.0).round()
+            return audio_data.astype(np.int16, copy=False), sample_rate
+
     # Enable CUDA optimizations
     enable_cuda_optimizations()
 
@@ -253,10 +543,16 @@ def isolate_vocals(
     torch_device = get_device(device)
     model = _load_model(model_name, torch_device, compile_model=compile_model)
 
+    use_bf16 = bf16 and torch_device.type == "cuda" and torch.cuda.is_bf16_supported()
+    if bf16 and not use_bf16:
+        logger.debug("BF16 requested but not supported on this device, using FP32")
+
     # Log optimization settings
     if torch_device.type == "cuda":
         opt_info = []
-        if fp16:
+        if use_bf16:
+            opt_info.append("BF16")
+        elif fp16:
             opt_info.append("FP16")
         if compile_model:
             opt_info.append("compiled")
@@ -264,23 +560,19 @@ def isolate_vocals(
             logger.info(f"GPU optimizations: {', '.join(opt_info)}")
 
     try:
-        # Load audio using soundfile (more compatible than torchaudio default backend)
-        logger.debug("Loading audio file...")
-        audio_data, sample_rate = sf.read(str(audio_path), dtype='float32')
-
-        # Convert to tensor: soundfile returns (samples, channels), we need (channels, samples)
-        if len(audio_data.shape) == 1:
-            # Mono audio
-            waveform = torch.from_numpy(audio_data).unsqueeze(0)
+        # One pass converts int16 PCM to float and lays it out C-contiguous
+        if np.issubdtype(audio_data.dtype, np.integer):
+            audio_data = np.multiply(
+                audio_data, 1.0 / 32768, dtype=np.float32, order="C"
+            )
         else:
-            # Stereo/multi-channel audio - transpose to (channels, samples)
-            waveform = torch.from_numpy(audio_data.T.copy())
+            audio_data = np.ascontiguousarray(audio_data, dtype=np.float32)
+        waveform = torch.from_numpy(audio_data)
 
         # Resample if necessary
         if sample_rate != model.samplerate:
             logger.debug(f"Resampling from {sample_rate} to {model.samplerate}")
-            resampler = torchaudio.transforms.Resample(sample_rate, model.samplerate)
-            waveform = resampler(waveform)
+            waveform = _get_resampler(sample_rate, model.samplerate)(waveform)
 
         # Ensure stereo
         if waveform.shape[0] == 1:
@@ -288,15 +580,24 @@ def isolate_vocals(
         elif waveform.shape[0] > 2:
             waveform = waveform[:2, :]
 
-        # Add batch dimension: (channels, samples) -> (batch, channels, samples)
-        waveform = waveform.unsqueeze(0).to(torch_device)
+        # Add batch dimension: (channels, samples) -> (batch, channels, samples).
+        # Pinned host memory lets the H2D copy run asynchronously.
+        if torch_device.type == "cuda":
+            waveform = waveform.pin_memory()
+        waveform = waveform.unsqueeze(0)
+        if waveform.shape[-1] > HOST_RESIDENT_SECONDS * model.samplerate:
+            # Long track: leave the full mix (and the 4-stem output, 4x its size)
+            # in host memory. apply_model streams one segment at a time to
+            # `device` and accumulates results on the mix's device.
+            logger.debug("Long audio: keeping full track in host memory during separation")
+        else:
+            waveform = waveform.to(torch_device, non_blocking=True)
 
         # Apply model with progress capture
         logger.debug("Running vocal separation (this may take a while)...")
 
-        # Set up progress callback
-        global _progress_callback
-        _progress_callback = progress_callback
+        # Set up progress callback (seen only by bars created on this thread)
+        _progress_state.callback = progress_callback
 
         # Build apply_model kwargs with memory optimization
         apply_kwargs = {
@@ -333,7 +634,9 @@ def isolate_vocals(
             # Create autocast context manager for FP16 if enabled
             use_fp16 = fp16 and torch_device.type == "cuda"
 
-            if use_fp16:
+            if use_bf16:
+                autocast_ctx = torch.autocast(device_type="cuda", dtype=torch.bfloat16)
+            elif use_fp16:
                 # Use new API if available (PyTorch 2.0+), fallback to old API
                 try:
                     autocast_ctx = torch.amp.autocast('cuda')
@@ -342,25 +645,12 @@ def isolate_vocals(
             else:
                 autocast_ctx = nullcontext()
 
-            if progress_callback:
-                # demucs.apply does: `import tqdm` then uses `tqdm.tqdm(...)`
-                # So demucs_apply.tqdm is the tqdm MODULE, and we need to patch
-                # the 'tqdm' attribute ON that module (which is the tqdm class)
-                from unittest.mock import patch
-
-                # demucs_apply.tqdm is the tqdm module
-                # We need to patch demucs_apply.tqdm.tqdm (the class)
-                tqdm_module = demucs_apply.tqdm
-                with patch.object(tqdm_module, 'tqdm', ProgressCaptureTqdm):
-                    with autocast_ctx:
-                        with torch.no_grad():
-                            sources = apply_model(**apply_kwargs)
-            else:
-                with autocast_ctx:
-                    with torch.no_grad():
-                        sources = apply_model(**apply_kwargs)
+            # Without a callback, demucs gets a bar that never draws
+            with _patched_demucs_tqdm(demucs_apply), autocast_ctx:
+                with torch.inference_mode():
+                    sources = apply_model(**apply_kwargs)
         finally:
-            _progress_callback = None
+            _progress_state.callback = None
 
         # sources shape: (batch, num_sources, channels, samples)
         # htdemucs sources: drums, bass, other, vocals (index 3)
@@ -385,25 +675,18 @@ def isolate_vocals(
         vocals = sources[vocals_idx]  # Shape: (channels, samples)
         logger.debug(f"Vocals tensor shape: {vocals.shape}")
 
-        # Move to CPU for saving
-        vocals = vocals.cpu().numpy()
-
-        # Save vocals to file using soundfile
-        # Transpose from (channels, samples) to (samples, channels) for soundfile
-        sf.write(
-            str(output_path),
-            vocals.T,
-            model.samplerate,
-            subtype='PCM_16'
-        )
-
-        logger.debug(f"Vocals saved to {output_path}")
+        # Quantize to 16-bit PCM where the tensor lives (GPU for short tracks),
+        # so only half as many bytes cross PCIe and soundfile writes as-is
+        vocals = (vocals.clamp(-1.0, 1.0) * 32767.0).round_().to(torch.int16)
 
-        # Clear CUDA cache if using GPU
-        if torch_device.type == "cuda":
-            torch.cuda.empty_cache()
-
-        return output_path
+        # Move to CPU for saving (via a pinned buffer when coming off the GPU)
+        if vocals.is_cuda:
+            vocals_cpu = torch.empty(vocals.shape, dtype=vocals.dtype, pin_memory=True)
+            vocals_cpu.copy_(vocals, non_blocking=True)
+            torch.cuda.current_stream(vocals.device).synchronize()
+            vocals = vocals_cpu
+        vocals = vocals.numpy()
+        return vocals, model.samplerate
 
     except Exception as e:
         if isinstance(e, (DemucsError, PrerequisiteError)):
@@ -418,12 +701,15 @@ def check_demucs_available() -> bool:
     Returns:
         True if Demucs is available, False otherwise
     """
-    try:
-        from demucs.pretrained import get_model
-        from demucs.apply import apply_model
-        return True
-    except ImportError:
-        return False
+    global _availability_cache
+    if _availability_cache is None:
+        try:
+            from demucs.pretrained import get_model  # noqa: F401
+            _get_demucs_apply()
+            _availability_cache = True
+        except ImportError:
+            _availability_cache = False
+    return _availability_cache
 
 
 def ensure_demucs_available() -> None:
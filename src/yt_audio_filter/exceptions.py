@@ -8,11 +8,11 @@ class YTAudioFilterError(Exception):
         super().__init__(message)
         self.message = message
         self.details = details
+        # Formatted once; str() is hit repeatedly by logging and retries
+        self._str = f"{message}\nDetails: {details}" if details else message
 
     def __str__(self) -> str:
-        if self.details:
-            return f"{self.message}\nDetails: {self.details}"
-        return self.message
+        return self._str
 
 
 class ValidationError(YTAudioFilterError):
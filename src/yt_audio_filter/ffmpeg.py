@@ -1,42 +1,80 @@
 """FFmpeg wrapper functions for audio extraction and video remuxing."""
 
+import asyncio
+import functools
 import json
+import os
 import subprocess
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, Callable, List, Optional, Sequence, Tuple
 
 from .exceptions import FFmpegError, PrerequisiteError
-from .ffmpeg_path import setup_ffmpeg_path
+from .ffmpeg_path import get_ffmpeg_path, get_ffprobe_path, setup_ffmpeg_path
 from .logger import get_logger
 
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = get_logger()
 
+# Constant command prefixes, built once; only the per-call path is appended
+_FFPROBE_CMD = (
+    "ffprobe",
+    "-v", "error",
+    "-select_streams", "a:0",  # Callers only read the first audio stream
+    "-show_entries", "stream=codec_type,sample_rate,channels,codec_name",
+    "-show_entries", "format=duration",
+    "-of", "json=compact=1",  # One line per section, no indentation
+)
+_FFMPEG_VERSION_CMD = ("ffmpeg", "-version")
+_FFMPEG_ENCODERS_CMD = ("ffmpeg", "-hide_banner", "-encoders")
+_FFMPEG_FILTERS_CMD = ("ffmpeg", "-hide_banner", "-filters")
+_FFMPEG_HWACCELS_CMD = ("ffmpeg", "-hide_banner", "-hwaccels")
+
+# Set once check_ffmpeg_available() has succeeded
+_ffmpeg_found = False
+
 
 def check_ffmpeg_available() -> bool:
     """
     Check if FFmpeg is available in the system PATH or bundled.
 
     This function first attempts to auto-detect and configure bundled FFmpeg
-    before checking availability.
+    before checking availability. Only a positive result is cached, so an
+    FFmpeg installed after a failed check is picked up on the next call.
 
     Returns:
         True if FFmpeg is available, False otherwise
     """
+    global _ffmpeg_found
+
+    if _ffmpeg_found:
+        return True
+
     # Try to setup bundled FFmpeg if system FFmpeg not found
     setup_ffmpeg_path()
 
+    # A PATH lookup is a filesystem check; only spawn ffmpeg if it fails
+    if get_ffmpeg_path() is not None:
+        _ffmpeg_found = True
+        return True
+
     try:
         result = subprocess.run(
-            ["ffmpeg", "-version"],
+            _FFMPEG_VERSION_CMD,
             capture_output=True,
             text=True,
             encoding='utf-8',
             errors='replace',
             timeout=10
         )
-        return result.returncode == 0
     except (FileNotFoundError, subprocess.TimeoutExpired):
         return False
+    _ffmpeg_found = result.returncode == 0
+    return _ffmpeg_found
 
 
 def ensure_ffmpeg_available() -> None:
@@ -56,6 +94,107 @@ def ensure_ffmpeg_available() -> None:
         )
 
 
+_EXECUTABLE_LOOKUPS = {"ffmpeg": get_ffmpeg_path, "ffprobe": get_ffprobe_path}
+
+
+def _executable(name: str) -> str:
+    """Absolute path for ``ffmpeg`` / ``ffprobe`` if resolvable, else ``name``.
+
+    Lookups are cached in ffmpeg_path (after bundled-FFmpeg setup). An
+    absolute path is one of the conditions for CPython to launch the child
+    with posix_spawn instead of fork + exec.
+    """
+    lookup = _EXECUTABLE_LOOKUPS.get(name)
+    found = lookup() if lookup is not None else None
+    return str(found) if found is not None else name
+
+
+def _probe_cmd(path_str: str) -> List[str]:
+    """ffprobe command for the streams + format JSON used by the probe helpers."""
+    return [_executable("ffprobe"), *_FFPROBE_CMD[1:], path_str]
+
+
+@functools.lru_cache(maxsize=1)
+def _import_av():
+    """Return the PyAV module if installed (optional ``av`` extra), else None."""
+    try:
+        import av
+    except ImportError:
+        return None
+    return av
+
+
+def _probe_with_av(av, path_str: str) -> dict:
+    """Read stream/format info in-process with PyAV, shaped like ffprobe's JSON.
+
+    Avoids spawning ffprobe (and reloading libavformat) for every probe.
+    """
+    with av.open(path_str) as container:
+        streams = []
+        for stream in container.streams:
+            entry = {"codec_type": stream.type}
+            ctx = stream.codec_context
+            if ctx is not None:
+                entry["codec_name"] = ctx.name
+                if stream.type == "audio":
+                    entry["sample_rate"] = ctx.sample_rate
+                    entry["channels"] = ctx.channels
+            streams.append(entry)
+
+        data = {"streams": streams, "format": {}}
+        if container.duration is not None:
+            data["format"]["duration"] = container.duration / av.time_base
+        return data
+
+
+@functools.lru_cache(maxsize=256)
+def _probe_cached(path_str: str, mtime_ns: int, size: int) -> dict:
+    """
+    Probe streams + format once and return ffprobe-style JSON.
+
+    Uses PyAV in-process when it is installed, otherwise one ffprobe run.
+    Keyed on (path, mtime, size) so an overwritten file is re-probed. Only
+    successful probes are cached; failures raise and are retried next call.
+    """
+    av = _import_av()
+    if av is not None:
+        try:
+            return _probe_with_av(av, path_str)
+        except Exception as e:
+            logger.debug(f"PyAV probe failed, falling back to ffprobe: {e}")
+
+    cmd = _probe_cmd(path_str)
+
+    try:
+        # Raw bytes: json.loads parses UTF-8 directly, no separate decode pass.
+        # close_fds=False (our fds are non-inheritable anyway) keeps these
+        # short, frequent spawns eligible for posix_spawn.
+        result = subprocess.run(cmd, capture_output=True, timeout=60, close_fds=False)
+    except subprocess.TimeoutExpired as e:
+        raise FFmpegError(f"ffprobe timed out: {e}")
+
+    if result.returncode != 0:
+        raise FFmpegError(
+            "ffprobe failed",
+            returncode=result.returncode,
+            stderr=result.stderr.decode("utf-8", errors="replace")
+        )
+
+    try:
+        return json.loads(result.stdout)
+    except json.JSONDecodeError as e:
+        raise FFmpegError(f"Failed to parse ffprobe output: {e}")
+
+
+def _probe(file_path: Path) -> dict:
+    """Probe ``file_path`` through the (path, mtime, size) keyed cache."""
+    try:
+        st = os.stat(file_path)
+    except OSError as e:
+        raise FFmpegError(f"Cannot probe {file_path}", stderr=str(e))
+    return _probe_cached(str(file_path), st.st_mtime_ns, st.st_size)
+
+
 def get_audio_info(file_path: Path) -> dict:
     """
     Get audio stream information from a file using ffprobe.
@@ -66,74 +205,126 @@ def get_audio_info(file_path: Path) -> dict:
     Returns:
         Dictionary with sample_rate, channels, codec, duration
     """
-    cmd = [
-        "ffprobe",
-        "-v", "error",
-        "-select_streams", "a:0",
-        "-show_entries", "stream=sample_rate,channels,codec_name",
-        "-show_entries", "format=duration",
-        "-of", "json",
-        str(file_path)
-    ]
-
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='replace',
-            timeout=60
-        )
-
-        if result.returncode != 0:
-            logger.debug(f"ffprobe error: {result.stderr}")
-            return {}
+        data = _probe(file_path)
+    except FileNotFoundError as e:
+        logger.debug(f"Failed to get audio info: {e}")
+        return {}
+    except FFmpegError as e:
+        logger.debug(f"ffprobe error: {e}")
+        return {}
 
-        data = json.loads(result.stdout)
-        info = {}
+    info = {}
 
-        if data.get("streams") and len(data["streams"]) > 0:
-            stream = data["streams"][0]
+    for stream in data.get("streams") or ():
+        if stream.get("codec_type", "audio") == "audio":
             info["sample_rate"] = int(stream.get("sample_rate", 44100))
             info["channels"] = int(stream.get("channels", 2))
             info["codec"] = stream.get("codec_name", "unknown")
+            break
 
-        if data.get("format"):
-            info["duration"] = float(data["format"].get("duration", 0))
+    if data.get("format"):
+        info["duration"] = float(data["format"].get("duration", 0))
 
-        return info
+    return info
 
-    except (FileNotFoundError, json.JSONDecodeError, subprocess.TimeoutExpired) as e:
-        logger.debug(f"Failed to get audio info: {e}")
-        return {}
 
+# stderr lines kept from a long-running ffmpeg for the error message
+_STDERR_TAIL_LINES = 200
 
-def extract_audio(
-    video_path: Path,
-    output_path: Path,
-    sample_rate: Optional[int] = None
-) -> Path:
-    """
-    Extract audio from video file to WAV format.
 
-    Args:
-        video_path: Path to input video file
-        output_path: Path for output WAV file
-        sample_rate: Optional sample rate (None preserves original)
+def _feed_stdin(pipe, data) -> None:
+    """Write ``data`` to ``pipe`` and close it; a vanished reader is not an error."""
+    try:
+        pipe.write(data)
+    except OSError:
+        pass  # ffmpeg exited early (its stderr says why)
+    finally:
+        try:
+            pipe.close()
+        except OSError:
+            pass
+
+
+def _run_ffmpeg_nonblocking(
+    cmd: List[str],
+    timeout: float,
+    input=None
+) -> Tuple[int, str]:
+    """Run a long ffmpeg job while a daemon thread drains its stderr.
+
+    The reader keeps only the last ``_STDERR_TAIL_LINES`` raw lines, so
+    ffmpeg never stalls on a full stderr pipe and memory stays bounded
+    over hour-long encodes. Nothing is decoded unless the job fails.
+    ``input`` (bytes-like) is written to ffmpeg's stdin from a second
+    thread, so neither side can deadlock on a full pipe.
 
     Returns:
-        Path to the extracted audio file
+        ``(returncode, stderr_tail)``; ``stderr_tail`` is ``""`` on success.
 
     Raises:
-        FFmpegError: If extraction fails
+        subprocess.TimeoutExpired: If ffmpeg runs longer than ``timeout``
+            (the process is killed first)
+        FileNotFoundError: If ffmpeg is not installed
     """
-    logger.debug(f"Extracting audio from {video_path}")
+    proc = subprocess.Popen(
+        [_executable(cmd[0]), "-nostats", *cmd[1:]],
+        stdin=subprocess.PIPE if input is not None else None,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE
+    )
+    tail: deque = deque(maxlen=_STDERR_TAIL_LINES)
+    reader = threading.Thread(target=tail.extend, args=(proc.stderr,), daemon=True)
+    reader.start()
+    writer = None
+    if input is not None:
+        writer = threading.Thread(target=_feed_stdin, args=(proc.stdin, input), daemon=True)
+        writer.start()
+
+    try:
+        returncode = proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        reader.join()
+        if writer is not None:
+            writer.join()
+        proc.stderr.close()
+
+    if returncode == 0:
+        return 0, ""
+    return returncode, b"".join(tail).decode("utf-8", errors="replace")
+
+
+def _seek_args(start: Optional[float], duration: Optional[float]) -> List[str]:
+    """Input options reading only ``[start, start + duration)`` of the next input.
+
+    ``-ss`` before ``-i`` seeks through the container index instead of
+    decoding from the beginning; ``None`` leaves that end open.
+    """
+    args = []
+    if start:
+        args += ["-ss", f"{start:.6f}"]
+    if duration is not None:
+        args += ["-t", f"{duration:.6f}"]
+    return args
+
 
+def _extract_audio_cmd(
+    video_path: Path,
+    output_path: Path,
+    sample_rate: Optional[int],
+    start: Optional[float] = None,
+    duration: Optional[float] = None
+) -> List[str]:
+    """Build the ffmpeg command for :func:`extract_audio`."""
     cmd = [
         "ffmpeg",
         "-hide_banner",
         "-y",  # Overwrite output
+        *_seek_args(start, duration),
         "-i", str(video_path),
         "-vn",  # No video
         "-acodec", "pcm_s16le",  # 16-bit PCM for WAV
@@ -143,22 +334,44 @@ def extract_audio(
         cmd.extend(["-ar", str(sample_rate)])
 
     cmd.append(str(output_path))
+    return cmd
+
+
+def extract_audio(
+    video_path: Path,
+    output_path: Path,
+    sample_rate: Optional[int] = None,
+    start: Optional[float] = None,
+    duration: Optional[float] = None
+) -> Path:
+    """
+    Extract audio from video file to WAV format.
+
+    Args:
+        video_path: Path to input video file
+        output_path: Path for output WAV file
+        sample_rate: Optional sample rate (None preserves original)
+        start: Seconds into the video to start at (None = beginning)
+        duration: Seconds to extract from ``start`` (None = to the end)
+
+    Returns:
+        Path to the extracted audio file
+
+    Raises:
+        FFmpegError: If extraction fails
+    """
+    logger.debug(f"Extracting audio from {video_path}")
+
+    cmd = _extract_audio_cmd(video_path, output_path, sample_rate, start, duration)
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='replace',  # Replace invalid characters instead of crashing
-            timeout=3600  # 1 hour timeout
-        )
+        returncode, stderr = _run_ffmpeg_nonblocking(cmd, timeout=3600)  # 1 hour timeout
 
-        if result.returncode != 0:
+        if returncode != 0:
             raise FFmpegError(
                 "Audio extraction failed",
-                returncode=result.returncode,
-                stderr=result.stderr
+                returncode=returncode,
+                stderr=stderr
             )
 
         logger.debug(f"Audio extracted to {output_path}")
@@ -170,11 +383,12 @@ def extract_audio(
         raise PrerequisiteError("FFmpeg not found in system PATH")
 
 
+@functools.lru_cache(maxsize=1)
 def check_nvenc_available() -> bool:
-    """Check if NVIDIA NVENC encoder is available."""
+    """Check if NVIDIA NVENC encoder is available (probed once per process)."""
     try:
         result = subprocess.run(
-            ["ffmpeg", "-hide_banner", "-encoders"],
+            _FFMPEG_ENCODERS_CMD,
             capture_output=True,
             text=True,
             encoding='utf-8',
@@ -186,10 +400,11 @@ def check_nvenc_available() -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=1)
 def check_cuda_filters_available() -> bool:
     """Check if the full-CUDA video pipeline is supported by this build.
 
-    Requires the cuda hwaccel and the three filters used by
+    Probed once per process. Requires the cuda hwaccel and the three filters used by
     :func:`ffmpeg_overlay.build_cuda_filter_graph` —
     ``scale_cuda``, ``overlay_cuda``, ``hwupload_cuda``. If anything is
     missing, return ``False`` and the caller falls back to the CPU
@@ -197,7 +412,7 @@ def check_cuda_filters_available() -> bool:
     """
     try:
         filters = subprocess.run(
-            ["ffmpeg", "-hide_banner", "-filters"],
+            _FFMPEG_FILTERS_CMD,
             capture_output=True,
             text=True,
             encoding="utf-8",
@@ -208,7 +423,7 @@ def check_cuda_filters_available() -> bool:
             if needed not in filters.stdout:
                 return False
         hwaccels = subprocess.run(
-            ["ffmpeg", "-hide_banner", "-hwaccels"],
+            _FFMPEG_HWACCELS_CMD,
             capture_output=True,
             text=True,
             encoding="utf-8",
@@ -226,34 +441,183 @@ def check_cuda_filters_available() -> bool:
         return False
 
 
-def remux_video(
+# Linux fcntl command to resize a pipe (not exported by the fcntl module)
+_F_SETPIPE_SZ = 1031
+_PIPE_SIZE = 1 << 20
+
+
+def extract_audio_array(
     video_path: Path,
-    audio_path: Path,
-    output_path: Path,
-    audio_bitrate: str = "192k",
-    watermark: bool = False
-) -> Path:
+    sample_rate: int = 44100,
+    channels: int = 2,
+    start: Optional[float] = None,
+    duration: Optional[float] = None
+) -> "np.ndarray":
     """
-    Remux video with new audio track.
+    Decode a video's audio straight into memory, with no intermediate WAV.
 
-    The video stream is copied losslessly (unless watermark is enabled),
-    and the audio is encoded as AAC.
+    ffmpeg resamples/downmixes to ``sample_rate``/``channels`` and writes
+    raw s16le PCM (half the bytes of float32) through a 1 MiB pipe.
 
     Args:
-        video_path: Path to original video (for video stream)
-        audio_path: Path to new audio file
-        output_path: Path for output video
-        audio_bitrate: Audio bitrate for AAC encoding
-        watermark: Add visual modifications to help avoid Content ID
+        video_path: Path to input video file
+        sample_rate: Output sample rate
+        channels: Output channel count
+        start: Seconds into the video to start at (None = beginning)
+        duration: Seconds to extract from ``start`` (None = to the end)
 
     Returns:
-        Path to the remuxed video
+        ``(channels, samples)`` int16 array (a transposed view of the
+        interleaved PCM; :func:`separate_vocals` converts it to float)
 
     Raises:
-        FFmpegError: If remuxing fails
+        FFmpegError: If extraction fails
     """
-    logger.debug(f"Remuxing video with new audio (watermark={watermark})")
+    import numpy as np
+
+    logger.debug(f"Extracting audio from {video_path} into memory")
+
+    cmd = [
+        _executable("ffmpeg"),
+        "-hide_banner",
+        "-loglevel", "error",
+        "-nostats",
+        *_seek_args(start, duration),
+        "-i", str(video_path),
+        "-vn",  # No video
+        "-ac", str(channels),
+        "-ar", str(sample_rate),
+        "-f", "s16le",
+        "pipe:1",
+    ]
+
+    try:
+        proc = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=_PIPE_SIZE
+        )
+    except FileNotFoundError:
+        raise PrerequisiteError("FFmpeg not found in system PATH")
+
+    try:
+        import fcntl
+        fcntl.fcntl(proc.stdout.fileno(), _F_SETPIPE_SZ, _PIPE_SIZE)
+    except (ImportError, OSError):
+        pass  # Not Linux, or above /proc/sys/fs/pipe-max-size: keep the default
+
+    tail: deque = deque(maxlen=_STDERR_TAIL_LINES)
+    reader = threading.Thread(target=tail.extend, args=(proc.stderr,), daemon=True)
+    reader.start()
+    timed_out = threading.Event()
+
+    def _expire() -> None:
+        timed_out.set()
+        proc.kill()
+
+    killer = threading.Timer(3600, _expire)
+    killer.start()
+    try:
+        pcm = proc.stdout.read()
+        returncode = proc.wait()
+    finally:
+        killer.cancel()
+        reader.join()
+        proc.stdout.close()
+        proc.stderr.close()
+
+    if timed_out.is_set():
+        raise FFmpegError("Audio extraction timed out after 1 hour")
+    if returncode != 0:
+        raise FFmpegError(
+            "Audio extraction failed",
+            returncode=returncode,
+            stderr=b"".join(tail).decode("utf-8", errors="replace")
+        )
+
+    # s16le is interleaved (samples, channels); .T is channels-first, no copy
+    return np.frombuffer(pcm, dtype="<i2").reshape(-1, channels).T
+
+
+def _h264_codec_args(use_nvenc: bool) -> List[str]:
+    """H.264 encoder options: NVENC when available, otherwise libx264."""
+    if use_nvenc:
+        logger.debug("Using NVENC (GPU) for video encoding")
+        return [
+            "-c:v", "h264_nvenc",    # NVIDIA GPU encoder
+            "-preset", "p4",          # Balanced speed/quality (p1=fastest, p7=best)
+            "-cq", "18",              # Constant quality mode (similar to CRF)
+            "-b:v", "0",              # Let CQ control quality
+        ]
+    logger.debug("NVENC not available, using CPU encoding")
+    return [
+        "-c:v", "libx264",        # CPU encoder
+        "-preset", "fast",        # Fast encoding preset
+        "-crf", "18",             # High quality
+    ]
+
+
+# Watermark black flashes: _FLASH_LENGTH seconds at the start of every
+# _FLASH_PERIOD seconds of (sped-up) output
+_FLASH_PERIOD = 5.0
+_FLASH_LENGTH = 0.15
+_WATERMARK_SPEED = 1.05
+
+
+def _write_flash_commands(video_path: Path, output_path: Path) -> Optional[Path]:
+    """Write a ``sendcmd`` script that switches drawbox on for each black flash.
+
+    drawbox then idles with ``enable=0`` and is toggled at the listed times
+    instead of evaluating a timeline expression on every frame. Returns
+    ``None`` if the duration is unknown (callers keep the expression).
+    """
+    try:
+        duration = get_video_duration(video_path) / _WATERMARK_SPEED
+    except (FFmpegError, PrerequisiteError) as e:
+        logger.debug(f"Duration unavailable, using drawbox enable expression: {e}")
+        return None
+
+    lines = []
+    for k in range(int(duration // _FLASH_PERIOD) + 1):
+        start = k * _FLASH_PERIOD
+        lines.append(
+            f"{start:.3f}-{start + _FLASH_LENGTH:.3f} "
+            "[enter] drawbox enable 1, [leave] drawbox enable 0;\n"
+        )
+
+    commands_path = output_path.parent / f"{output_path.stem}_flash.cmd"
+    commands_path.write_text("".join(lines), encoding="utf-8")
+    return commands_path
+
+
+def _flash_filter(flash_commands: Optional[Path]) -> str:
+    """drawbox clause for the black flashes, driven by sendcmd when possible."""
+    if flash_commands is None:
+        return (
+            f"drawbox=enable='lt(mod(t,{_FLASH_PERIOD:g}),{_FLASH_LENGTH:g})'"
+            ":c=black:t=fill"
+        )
+    # Forward slashes + single quotes keep drive-letter colons out of the
+    # filter option parser (same treatment as the overlay subtitles path)
+    escaped = flash_commands.as_posix().replace("'", r"'\''")
+    return f"sendcmd=f='{escaped}',drawbox=enable=0:c=black:t=fill"
+
 
+def _remux_cmd(
+    video_path: Path,
+    audio_input: str,
+    output_path: Path,
+    audio_bitrate: str,
+    watermark: bool,
+    flash_commands: Optional[Path] = None,
+    input_seek: Sequence[str] = (),
+    audio_input_args: Sequence[str] = (),
+    cuda_filters: bool = True
+) -> List[str]:
+    """Build the ffmpeg command for :func:`remux_video`.
+
+    ``input_seek`` (from :func:`_seek_args`) applies to the video input only;
+    ``audio_input_args`` describe a raw audio input (format, rate, channels).
+    ``cuda_filters=False`` forces the CPU watermark graph.
+    """
     if watermark:
         # Apply aggressive transformations to evade Content ID:
         # 1. Speed change (1.05x) - changes temporal fingerprint
@@ -261,47 +625,56 @@ def remux_video(
         # 3. Frequent black frames - breaks continuous matching
         # 4. Color adjustment
         
-        video_filter = (
-            # Speed up video by 5%
-            "setpts=PTS/1.05,"
-            # Scale down to 75% for larger border
-            "scale=iw*0.75:ih*0.75,"
-            # Add padding (colored border)
-            "pad=iw/0.75:ih/0.75:(ow-iw)/2:(oh-ih)/2:color=#1a1a2e,"
+        cpu_filters = (
+            # Add padding (colored border); sizes evaluated once
+            "pad=iw/0.75:ih/0.75:(ow-iw)/2:(oh-ih)/2:color=#1a1a2e:eval=init,"
             # Color adjustments
             "eq=brightness=0.04:saturation=1.08,"
             "hue=h=8,"
             # Insert black frame every 5 seconds (more frequent)
-            "drawbox=enable='lt(mod(t,5),0.15)':c=black:t=fill"
+            f"{_flash_filter(flash_commands)}"
         )
-        
+
         # Audio filter to match video speed (pitch correction)
         audio_filter = "atempo=1.05"
-        
+
         # Check if NVENC (GPU encoding) is available
         use_nvenc = check_nvenc_available()
-        if use_nvenc:
-            logger.debug("Using NVENC (GPU) for video encoding")
-            video_codec_args = [
-                "-c:v", "h264_nvenc",    # NVIDIA GPU encoder
-                "-preset", "p4",          # Balanced speed/quality (p1=fastest, p7=best)
-                "-cq", "18",              # Constant quality mode (similar to CRF)
-                "-b:v", "0",              # Let CQ control quality
-            ]
+        use_cuda_filters = cuda_filters and use_nvenc and check_cuda_filters_available()
+        if use_cuda_filters:
+            # Decode and downscale on the GPU. pad/eq/hue/drawbox have no CUDA
+            # versions, so only the already-shrunk frames cross to the CPU and
+            # go back up for NVENC.
+            logger.debug("Using CUDA decode + scale_cuda for watermark filters")
+            input_args = ["-hwaccel", "cuda", "-hwaccel_output_format", "cuda"]
+            video_filter = (
+                "setpts=PTS/1.05,"
+                "scale_cuda=iw*0.75:ih*0.75:format=nv12,"
+                "hwdownload,format=nv12,"
+                f"{cpu_filters},"
+                "hwupload_cuda"
+            )
         else:
-            logger.debug("NVENC not available, using CPU encoding")
-            video_codec_args = [
-                "-c:v", "libx264",        # CPU encoder
-                "-preset", "fast",        # Fast encoding preset
-                "-crf", "18",             # High quality
-            ]
+            input_args = []
+            video_filter = (
+                # Speed up video by 5%
+                "setpts=PTS/1.05,"
+                # Scale down to 75% for larger border
+                "scale=w=iw*0.75:h=ih*0.75:eval=init,"
+                f"{cpu_filters}"
+            )
+
+        video_codec_args = _h264_codec_args(use_nvenc)
         
         cmd = [
             "ffmpeg",
             "-hide_banner",
             "-y",  # Overwrite output
+            *input_args,             # GPU decode (applies to input 0 only)
+            *input_seek,
             "-i", str(video_path),   # Input 0: original video
-            "-i", str(audio_path),   # Input 1: new audio
+            *audio_input_args,
+            "-i", audio_input,       # Input 1: new audio
             "-filter_complex", f"[0:v:0]{video_filter}[v];[1:a]{audio_filter}[a]",
             "-map", "[v]",           # Map filtered video
             "-map", "[a]",           # Map filtered audio
@@ -316,8 +689,10 @@ def remux_video(
             "ffmpeg",
             "-hide_banner",
             "-y",  # Overwrite output
+            *input_seek,
             "-i", str(video_path),   # Input 0: original video
-            "-i", str(audio_path),   # Input 1: new audio
+            *audio_input_args,
+            "-i", audio_input,       # Input 1: new audio
             "-map", "0:v:0",         # Map FIRST video stream only (avoid thumbnail/cover art)
             "-map", "1:a",           # Map audio from input 1
             "-c:v", "copy",          # Copy video losslessly
@@ -326,150 +701,426 @@ def remux_video(
             str(output_path)
         ]
 
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='replace',  # Replace invalid characters instead of crashing
-            timeout=3600  # 1 hour timeout
-        )
+    return cmd
 
-        if result.returncode != 0:
-            raise FFmpegError(
-                "Video remuxing failed",
-                returncode=result.returncode,
-                stderr=result.stderr
-            )
 
-        logger.debug(f"Video remuxed to {output_path}")
-        return output_path
+def _run_remux(build_cmd: Callable[[bool], List[str]], input=None) -> Tuple[int, str]:
+    """Run a remux built by ``build_cmd(cuda_filters)``.
 
-    except subprocess.TimeoutExpired:
-        raise FFmpegError("Video remuxing timed out after 1 hour")
-    except FileNotFoundError:
-        raise PrerequisiteError("FFmpeg not found in system PATH")
+    NVDEC can't decode every codec (AV1, or VP9 on older GPUs); ffmpeg then
+    hands scale_cuda software frames and the CUDA watermark graph fails. In
+    that case the job is rerun once with the CPU filter graph.
+    """
+    cmd = build_cmd(True)
+    returncode, stderr = _run_ffmpeg_nonblocking(cmd, timeout=3600, input=input)  # 1 hour timeout
+    if returncode != 0 and "-hwaccel" in cmd:
+        logger.warning("CUDA watermark filters failed; retrying with CPU filters")
+        logger.debug(f"CUDA remux stderr: {stderr}")
+        returncode, stderr = _run_ffmpeg_nonblocking(build_cmd(False), timeout=3600, input=input)
+    return returncode, stderr
 
 
-def get_video_duration(video_path: Path) -> float:
+def remux_video(
+    video_path: Path,
+    audio_path: Path,
+    output_path: Path,
+    audio_bitrate: str = "192k",
+    watermark: bool = False,
+    start: Optional[float] = None,
+    duration: Optional[float] = None
+) -> Path:
     """
-    Get the duration of a video file in seconds.
+    Remux video with new audio track.
+
+    The video stream is copied losslessly (unless watermark is enabled),
+    and the audio is encoded as AAC. With ``start``/``duration`` only that
+    window of the video is used; for a stream copy ``start`` should be a
+    keyframe (see :func:`plan_chunk_windows`).
 
     Args:
-        video_path: Path to the video file
+        video_path: Path to original video (for video stream)
+        audio_path: Path to new audio file
+        output_path: Path for output video
+        audio_bitrate: Audio bitrate for AAC encoding
+        watermark: Add visual modifications to help avoid Content ID
+        start: Seconds into the video to start at (None = beginning)
+        duration: Seconds of video to use from ``start`` (None = to the end)
 
     Returns:
-        Duration in seconds
+        Path to the remuxed video
 
     Raises:
-        FFmpegError: If duration cannot be determined
+        FFmpegError: If remuxing fails
     """
-    cmd = [
-        "ffprobe",
-        "-v", "error",
-        "-show_entries", "format=duration",
-        "-of", "json",
-        str(video_path)
-    ]
+    logger.debug(f"Remuxing video with new audio (watermark={watermark})")
 
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=30
+    flash_commands = _write_flash_commands(video_path, output_path) if watermark else None
+
+    def build_cmd(cuda_filters: bool) -> List[str]:
+        return _remux_cmd(
+            video_path, str(audio_path), output_path, audio_bitrate, watermark, flash_commands,
+            input_seek=_seek_args(start, duration), cuda_filters=cuda_filters
         )
 
-        if result.returncode != 0:
+    try:
+        returncode, stderr = _run_remux(build_cmd)
+
+        if returncode != 0:
             raise FFmpegError(
-                "Failed to get video duration",
-                returncode=result.returncode,
-                stderr=result.stderr
+                "Video remuxing failed",
+                returncode=returncode,
+                stderr=stderr
             )
 
-        data = json.loads(result.stdout)
-        if data.get("format") and "duration" in data["format"]:
-            return float(data["format"]["duration"])
-        else:
-            raise FFmpegError("Duration not found in ffprobe output")
+        logger.debug(f"Video remuxed to {output_path}")
+        return output_path
 
-    except (json.JSONDecodeError, subprocess.TimeoutExpired) as e:
-        raise FFmpegError(f"Failed to parse video duration: {e}")
+    except subprocess.TimeoutExpired:
+        raise FFmpegError("Video remuxing timed out after 1 hour")
     except FileNotFoundError:
         raise PrerequisiteError("FFmpeg not found in system PATH")
+    finally:
+        if flash_commands is not None:
+            flash_commands.unlink(missing_ok=True)
 
 
-def split_video(
+def remux_video_array(
     video_path: Path,
-    output_dir: Path,
-    chunk_duration: int = 900  # 15 minutes in seconds
-) -> List[Path]:
+    audio: "np.ndarray",
+    sample_rate: int,
+    output_path: Path,
+    audio_bitrate: str = "192k",
+    watermark: bool = False,
+    start: Optional[float] = None,
+    duration: Optional[float] = None
+) -> Path:
     """
-    Split a video file into chunks of specified duration.
+    Remux video with a new audio track held in memory.
 
-    Args:
-        video_path: Path to input video file
-        output_dir: Directory to save chunks
-        chunk_duration: Duration of each chunk in seconds (default: 900 = 15 minutes)
-
-    Returns:
-        List of paths to the video chunks
+    Like :func:`remux_video`, but the ``(channels, samples)`` int16 audio is
+    piped to ffmpeg as raw PCM instead of being written to a WAV first.
 
     Raises:
-        FFmpegError: If splitting fails
+        FFmpegError: If remuxing fails
     """
-    output_dir.mkdir(parents=True, exist_ok=True)
+    import numpy as np
 
-    # Get total duration to calculate number of chunks
-    total_duration = get_video_duration(video_path)
-    num_chunks = int(total_duration / chunk_duration) + 1
+    logger.debug(f"Remuxing video with in-memory audio (watermark={watermark})")
 
-    logger.info(f"Splitting video into {num_chunks} chunks of {chunk_duration}s each...")
+    channels = audio.shape[0]
+    # s16le is interleaved: (samples, channels) in C order
+    pcm = np.ascontiguousarray(audio.T, dtype="<i2")
 
-    chunk_paths = []
+    flash_commands = _write_flash_commands(video_path, output_path) if watermark else None
 
-    for i in range(num_chunks):
-        start_time = i * chunk_duration
-        chunk_path = output_dir / f"{video_path.stem}_chunk_{i:03d}.mp4"
+    def build_cmd(cuda_filters: bool) -> List[str]:
+        return _remux_cmd(
+            video_path, "pipe:0", output_path, audio_bitrate, watermark, flash_commands,
+            input_seek=_seek_args(start, duration),
+            audio_input_args=["-f", "s16le", "-ar", str(sample_rate), "-ac", str(channels)],
+            cuda_filters=cuda_filters
+        )
 
-        cmd = [
-            "ffmpeg",
-            "-hide_banner",
-            "-y",  # Overwrite output
-            "-ss", str(start_time),  # Start time
-            "-i", str(video_path),
-            "-t", str(chunk_duration),  # Duration
-            "-c", "copy",  # Copy without re-encoding (fast)
-            "-avoid_negative_ts", "make_zero",  # Fix timestamp issues
-            str(chunk_path)
-        ]
+    try:
+        returncode, stderr = _run_remux(build_cmd, input=memoryview(pcm).cast("B"))
+    except subprocess.TimeoutExpired:
+        raise FFmpegError("Video remuxing timed out after 1 hour")
+    except FileNotFoundError:
+        raise PrerequisiteError("FFmpeg not found in system PATH")
+    finally:
+        if flash_commands is not None:
+            flash_commands.unlink(missing_ok=True)
+
+    if returncode != 0:
+        raise FFmpegError(
+            "Video remuxing failed",
+            returncode=returncode,
+            stderr=stderr
+        )
 
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=600  # 10 minutes per chunk
+    logger.debug(f"Video remuxed to {output_path}")
+    return output_path
+
+
+def extract_filter_remux(
+    video_path: Path,
+    filter_spec: str,
+    output_path: Path,
+    audio_bitrate: str = "192k"
+) -> Path:
+    """
+    Filter a video's audio with an FFmpeg ``-af`` chain in a single pass.
+
+    Fused equivalent of extract_audio -> (filter) -> remux_video for filters
+    FFmpeg can express itself: the audio is decoded, filtered and encoded to
+    AAC in one process, with no intermediate WAV on disk. The video stream
+    is copied losslessly.
+
+    Args:
+        video_path: Path to input video file
+        filter_spec: FFmpeg audio filter graph, e.g. "highpass=f=120,lowpass=f=6000"
+        output_path: Path for output video
+        audio_bitrate: Audio bitrate for AAC encoding
+
+    Returns:
+        Path to the filtered video
+
+    Raises:
+        FFmpegError: If filtering fails
+    """
+    logger.debug(f"Filtering audio in one pass: {filter_spec}")
+
+    cmd = [
+        "ffmpeg",
+        "-hide_banner",
+        "-y",  # Overwrite output
+        "-i", str(video_path),
+        "-map", "0:v:0",         # Map FIRST video stream only (avoid thumbnail/cover art)
+        "-map", "0:a:0",
+        "-c:v", "copy",          # Copy video losslessly
+        "-af", filter_spec,
+        "-c:a", "aac",           # Encode audio as AAC
+        "-b:a", audio_bitrate,   # Audio bitrate
+        str(output_path)
+    ]
+
+    try:
+        returncode, stderr = _run_ffmpeg_nonblocking(cmd, timeout=3600)  # 1 hour timeout
+
+        if returncode != 0:
+            raise FFmpegError(
+                "Audio filtering failed",
+                returncode=returncode,
+                stderr=stderr
             )
 
-            if result.returncode != 0:
-                raise FFmpegError(
-                    f"Failed to create chunk {i}",
-                    returncode=result.returncode,
-                    stderr=result.stderr
-                )
+        logger.debug(f"Filtered video written to {output_path}")
+        return output_path
+
+    except subprocess.TimeoutExpired:
+        raise FFmpegError("Audio filtering timed out after 1 hour")
+    except FileNotFoundError:
+        raise PrerequisiteError("FFmpeg not found in system PATH")
+
+
+def get_video_duration(video_path: Path) -> float:
+    """
+    Get the duration of a video file in seconds.
+
+    Shares the cached ffprobe result with :func:`get_audio_info`.
+
+    Args:
+        video_path: Path to the video file
+
+    Returns:
+        Duration in seconds
+
+    Raises:
+        FFmpegError: If duration cannot be determined
+    """
+    try:
+        data = _probe(video_path)
+    except FileNotFoundError:
+        raise PrerequisiteError("FFmpeg not found in system PATH")
+    except FFmpegError as e:
+        raise FFmpegError(
+            "Failed to get video duration",
+            returncode=e.returncode,
+            stderr=e.details
+        )
+
+    return _duration_from_probe(data)
+
+
+def _duration_from_probe(data: dict) -> float:
+    """Pull ``format.duration`` out of parsed ffprobe JSON."""
+    if data.get("format") and "duration" in data["format"]:
+        try:
+            return float(data["format"]["duration"])
+        except (TypeError, ValueError) as e:
+            raise FFmpegError(f"Failed to parse video duration: {e}")
+    raise FFmpegError("Duration not found in ffprobe output")
+
+
+def _run_ffmpeg(
+    cmd: List[str],
+    timeout: float,
+    input: Optional[bytes] = None
+) -> Tuple[int, str]:
+    """Run an ffmpeg command that writes only to files.
+
+    stdout is discarded and stderr is kept as raw bytes (``-loglevel error
+    -nostats`` keeps it short), so nothing is decoded on the happy path.
+    ``input`` is fed to ffmpeg's stdin (for ``-i pipe:0``).
+
+    Returns:
+        ``(returncode, stderr)``; ``stderr`` is decoded only when the
+        command failed and is ``""`` otherwise.
+
+    Raises:
+        subprocess.TimeoutExpired: If ffmpeg runs longer than ``timeout``
+        FileNotFoundError: If ffmpeg is not installed
+    """
+    result = subprocess.run(
+        [_executable(cmd[0]), "-loglevel", "error", "-nostats", *cmd[1:]],
+        input=input,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        timeout=timeout,
+        close_fds=False  # posix_spawn-eligible; see _probe_cached
+    )
+    if result.returncode == 0:
+        return 0, ""
+    return result.returncode, result.stderr.decode("utf-8", errors="replace")
+
+
+def split_video(
+    video_path: Path,
+    output_dir: Path,
+    chunk_duration: int = 900  # 15 minutes in seconds
+) -> List[Path]:
+    """
+    Split a video file into chunks of specified duration.
+
+    Args:
+        video_path: Path to input video file
+        output_dir: Directory to save chunks
+        chunk_duration: Duration of each chunk in seconds (default: 900 = 15 minutes)
+
+    Returns:
+        List of paths to the video chunks
+
+    Raises:
+        FFmpegError: If splitting fails
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Stale chunks from an earlier run would be picked up by the glob below
+    chunk_glob = f"{video_path.stem}_chunk_*.mp4"
+    for stale in output_dir.glob(chunk_glob):
+        stale.unlink()
+
+    logger.info(f"Splitting video into chunks of {chunk_duration}s each...")
+
+    # One pass through the source with the segment muxer instead of one
+    # ffmpeg (and one demuxer open + seek) per chunk
+    cmd = [
+        "ffmpeg",
+        "-hide_banner",
+        "-y",  # Overwrite output
+        "-i", str(video_path),
+        "-c", "copy",  # Copy without re-encoding (fast)
+        "-f", "segment",
+        "-segment_time", str(chunk_duration),
+        "-reset_timestamps", "1",  # Each chunk starts at t=0
+        "-avoid_negative_ts", "make_zero",  # Fix timestamp issues
+        str(output_dir / f"{video_path.stem}_chunk_%03d.mp4")
+    ]
+
+    try:
+        returncode, stderr = _run_ffmpeg(cmd, timeout=3600)
+    except subprocess.TimeoutExpired:
+        raise FFmpegError("Video splitting timed out")
+    except FileNotFoundError:
+        raise PrerequisiteError("FFmpeg not found in system PATH")
 
-            chunk_paths.append(chunk_path)
-            logger.debug(f"Created chunk {i+1}/{num_chunks}: {chunk_path.name}")
+    if returncode != 0:
+        raise FFmpegError(
+            "Failed to split video into chunks",
+            returncode=returncode,
+            stderr=stderr
+        )
 
-        except subprocess.TimeoutExpired:
-            raise FFmpegError(f"Chunk {i} creation timed out")
+    chunk_paths = sorted(output_dir.glob(chunk_glob))
+    if not chunk_paths:
+        raise FFmpegError("Video splitting produced no chunks")
 
     logger.info(f"Successfully split video into {len(chunk_paths)} chunks")
     return chunk_paths
 
 
+def get_keyframe_times(video_path: Path) -> List[float]:
+    """
+    Keyframe timestamps of the first video stream, in seconds.
+
+    Reads packet headers only (nothing is decoded). Times are relative to the
+    container start, which is what input ``-ss`` expects.
+
+    Raises:
+        FFmpegError: If ffprobe fails
+    """
+    cmd = [
+        _executable("ffprobe"),
+        "-v", "error",
+        "-select_streams", "v:0",
+        "-show_entries", "packet=pts_time,flags",
+        "-show_entries", "format=start_time",
+        "-of", "csv",  # "packet,<pts>,<flags>" lines, then "format,<start>"
+        str(video_path),
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, timeout=600, close_fds=False)
+    except subprocess.TimeoutExpired as e:
+        raise FFmpegError(f"ffprobe timed out: {e}")
+    except FileNotFoundError:
+        raise PrerequisiteError("FFmpeg not found in system PATH")
+
+    if result.returncode != 0:
+        raise FFmpegError(
+            "Failed to read keyframes",
+            returncode=result.returncode,
+            stderr=result.stderr.decode("utf-8", errors="replace")
+        )
+
+    times = []
+    origin = 0.0
+    for line in result.stdout.decode("ascii", errors="replace").splitlines():
+        fields = line.split(",")
+        try:
+            if fields[0] == "packet" and len(fields) >= 3 and fields[2].startswith("K"):
+                times.append(float(fields[1]))
+            elif fields[0] == "format" and len(fields) >= 2:
+                origin = float(fields[1])
+        except ValueError:
+            continue  # N/A timestamps
+    return sorted(t - origin for t in times)
+
+
+def plan_chunk_windows(
+    video_path: Path,
+    chunk_duration: int = 900
+) -> List[Tuple[float, Optional[float]]]:
+    """
+    Split a video's timeline into ``(start, duration)`` windows at keyframes.
+
+    Like :func:`split_video`, each window starts on the first keyframe at
+    least ``chunk_duration`` seconds after the previous start, so a stream
+    copy of each window lines up exactly, but nothing is written to disk.
+    The last window's duration is None (to the end).
+
+    Raises:
+        FFmpegError: If the keyframes cannot be read
+    """
+    starts = [0.0]
+    for t in get_keyframe_times(video_path):
+        if t >= starts[-1] + chunk_duration:
+            starts.append(t)
+
+    windows: List[Tuple[float, Optional[float]]] = [
+        (start, end - start) for start, end in zip(starts, starts[1:])
+    ]
+    windows.append((starts[-1], None))
+    logger.info(f"Planned {len(windows)} chunks of about {chunk_duration}s each")
+    return windows
+
+
+def _concat_file_line(video_path: Path) -> str:
+    """One ``file`` directive for an FFmpeg concat list."""
+    # Use absolute paths and escape special characters
+    abs_path = str(video_path.resolve()).replace('\\', '/')
+    return f"file '{abs_path}'\n"
+
+
 def concatenate_videos(
     video_paths: List[Path],
     output_path: Path
@@ -492,69 +1143,286 @@ def concatenate_videos(
 
     logger.info(f"Concatenating {len(video_paths)} video chunks...")
 
-    # Create a temporary file list for FFmpeg concat demuxer
-    concat_list_path = output_path.parent / f"{output_path.stem}_concat_list.txt"
+    # Build the FFmpeg concat list in memory and feed it on stdin; no
+    # temporary list file to write, clean up, or leave behind on a kill
+    concat_list = "".join(_concat_file_line(p) for p in video_paths).encode("utf-8")
+
+    cmd = [
+        "ffmpeg",
+        "-hide_banner",
+        "-y",  # Overwrite output
+        "-f", "concat",  # Use concat demuxer
+        "-safe", "0",  # Allow absolute paths
+        "-protocol_whitelist", "file,pipe",  # List from stdin, entries from disk
+        "-i", "pipe:0",
+        "-c", "copy",  # Copy without re-encoding (fast)
+        str(output_path)
+    ]
+
+    try:
+        # 30 minutes timeout
+        returncode, stderr = _run_ffmpeg(cmd, timeout=1800, input=concat_list)
+    except subprocess.TimeoutExpired:
+        raise FFmpegError("Video concatenation timed out")
+    except FileNotFoundError:
+        raise PrerequisiteError("FFmpeg not found in system PATH")
+
+    if returncode != 0:
+        raise FFmpegError(
+            "Video concatenation failed",
+            returncode=returncode,
+            stderr=stderr
+        )
+
+    logger.info(f"Successfully concatenated videos to {output_path}")
+    return output_path
+
+
+def _extract_segment(
+    video_path: Path,
+    index: int,
+    start: float,
+    end: float,
+    segment_path: Path
+) -> Tuple[int, Path]:
+    """Copy ``[start, end)`` of ``video_path`` into ``segment_path`` (input seeking)."""
+    cmd = [
+        "ffmpeg",
+        "-hide_banner",
+        "-y",
+        # Jump via the container index to the keyframe before ``start``
+        # rather than scanning packets; stream copy cuts on keyframes anyway
+        "-fflags", "+fastseek",
+        "-noaccurate_seek",
+        "-ss", str(start),
+        "-i", str(video_path),
+        "-t", str(end - start),
+        "-c", "copy",  # Copy without re-encoding (fast)
+        "-avoid_negative_ts", "make_zero",
+        str(segment_path)
+    ]
+
+    returncode, stderr = _run_ffmpeg(cmd, timeout=600)
+
+    if returncode != 0:
+        raise FFmpegError(
+            f"Failed to extract segment {index}",
+            returncode=returncode,
+            stderr=stderr
+        )
+    return index, segment_path
+
+
+def _extract_segments_parallel(
+    video_path: Path,
+    ranges: List[Tuple[float, float]],
+    segment_paths: List[Path],
+    max_workers: Optional[int] = None
+) -> List[Path]:
+    """Run :func:`_extract_segment` for every range on a thread pool.
+
+    Threads are enough: the work happens in the ffmpeg subprocesses.
+    Returns the segment paths in range order.
+    """
+    if max_workers is None:
+        max_workers = min(8, os.cpu_count() or 1)
+
+    done: List[Tuple[int, Path]] = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_extract_segment, video_path, i, start, end, path)
+            for i, ((start, end), path) in enumerate(zip(ranges, segment_paths))
+        ]
+        for future in as_completed(futures):
+            done.append(future.result())
+
+    return [path for _, path in sorted(done)]
+
+
+def _concat_keep_ranges(
+    video_path: Path,
+    output_path: Path,
+    keep_ranges: List[Tuple[float, float]]
+) -> bool:
+    """Stream-copy ``keep_ranges`` of one file straight into ``output_path``.
+
+    The concat demuxer reads the source once per range using ``inpoint`` /
+    ``outpoint`` directives, so no intermediate segment files are written
+    and re-read. Returns ``False`` if ffmpeg rejects this for the input.
+    """
+    entry = _concat_file_line(video_path)
+    concat_list = "".join(
+        f"{entry}inpoint {start}\noutpoint {end}\n" for start, end in keep_ranges
+    ).encode("utf-8")
+
+    cmd = [
+        "ffmpeg",
+        "-hide_banner",
+        "-y",
+        "-f", "concat",
+        "-safe", "0",
+        "-protocol_whitelist", "file,pipe",
+        "-i", "pipe:0",
+        "-c", "copy",  # Copy without re-encoding (fast)
+        "-avoid_negative_ts", "make_zero",
+        str(output_path)
+    ]
 
     try:
-        # Write the file list in FFmpeg concat format
-        with open(concat_list_path, 'w', encoding='utf-8') as f:
-            for video_path in video_paths:
-                # Use absolute paths and escape special characters
-                abs_path = str(video_path.resolve()).replace('\\', '/')
-                f.write(f"file '{abs_path}'\n")
+        returncode, stderr = _run_ffmpeg(cmd, timeout=3600, input=concat_list)
+    except subprocess.TimeoutExpired:
+        raise FFmpegError("Segment removal timed out")
+    except FileNotFoundError:
+        raise PrerequisiteError("FFmpeg not found in system PATH")
+
+    if returncode != 0:
+        logger.debug(f"Concat-demuxer segment removal failed, using segment files: {stderr}")
+        return False
+    return True
+
+
+def _trim_concat_reencode(
+    video_path: Path,
+    output_path: Path,
+    keep_ranges: List[Tuple[float, float]],
+    audio_bitrate: str = "192k"
+) -> None:
+    """Cut ``keep_ranges`` with trim/atrim + concat filters in one re-encode."""
+    has_audio = any(
+        stream.get("codec_type") == "audio"
+        for stream in _probe(video_path).get("streams") or ()
+    )
+
+    parts = []
+    labels = []
+    for i, (start, end) in enumerate(keep_ranges):
+        parts.append(f"[0:v:0]trim=start={start}:end={end},setpts=PTS-STARTPTS[v{i}]")
+        labels.append(f"[v{i}]")
+        if has_audio:
+            parts.append(f"[0:a:0]atrim=start={start}:end={end},asetpts=PTS-STARTPTS[a{i}]")
+            labels.append(f"[a{i}]")
+    parts.append(
+        f"{''.join(labels)}concat=n={len(keep_ranges)}:v=1:a={int(has_audio)}"
+        + ("[v][a]" if has_audio else "[v]")
+    )
+
+    cmd = [
+        "ffmpeg",
+        "-hide_banner",
+        "-y",
+        "-i", str(video_path),
+        "-filter_complex", ";".join(parts),
+        "-map", "[v]",
+        *_h264_codec_args(check_nvenc_available()),
+    ]
+    if has_audio:
+        cmd.extend(["-map", "[a]", "-c:a", "aac", "-b:a", audio_bitrate])
+    cmd.append(str(output_path))
+
+    try:
+        returncode, stderr = _run_ffmpeg(cmd, timeout=3600)
+    except subprocess.TimeoutExpired:
+        raise FFmpegError("Segment removal timed out")
+    except FileNotFoundError:
+        raise PrerequisiteError("FFmpeg not found in system PATH")
 
+    if returncode != 0:
+        raise FFmpegError(
+            "Segment removal failed",
+            returncode=returncode,
+            stderr=stderr
+        )
+
+
+def _extract_and_concat_segments(
+    video_path: Path,
+    output_path: Path,
+    keep_ranges: List[Tuple[float, float]],
+    temp_dir: Optional[Path],
+    max_workers: Optional[int]
+) -> None:
+    """Copy each keep-range into a temp segment file, then concatenate them."""
+    # Use temp_dir or create one in the same directory as output
+    if temp_dir is None:
+        temp_dir = output_path.parent / "temp_segments"
+    temp_dir.mkdir(parents=True, exist_ok=True)
+
+    try:
+        # Extract every segment to keep in one ffmpeg run: a single input
+        # with one output per keep-range, so the source is opened and read
+        # once instead of once per segment. -ss/-t are output options here;
+        # with stream copy each output starts at the first keyframe in range.
+        segment_paths = []
         cmd = [
             "ffmpeg",
             "-hide_banner",
-            "-y",  # Overwrite output
-            "-f", "concat",  # Use concat demuxer
-            "-safe", "0",  # Allow absolute paths
-            "-i", str(concat_list_path),
-            "-c", "copy",  # Copy without re-encoding (fast)
-            str(output_path)
+            "-y",
+            "-i", str(video_path),
         ]
+        for i, (start, end) in enumerate(keep_ranges):
+            segment_path = temp_dir / f"segment_{i:03d}.mp4"
+            duration = end - start
 
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=1800  # 30 minutes timeout
-        )
+            logger.debug(f"Extracting segment {i+1}/{len(keep_ranges)}: {start:.2f}s - {end:.2f}s (duration: {duration:.2f}s)")
 
-        if result.returncode != 0:
-            raise FFmpegError(
-                "Video concatenation failed",
-                returncode=result.returncode,
-                stderr=result.stderr
-            )
+            cmd.extend([
+                "-ss", str(start),
+                "-t", str(duration),
+                "-c", "copy",  # Copy without re-encoding (fast)
+                "-avoid_negative_ts", "make_zero",
+                str(segment_path)
+            ])
+            segment_paths.append(segment_path)
 
-        logger.info(f"Successfully concatenated videos to {output_path}")
-        return output_path
+        returncode, stderr = _run_ffmpeg(cmd, timeout=3600)
+
+        if returncode != 0:
+            # Some inputs reject the multi-output form; fall back to one
+            # input-seeking ffmpeg per segment, run concurrently
+            logger.debug(f"Single-pass segment extraction failed, retrying per segment: {stderr}")
+            _extract_segments_parallel(video_path, keep_ranges, segment_paths, max_workers)
+
+        # Concatenate all kept segments
+        logger.info("Concatenating kept segments...")
+        concatenate_videos(segment_paths, output_path)
 
     except subprocess.TimeoutExpired:
-        raise FFmpegError("Video concatenation timed out")
-    except FileNotFoundError:
-        raise PrerequisiteError("FFmpeg not found in system PATH")
+        raise FFmpegError("Segment extraction timed out")
     finally:
-        # Clean up the temporary concat list file
-        if concat_list_path.exists():
-            concat_list_path.unlink()
+        # Clean up temporary segments
+        if temp_dir.exists():
+            import shutil
+            try:
+                shutil.rmtree(temp_dir)
+            except Exception as e:
+                logger.debug(f"Failed to clean up temp directory: {e}")
 
 
 def remove_segments(
     video_path: Path,
     output_path: Path,
     remove_ranges: List[Tuple[float, float]],
-    temp_dir: Optional[Path] = None
+    temp_dir: Optional[Path] = None,
+    max_workers: Optional[int] = None,
+    reencode: bool = False
 ) -> Path:
     """
-    Remove specific time ranges from a video by extracting and concatenating the segments to keep.
+    Remove specific time ranges from a video by concatenating the segments to keep.
+
+    By default one ffmpeg stream-copies the kept ranges through the concat
+    demuxer; if that fails, the ranges are extracted to temp files and
+    concatenated.
 
     Args:
         video_path: Path to input video file
         output_path: Path for output video
         remove_ranges: List of (start_time, end_time) tuples in seconds to remove
         temp_dir: Optional directory for temporary segment files
+        max_workers: Concurrent ffmpeg processes for the per-segment fallback
+            (default: min(8, CPU count))
+        reencode: Cut with trim/concat filters and re-encode in one pass
+            (frame-accurate, slower). By default streams are copied and
+            cuts land on keyframes.
 
     Returns:
         Path to the output video with segments removed
@@ -592,66 +1460,147 @@ def remove_segments(
 
     logger.info(f"Removing {len(remove_ranges)} segments, keeping {len(keep_ranges)} segments")
 
-    # Use temp_dir or create one in the same directory as output
-    if temp_dir is None:
-        temp_dir = output_path.parent / "temp_segments"
-    temp_dir.mkdir(parents=True, exist_ok=True)
+    if reencode:
+        _trim_concat_reencode(video_path, output_path, keep_ranges)
+    elif not _concat_keep_ranges(video_path, output_path, keep_ranges):
+        _extract_and_concat_segments(
+            video_path, output_path, keep_ranges, temp_dir, max_workers
+        )
+
+    # Calculate total removed duration
+    removed_duration = sum(end - start for start, end in remove_ranges)
+    final_duration = total_duration - removed_duration
+    logger.info(f"Removed {removed_duration:.1f}s of content. Final duration: {final_duration:.1f}s (was {total_duration:.1f}s)")
+
+    return output_path
+
 
+# Async variants: the same commands run on asyncio subprocesses, so callers
+# can overlap ffmpeg work with downloads or other probes via asyncio.gather
+# without dedicating a thread to each blocking subprocess.run.
+
+
+async def _run_async(
+    cmd: List[str],
+    timeout: float,
+    capture_stdout: bool = False
+) -> Tuple[int, bytes, bytes]:
+    """Run ``cmd`` on an asyncio subprocess and return (returncode, stdout, stderr).
+
+    stdout is discarded unless ``capture_stdout`` is set. On timeout the
+    process is killed and :class:`subprocess.TimeoutExpired` is raised, as
+    with :func:`subprocess.run`.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        _executable(cmd[0]),
+        *cmd[1:],
+        stdout=asyncio.subprocess.PIPE if capture_stdout else asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE
+    )
     try:
-        # Extract each segment to keep
-        segment_paths = []
-        for i, (start, end) in enumerate(keep_ranges):
-            segment_path = temp_dir / f"segment_{i:03d}.mp4"
-            duration = end - start
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return proc.returncode, stdout or b"", stderr or b""
 
-            logger.debug(f"Extracting segment {i+1}/{len(keep_ranges)}: {start:.2f}s - {end:.2f}s (duration: {duration:.2f}s)")
 
-            cmd = [
-                "ffmpeg",
-                "-hide_banner",
-                "-y",
-                "-ss", str(start),
-                "-i", str(video_path),
-                "-t", str(duration),
-                "-c", "copy",  # Copy without re-encoding (fast)
-                "-avoid_negative_ts", "make_zero",
-                str(segment_path)
-            ]
+async def extract_audio_async(
+    video_path: Path,
+    output_path: Path,
+    sample_rate: Optional[int] = None
+) -> Path:
+    """Async version of :func:`extract_audio`."""
+    logger.debug(f"Extracting audio from {video_path}")
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=600
-            )
+    cmd = _extract_audio_cmd(video_path, output_path, sample_rate)
 
-            if result.returncode != 0:
-                raise FFmpegError(
-                    f"Failed to extract segment {i}",
-                    returncode=result.returncode,
-                    stderr=result.stderr
-                )
+    try:
+        returncode, _, stderr = await _run_async(cmd, timeout=3600)
+    except subprocess.TimeoutExpired:
+        raise FFmpegError("Audio extraction timed out after 1 hour")
+    except FileNotFoundError:
+        raise PrerequisiteError("FFmpeg not found in system PATH")
 
-            segment_paths.append(segment_path)
+    if returncode != 0:
+        raise FFmpegError(
+            "Audio extraction failed",
+            returncode=returncode,
+            stderr=stderr.decode("utf-8", errors="replace")
+        )
 
-        # Concatenate all kept segments
-        logger.info("Concatenating kept segments...")
-        concatenate_videos(segment_paths, output_path)
+    logger.debug(f"Audio extracted to {output_path}")
+    return output_path
 
-        # Calculate total removed duration
-        removed_duration = sum(end - start for start, end in remove_ranges)
-        final_duration = total_duration - removed_duration
-        logger.info(f"Removed {removed_duration:.1f}s of content. Final duration: {final_duration:.1f}s (was {total_duration:.1f}s)")
 
-        return output_path
+async def remux_video_async(
+    video_path: Path,
+    audio_path: Path,
+    output_path: Path,
+    audio_bitrate: str = "192k",
+    watermark: bool = False
+) -> Path:
+    """Async version of :func:`remux_video` (file audio input only)."""
+    logger.debug(f"Remuxing video with new audio (watermark={watermark})")
+
+    flash_commands = _write_flash_commands(video_path, output_path) if watermark else None
 
+    def build_cmd(cuda_filters: bool) -> List[str]:
+        return _remux_cmd(
+            video_path, str(audio_path), output_path, audio_bitrate, watermark, flash_commands,
+            cuda_filters=cuda_filters
+        )
+
+    try:
+        cmd = build_cmd(True)
+        returncode, _, stderr = await _run_async(cmd, timeout=3600)
+        if returncode != 0 and "-hwaccel" in cmd:
+            # Same CPU-filter retry as _run_remux
+            logger.warning("CUDA watermark filters failed; retrying with CPU filters")
+            returncode, _, stderr = await _run_async(build_cmd(False), timeout=3600)
     except subprocess.TimeoutExpired:
-        raise FFmpegError("Segment extraction timed out")
+        raise FFmpegError("Video remuxing timed out after 1 hour")
+    except FileNotFoundError:
+        raise PrerequisiteError("FFmpeg not found in system PATH")
     finally:
-        # Clean up temporary segments
-        if temp_dir.exists():
-            import shutil
-            try:
-                shutil.rmtree(temp_dir)
-            except Exception as e:
-                logger.debug(f"Failed to clean up temp directory: {e}")
+        if flash_commands is not None:
+            flash_commands.unlink(missing_ok=True)
+
+    if returncode != 0:
+        raise FFmpegError(
+            "Video remuxing failed",
+            returncode=returncode,
+            stderr=stderr.decode("utf-8", errors="replace")
+        )
+
+    logger.debug(f"Video remuxed to {output_path}")
+    return output_path
+
+
+async def get_video_duration_async(video_path: Path) -> float:
+    """Async version of :func:`get_video_duration`.
+
+    Always runs ffprobe; the synchronous probe cache is not consulted.
+    """
+    try:
+        returncode, stdout, stderr = await _run_async(
+            _probe_cmd(str(video_path)), timeout=60, capture_stdout=True
+        )
+    except subprocess.TimeoutExpired as e:
+        raise FFmpegError(f"ffprobe timed out: {e}")
+    except FileNotFoundError:
+        raise PrerequisiteError("FFmpeg not found in system PATH")
+
+    if returncode != 0:
+        raise FFmpegError(
+            "Failed to get video duration",
+            returncode=returncode,
+            stderr=stderr.decode("utf-8", errors="replace")
+        )
+
+    try:
+        data = json.loads(stdout)
+    except json.JSONDecodeError as e:
+        raise FFmpegError(f"Failed to parse ffprobe output: {e}")
+    return _duration_from_probe(data)
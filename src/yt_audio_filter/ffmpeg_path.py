@@ -1,10 +1,11 @@
 """FFmpeg path management - auto-detect and configure bundled FFmpeg."""
 
+import functools
 import os
 import shutil
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from .logger import get_logger
 
@@ -13,36 +14,46 @@ logger = get_logger()
 # Cache for FFmpeg path to avoid repeated lookups
 _ffmpeg_path: Optional[Path] = None
 _setup_done: bool = False
+# Resolved executable paths; misses are not cached so a later install is seen
+_which_cache: Dict[str, Path] = {}
 
 
+# Get the package root directory (yt-audio-filter/)
+_PACKAGE_DIR = Path(__file__).parent.parent.parent
+
+# Common locations for bundled FFmpeg
+_BUNDLED_FFMPEG_DIRS = (
+    _PACKAGE_DIR / "ffmpeg-8.0.1-essentials_build" / "bin",
+    _PACKAGE_DIR / "ffmpeg-8.0.1-full_build" / "bin",
+    _PACKAGE_DIR / "ffmpeg" / "bin",
+    _PACKAGE_DIR / "bin",
+    # Also check one level up (in case package is installed differently)
+    _PACKAGE_DIR.parent / "ffmpeg-8.0.1-essentials_build" / "bin",
+    _PACKAGE_DIR.parent / "ffmpeg" / "bin",
+)
+
+# Windows or Unix executable name
+_FFMPEG_NAMES = frozenset({"ffmpeg.exe", "ffmpeg"})
+
+
+@functools.lru_cache(maxsize=1)
 def find_bundled_ffmpeg() -> Optional[Path]:
     """
     Find bundled FFmpeg installation relative to the package.
 
+    The result is cached; each candidate directory is listed once instead
+    of stat-ing both executable names.
+
     Returns:
         Path to FFmpeg bin directory if found, None otherwise
     """
-    # Get the package root directory (yt-audio-filter/)
-    package_dir = Path(__file__).parent.parent.parent
-
-    # Common locations for bundled FFmpeg
-    search_paths = [
-        package_dir / "ffmpeg-8.0.1-essentials_build" / "bin",
-        package_dir / "ffmpeg-8.0.1-full_build" / "bin",
-        package_dir / "ffmpeg" / "bin",
-        package_dir / "bin",
-        # Also check one level up (in case package is installed differently)
-        package_dir.parent / "ffmpeg-8.0.1-essentials_build" / "bin",
-        package_dir.parent / "ffmpeg" / "bin",
-    ]
-
-    for ffmpeg_dir in search_paths:
-        # Check for Windows executable
-        if (ffmpeg_dir / "ffmpeg.exe").exists():
-            return ffmpeg_dir
-        # Check for Unix executable
-        if (ffmpeg_dir / "ffmpeg").exists():
-            return ffmpeg_dir
+    for ffmpeg_dir in _BUNDLED_FFMPEG_DIRS:
+        try:
+            with os.scandir(ffmpeg_dir) as entries:
+                if any(entry.name in _FFMPEG_NAMES for entry in entries):
+                    return ffmpeg_dir
+        except OSError:
+            continue  # Missing or unreadable directory
 
     return None
 
@@ -59,14 +70,14 @@ def setup_ffmpeg_path() -> bool:
     """
     global _ffmpeg_path, _setup_done
 
+    # Only success is remembered; a miss is retried on the next call
     if _setup_done:
-        return _ffmpeg_path is not None or shutil.which("ffmpeg") is not None
-
-    _setup_done = True
+        return True
 
     # First check if FFmpeg is already in PATH
     if shutil.which("ffmpeg"):
         logger.debug("FFmpeg found in system PATH")
+        _setup_done = True
         return True
 
     # Try to find bundled FFmpeg
@@ -76,6 +87,7 @@ def setup_ffmpeg_path() -> bool:
         current_path = os.environ.get("PATH", "")
         os.environ["PATH"] = str(bundled_dir) + os.pathsep + current_path
         _ffmpeg_path = bundled_dir
+        _setup_done = True
         logger.debug(f"Added bundled FFmpeg to PATH: {bundled_dir}")
         return True
 
@@ -90,12 +102,7 @@ def get_ffmpeg_path() -> Optional[Path]:
     Returns:
         Path to ffmpeg executable, or None if not found
     """
-    setup_ffmpeg_path()
-
-    ffmpeg = shutil.which("ffmpeg")
-    if ffmpeg:
-        return Path(ffmpeg)
-    return None
+    return _which("ffmpeg")
 
 
 def get_ffprobe_path() -> Optional[Path]:
@@ -105,9 +112,17 @@ def get_ffprobe_path() -> Optional[Path]:
     Returns:
         Path to ffprobe executable, or None if not found
     """
-    setup_ffmpeg_path()
+    return _which("ffprobe")
 
-    ffprobe = shutil.which("ffprobe")
-    if ffprobe:
-        return Path(ffprobe)
-    return None
+
+def _which(name: str) -> Optional[Path]:
+    """Resolve an executable (after PATH setup), caching it once found."""
+    cached = _which_cache.get(name)
+    if cached is not None:
+        return cached
+    setup_ffmpeg_path()
+    found = shutil.which(name)
+    if found is None:
+        return None
+    _which_cache[name] = Path(found)
+    return _which_cache[name]
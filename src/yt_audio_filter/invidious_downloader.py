@@ -6,12 +6,20 @@ from GitHub: https://github.com/iv-org/invidious
 It has stable public API instances that bypass YouTube's bot detection.
 """
 
+import gzip
+import io
 import json
+import os
 import re
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from http.client import HTTPConnection, HTTPException, HTTPResponse, HTTPSConnection
 from pathlib import Path
-from typing import Optional
-from urllib.request import urlopen, Request
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+from urllib.request import Request, getproxies, urlopen
 from urllib.error import URLError, HTTPError
 
 from .exceptions import YouTubeDownloadError
@@ -19,7 +27,7 @@ from .logger import get_logger
 
 logger = get_logger()
 
-# Public Invidious API instances
+# Public Invidious API instances (no trailing slash; paths are appended directly)
 # Source: https://docs.invidious.io/instances/
 INVIDIOUS_API_URLS = [
     "https://inv.nadeko.net",             # Chile
@@ -31,6 +39,37 @@ INVIDIOUS_API_URLS = [
     "https://inv.tux.pizza",              # Finland
 ]
 
+# Request headers shared by every API probe and download (built once)
+_HEADERS = {"User-Agent": "yt-audio-filter/1.0"}
+
+# Per-socket-operation timeout for API calls; all instances are queried at
+# once, so a slow one no longer delays the others
+_API_TIMEOUT = 5
+
+# Idle keep-alive API connections per (scheme, host), at most
+# _MAX_IDLE_PER_HOST each; extras are closed instead of parked
+_idle_connections: Dict[Tuple[str, str], List[HTTPConnection]] = {}
+_pool_lock = threading.Lock()
+_MAX_IDLE_PER_HOST = 2
+
+# Redirects followed by _api_get (urlopen follows these too)
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+_MAX_REDIRECTS = 5
+
+# Bytes fetched per candidate when racing download sources, and how many
+# candidates are raced (the direct URL plus a couple of instance proxies;
+# probing every public instance is load they shouldn't have to carry)
+_PROBE_BYTES = 64 * 1024
+_MAX_PROBE_SOURCES = 3
+
+_CONTENT_RANGE_RE = re.compile(r"bytes (\d+)-")
+
+# copyfileobj buffer for the video body, and how often progress is logged
+_COPY_CHUNK = 4 * 1024 * 1024
+_PROGRESS_STEP = 10 * 1024 * 1024
+
+_VIDEO_ID_RE = re.compile(r"(?:v=|/v/|youtu\.be/|/embed/|/shorts/)([a-zA-Z0-9_-]{11})")
+
 
 @dataclass
 class InvidiousVideoMetadata:
@@ -42,16 +81,295 @@ class InvidiousVideoMetadata:
 
 def extract_video_id(url: str) -> str:
     """Extract YouTube video ID from URL."""
-    patterns = [
-        r"(?:v=|/v/|youtu\.be/|/embed/|/shorts/)([a-zA-Z0-9_-]{11})",
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
+    match = _VIDEO_ID_RE.search(url)
+    if match:
+        return match.group(1)
     raise ValueError(f"Could not extract video ID from URL: {url}")
 
 
+class _ProgressReader:
+    """File-like wrapper that counts bytes read and logs every ``_PROGRESS_STEP``.
+
+    Lets :func:`shutil.copyfileobj` drive the copy loop while progress is
+    still reported.
+    """
+
+    def __init__(self, raw, start: int, total: int):
+        self._raw = raw
+        self.count = start
+        self._total = total
+        self._next_log = start + _PROGRESS_STEP
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._raw.read(size)
+        self.count += len(data)
+        if self.count >= self._next_log:
+            self._next_log = self.count + _PROGRESS_STEP
+            if self._total > 0:
+                logger.debug("Download progress: %.1f%%", self.count / self._total * 100)
+        return data
+
+
+def _preallocate(f, size: int) -> bool:
+    """Reserve ``size`` bytes for ``f`` up front so the filesystem can lay the
+    file out in one go instead of extending it on every write.
+
+    Returns:
+        True if space was reserved (the caller must truncate on a short read)
+    """
+    try:
+        f.flush()
+        if hasattr(os, "posix_fallocate"):
+            os.posix_fallocate(f.fileno(), 0, size)
+        else:
+            # Windows: extending via truncate allocates the file length
+            f.truncate(size)
+    except OSError as e:
+        logger.debug("Preallocation skipped: %s", e)
+        return False
+    return True
+
+
+def _probe_range(
+    url: str, timeout: int, decided: Optional[threading.Event] = None
+) -> Tuple[str, bytes, bool]:
+    """Fetch the first ``_PROBE_BYTES`` of ``url``.
+
+    If ``decided`` is set by the time the server answers, another source has
+    already won; the response is closed without reading the body.
+
+    Returns:
+        (url, bytes read, whether the server honoured the Range header)
+    """
+    headers = {**_HEADERS, "Range": f"bytes=0-{_PROBE_BYTES - 1}"}
+    with urlopen(Request(url, headers=headers), timeout=timeout) as response:
+        if decided is not None and decided.is_set():
+            return url, b"", False
+        data = response.read(_PROBE_BYTES)
+        return url, data, response.status == 206
+
+
+def _candidate_sources(
+    download_url: str, video_id: str, itag: Optional[int], api_base: str
+) -> List[str]:
+    """Direct googlevideo URL first, then instance proxies for the same itag.
+
+    The instance that answered the API call is tried first among the proxies;
+    at most ``_MAX_PROBE_SOURCES`` URLs are returned.
+    """
+    urls = [download_url]
+    if itag:
+        apis = [api_base] + [api for api in INVIDIOUS_API_URLS if api != api_base]
+        urls += [f"{api}/latest_version?id={video_id}&itag={itag}&local=true" for api in apis]
+    return urls[:_MAX_PROBE_SOURCES]
+
+
+def _resumes_at(response, offset: int) -> bool:
+    """True if ``response`` is a 206 whose Content-Range starts at ``offset``."""
+    if response.status != 206:
+        return False
+    match = _CONTENT_RANGE_RE.match(response.headers.get("Content-Range", ""))
+    return match is not None and int(match.group(1)) == offset
+
+
+def _pick_fastest_source(urls: List[str], timeout: int) -> Tuple[str, bytes, bool]:
+    """Range-probe all candidate URLs concurrently and return the first to answer.
+
+    Raises:
+        YouTubeDownloadError: If every probe fails
+    """
+    executor = ThreadPoolExecutor(max_workers=len(urls))
+    decided = threading.Event()
+    try:
+        futures = [executor.submit(_probe_range, url, timeout, decided) for url in urls]
+        last_error: Optional[Exception] = None
+        for future in as_completed(futures):
+            try:
+                url, data, range_ok = future.result()
+            except Exception as e:
+                last_error = e
+                continue
+            if data:
+                return url, data, range_ok
+        raise YouTubeDownloadError(
+            "No download source responded",
+            f"All {len(urls)} candidate URLs failed the range probe: {last_error}",
+        )
+    finally:
+        # Don't wait for the losing probes; they close their responses unread
+        # (or time out) on their own
+        decided.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _connection(scheme: str, host: str, timeout: float) -> Tuple[HTTPConnection, bool]:
+    """Take an idle keep-alive connection for ``host`` or open a new one.
+
+    Returns:
+        (connection, whether it was reused from the pool)
+    """
+    with _pool_lock:
+        idle = _idle_connections.get((scheme, host))
+        conn = idle.pop() if idle else None
+    if conn is not None:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+    conn_cls = HTTPSConnection if scheme == "https" else HTTPConnection
+    return conn_cls(host, timeout=timeout), False
+
+
+def _release(scheme: str, host: str, conn: HTTPConnection) -> None:
+    with _pool_lock:
+        idle = _idle_connections.setdefault((scheme, host), [])
+        if len(idle) < _MAX_IDLE_PER_HOST:
+            idle.append(conn)
+            return
+    conn.close()
+
+
+def _api_get(url: str, timeout: float = _API_TIMEOUT) -> bytes:
+    """GET ``url`` over a pooled keep-alive connection, gzip-encoded.
+
+    Metadata and download lookups for the same video hit the same instances,
+    so later calls skip the TCP + TLS handshake. Redirects are followed; with
+    a proxy configured (``HTTP(S)_PROXY`` etc.) the request goes through
+    urlopen instead, since the pool connects to hosts directly.
+
+    Raises:
+        HTTPError: For non-200 responses (same as urlopen)
+        OSError / http.client.HTTPException: On connection failures
+    """
+    headers = {**_HEADERS, "Accept-Encoding": "gzip"}
+    if getproxies():
+        with urlopen(Request(url, headers=headers), timeout=timeout) as response:
+            body = response.read()
+            encoding = response.headers.get("Content-Encoding", "")
+    else:
+        for _ in range(_MAX_REDIRECTS + 1):
+            response, body = _pooled_get(url, headers, timeout)
+            location = response.getheader("Location")
+            if response.status not in _REDIRECT_STATUSES or not location:
+                break
+            url = urljoin(url, location)
+
+        if response.status != 200:
+            raise HTTPError(
+                url, response.status, response.reason, response.headers, io.BytesIO(body)
+            )
+        encoding = response.getheader("Content-Encoding", "")
+
+    if encoding.lower() == "gzip":
+        body = gzip.decompress(body)
+    return body
+
+
+def _pooled_get(url: str, headers: Dict[str, str], timeout: float) -> Tuple[HTTPResponse, bytes]:
+    """One GET on a pooled connection; returns the response and its body."""
+    parts = urlsplit(url)
+    path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+
+    while True:
+        conn, reused = _connection(parts.scheme, parts.netloc, timeout)
+        try:
+            conn.request("GET", path or "/", headers=headers)
+            response = conn.getresponse()
+            body = response.read()
+            break
+        except (HTTPException, OSError):
+            conn.close()
+            if not reused:
+                raise
+            # The server dropped the idle connection; retry on a fresh one
+
+    if response.will_close:
+        conn.close()
+    else:
+        _release(parts.scheme, parts.netloc, conn)
+    return response, body
+
+
+def _fetch_video_info(api_base: str, video_id: str) -> dict:
+    """GET ``/api/v1/videos/<id>`` from one Invidious instance."""
+    api_url = f"{api_base}/api/v1/videos/{video_id}"
+    logger.debug("Trying Invidious API: %s", api_url)
+    # json.loads detects UTF-8 in bytes itself; no intermediate str copy
+    return json.loads(_api_get(api_url))
+
+
+def _describe_api_error(api_base: str, e: Exception) -> str:
+    if isinstance(e, HTTPError):
+        error_body = ""
+        try:
+            error_body = e.read().decode("utf-8")
+        except Exception:
+            pass
+        return f"HTTP {e.code} from {api_base}: {error_body[:200]}"
+    if isinstance(e, URLError):
+        return f"Connection error to {api_base}: {e.reason}"
+    return f"Error with {api_base}: {e}"
+
+
+def _first_video_info(
+    video_id: str,
+    accept: Callable[[dict], bool],
+    warn: bool = True,
+) -> Tuple[Optional[dict], Optional[str], Optional[str]]:
+    """Query every Invidious instance at once; keep the first acceptable answer.
+
+    A dead instance now costs nothing extra instead of a full timeout before
+    the next one is tried.
+
+    Returns:
+        (video_info, api_base, last_error); the first two are None if no
+        instance returned an acceptable response
+    """
+    executor = ThreadPoolExecutor(max_workers=len(INVIDIOUS_API_URLS))
+    try:
+        futures = {
+            executor.submit(_fetch_video_info, api_base, video_id): api_base
+            for api_base in INVIDIOUS_API_URLS
+        }
+        last_error = None
+        for future in as_completed(futures):
+            api_base = futures[future]
+            try:
+                video_info = future.result()
+            except Exception as e:
+                last_error = _describe_api_error(api_base, e)
+                if warn:
+                    logger.warning(last_error)
+                continue
+            if video_info and accept(video_info):
+                return video_info, api_base, None
+        return None, None, last_error
+    finally:
+        # Losing requests finish (or time out) on their own
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _best_video_format(adaptive_formats: List[dict]) -> Optional[dict]:
+    """Highest-bitrate MP4 video format, else highest-bitrate video of any type.
+
+    Invidious lists video-only and audio-only formats together; one pass
+    splits them and max() picks the winner without sorting.
+    """
+    mp4_formats = []
+    other_video = []
+    for f in adaptive_formats:
+        mime = f.get("type", "")
+        if mime.startswith("video/mp4"):
+            mp4_formats.append(f)
+        elif "video" in mime:
+            other_video.append(f)
+
+    candidates = mp4_formats or other_video
+    if not candidates:
+        return None
+    return max(candidates, key=lambda f: f.get("bitrate", 0))
+
+
 def download_with_invidious(
     url: str,
     output_dir: Path,
@@ -77,48 +395,15 @@ def download_with_invidious(
 
     logger.info(f"Downloading {video_id} via Invidious API...")
 
-    video_info = None
-    last_error = None
-
-    # Try each Invidious API instance
-    for api_base in INVIDIOUS_API_URLS:
-        try:
-            # Get video info from Invidious
-            api_url = f"{api_base.rstrip('/')}/api/v1/videos/{video_id}"
-            logger.debug(f"Trying Invidious API: {api_url}")
-
-            req = Request(api_url, headers={"User-Agent": "yt-audio-filter/1.0"})
-
-            with urlopen(req, timeout=30) as response:
-                video_info = json.loads(response.read().decode("utf-8"))
-
-            if video_info and "adaptiveFormats" in video_info:
-                logger.info(f"Got video info from {api_base}")
-                break
-
-        except HTTPError as e:
-            error_body = ""
-            try:
-                error_body = e.read().decode("utf-8")
-            except:
-                pass
-            last_error = f"HTTP {e.code} from {api_base}: {error_body[:200]}"
-            logger.warning(last_error)
-            continue
-        except URLError as e:
-            last_error = f"Connection error to {api_base}: {e.reason}"
-            logger.warning(last_error)
-            continue
-        except Exception as e:
-            last_error = f"Error with {api_base}: {e}"
-            logger.warning(last_error)
-            continue
-
+    video_info, api_base, last_error = _first_video_info(
+        video_id, lambda info: "adaptiveFormats" in info
+    )
     if not video_info:
         raise YouTubeDownloadError(
             "Failed to get video info from Invidious",
             last_error or "All Invidious API instances failed"
         )
+    logger.info(f"Got video info from {api_base}")
 
     # Extract title and formats
     title = video_info.get("title", video_id)
@@ -130,54 +415,75 @@ def download_with_invidious(
             "Invidious returned empty format list"
         )
 
-    # Find best quality video format
-    # Invidious provides both video-only and audio-only formats
-    # We want a combined format if available, or highest quality video
-    video_formats = [f for f in adaptive_formats if f.get("type", "").startswith("video/mp4")]
-
-    if not video_formats:
-        # Try any video format
-        video_formats = [f for f in adaptive_formats if "video" in f.get("type", "")]
-
-    if not video_formats:
+    best_format = _best_video_format(adaptive_formats)
+    if best_format is None:
         raise YouTubeDownloadError("No suitable video format found")
 
-    # Sort by quality (bitrate) and pick highest
-    video_formats.sort(key=lambda f: f.get("bitrate", 0), reverse=True)
-    best_format = video_formats[0]
-
     download_url = best_format.get("url")
     if not download_url:
         raise YouTubeDownloadError("No download URL in Invidious response")
 
+    # Candidate sources: the direct googlevideo URL plus instance proxies
+    # for the same itag. Race small Range probes and download from whichever
+    # answers first, so a dead/slow source costs one probe instead of a
+    # full-length stalled download.
+    candidate_urls = _candidate_sources(
+        download_url, video_id, best_format.get("itag"), api_base
+    )
+
     logger.info(f"Downloading: {title}")
-    logger.debug(f"Quality: {best_format.get('qualityLabel', 'unknown')}, Bitrate: {best_format.get('bitrate', 0)}")
+    logger.debug(
+        "Quality: %s, Bitrate: %s",
+        best_format.get("qualityLabel", "unknown"),
+        best_format.get("bitrate", 0),
+    )
 
     # Download video
     output_path = output_dir / f"{video_id}.mp4"
 
     try:
+        source_url, head, range_ok = _pick_fastest_source(candidate_urls, timeout=30)
         logger.info("Downloading video...")
-        req = Request(download_url, headers={"User-Agent": "yt-audio-filter/1.0"})
-
-        with urlopen(req, timeout=timeout) as response:
-            total_size = int(response.headers.get("Content-Length", 0))
-            downloaded = 0
-            chunk_size = 1024 * 1024  # 1MB chunks
-
-            with open(output_path, "wb") as f:
-                while True:
-                    chunk = response.read(chunk_size)
-                    if not chunk:
-                        break
-                    f.write(chunk)
-                    downloaded += len(chunk)
-
-                    if total_size > 0 and downloaded % (10 * chunk_size) == 0:
-                        percent = (downloaded / total_size) * 100
-                        logger.debug(f"Download progress: {percent:.1f}%")
-
-        logger.info(f"Downloaded: {output_path.name} ({output_path.stat().st_size / 1024 / 1024:.1f} MB)")
+        logger.debug("Selected download source: %s", source_url)
+
+        if not range_ok:
+            # Server ignored the Range header; restart from byte 0
+            head = b""
+
+        with open(output_path, "wb") as f:
+            f.write(head)
+            downloaded = len(head)
+
+            # A short 206 probe means the whole file already fit in it
+            if not (range_ok and len(head) < _PROBE_BYTES):
+                headers = {**_HEADERS, "Range": f"bytes={downloaded}-"} if range_ok else _HEADERS
+                response = urlopen(Request(source_url, headers=headers), timeout=timeout)
+
+                if range_ok and not _resumes_at(response, downloaded):
+                    # Not the requested tail (e.g. a redirect target answering
+                    # 200 with the whole file): appending it would corrupt the
+                    # MP4, so restart from byte 0
+                    logger.debug("Source ignored the resume range; restarting download")
+                    if response.status != 200:
+                        response.close()
+                        response = urlopen(Request(source_url, headers=_HEADERS), timeout=timeout)
+                    f.seek(0)
+                    f.truncate()
+                    downloaded = 0
+
+                with response:
+                    total_size = downloaded + int(response.headers.get("Content-Length", 0))
+                    preallocated = total_size > downloaded and _preallocate(f, total_size)
+
+                    reader = _ProgressReader(response, downloaded, total_size)
+                    shutil.copyfileobj(reader, f, length=_COPY_CHUNK)
+                    downloaded = reader.count
+
+                    if preallocated and downloaded != total_size:
+                        # Short/over-long body: drop the reserved-but-unwritten tail
+                        f.truncate(downloaded)
+
+        logger.info(f"Downloaded: {output_path.name} ({downloaded / 1024 / 1024:.1f} MB)")
 
     except Exception as e:
         if output_path.exists():
@@ -204,27 +510,17 @@ def get_video_metadata_invidious(url: str) -> dict:
     try:
         video_id = extract_video_id(url)
 
-        # Try each Invidious API instance
-        for api_base in INVIDIOUS_API_URLS:
-            try:
-                api_url = f"{api_base.rstrip('/')}/api/v1/videos/{video_id}"
-                req = Request(api_url, headers={"User-Agent": "yt-audio-filter/1.0"})
-
-                with urlopen(req, timeout=30) as response:
-                    video_info = json.loads(response.read().decode("utf-8"))
-
-                if video_info:
-                    return {
-                        "video_id": video_id,
-                        "title": video_info.get("title", ""),
-                        "description": video_info.get("description", ""),
-                        "channel": video_info.get("author", ""),
-                        "tags": video_info.get("keywords", []) or [],
-                        "duration": video_info.get("lengthSeconds", 0) or 0,
-                        "view_count": video_info.get("viewCount", 0) or 0,
-                    }
-            except:
-                continue
+        video_info, _, _ = _first_video_info(video_id, lambda info: True, warn=False)
+        if video_info:
+            return {
+                "video_id": video_id,
+                "title": video_info.get("title", ""),
+                "description": video_info.get("description", ""),
+                "channel": video_info.get("author", ""),
+                "tags": video_info.get("keywords", []) or [],
+                "duration": video_info.get("lengthSeconds", 0) or 0,
+                "view_count": video_info.get("viewCount", 0) or 0,
+            }
 
         logger.warning("Could not get metadata from Invidious")
         return {}
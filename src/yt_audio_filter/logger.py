@@ -1,8 +1,16 @@
 """Logging configuration for YT Audio Filter."""
 
+import atexit
 import logging
+import logging.handlers
+import multiprocessing
+import queue
 import sys
-from typing import Optional
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, Set
+
+# Loggers whose records currently go through a setup_logger() queue listener
+_listening_loggers: Set[logging.Logger] = set()
 
 
 def setup_logger(
@@ -34,6 +42,7 @@ def setup_logger(
     logger.setLevel(level)
 
     # Remove existing handlers to avoid duplicates
+    _stop_listener(logger)
     logger.handlers.clear()
 
     # Create console handler
@@ -50,11 +59,78 @@ def setup_logger(
         formatter = logging.Formatter("%(levelname)s: %(message)s")
 
     handler.setFormatter(formatter)
-    logger.addHandler(handler)
+
+    # Callers only enqueue the record; a background listener thread owns the
+    # stderr handler, so logging never blocks on the terminal
+    log_queue: "queue.Queue[Any]" = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    logger._listener = listener  # type: ignore[attr-defined]
+    _listening_loggers.add(logger)
 
     return logger
 
 
+def _stop_listener(logger: logging.Logger) -> None:
+    """
+    Flush and stop the queue listener installed by setup_logger, if any.
+
+    The logger is switched back to writing through the listener's handlers
+    directly, so records logged afterwards are still emitted.
+    """
+    _listening_loggers.discard(logger)
+    listener = getattr(logger, "_listener", None)
+    if listener is not None:
+        logger._listener = None  # type: ignore[attr-defined]
+        listener.stop()  # type: ignore[attr-defined]
+        logger.handlers[:] = list(listener.handlers)
+
+
+def shutdown_logging() -> None:
+    """
+    Flush every pending log record and stop the background listeners.
+
+    Entry points call this before exiting or printing straight to stderr so
+    queued messages come out first and in order. Safe to call repeatedly.
+    """
+    for logger in list(_listening_loggers):
+        _stop_listener(logger)
+
+
+atexit.register(shutdown_logging)
+
+
+@contextmanager
+def worker_log_queue(name: str = "yt_audio_filter") -> Iterator[Any]:
+    """
+    Forward log records from worker processes to the application logger.
+
+    Yields a multiprocessing queue to hand to init_worker_logging() in each
+    worker; records put on it are written by this process's handlers.
+    """
+    logger = get_logger(name)
+    listener_obj = getattr(logger, "_listener", None)
+    handlers = listener_obj.handlers if listener_obj is not None else logger.handlers
+    log_queue: Any = multiprocessing.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    try:
+        yield log_queue
+    finally:
+        listener.stop()
+        log_queue.close()
+
+
+def init_worker_logging(log_queue: Any, level: int, name: str = "yt_audio_filter") -> None:
+    """Route a worker process's application logger into ``log_queue``."""
+    logger = get_logger(name)
+    logger.setLevel(level)
+    logger.handlers.clear()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.propagate = False
+
+
 def get_logger(name: str = "yt_audio_filter") -> logging.Logger:
     """Get the application logger."""
     return logging.getLogger(name)
@@ -67,17 +143,16 @@ class ProgressLogger:
         self.logger = logger or get_logger()
         self.stages = ["Extract Audio", "Isolate Vocals", "Remux Video"]
         self.current_stage = 0
+        self._total = len(self.stages)
 
     def start_stage(self, stage_name: str) -> None:
         """Log the start of a processing stage."""
         self.current_stage += 1
-        total = len(self.stages)
-        self.logger.info(f"[{self.current_stage}/{total}] {stage_name}...")
+        self.logger.info("[%d/%d] %s...", self.current_stage, self._total, stage_name)
 
     def complete_stage(self, stage_name: str) -> None:
         """Log the completion of a processing stage."""
-        total = len(self.stages)
-        self.logger.info(f"[{self.current_stage}/{total}] {stage_name} complete")
+        self.logger.info("[%d/%d] %s complete", self.current_stage, self._total, stage_name)
 
     def log_detail(self, message: str) -> None:
         """Log a detail message (shown only in verbose mode)."""
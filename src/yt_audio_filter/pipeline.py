@@ -1,53 +1,109 @@
 """Main orchestration logic for the audio filtering pipeline."""
 
+import logging
 import multiprocessing
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, Optional, Tuple
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
 
-from .demucs_processor import ensure_demucs_available, isolate_vocals
-from .exceptions import YTAudioFilterError
+from .demucs_processor import (
+    ensure_demucs_available,
+    get_device,
+    preload_model,
+    separate_vocals,
+)
+from .exceptions import ValidationError, YTAudioFilterError
 from .ffmpeg import (
     concatenate_videos,
     ensure_ffmpeg_available,
-    extract_audio,
+    extract_audio_array,
+    extract_filter_remux,
     get_audio_info,
     get_video_duration,
-    remux_video,
-    split_video,
+    remux_video_array,
+    plan_chunk_windows,
 )
-from .logger import ProgressLogger, get_logger
+from .logger import ProgressLogger, get_logger, init_worker_logging, worker_log_queue
 from .utils import create_temp_dir, get_file_size_mb, validate_input_file
 
 logger = get_logger()
 
 
-def _process_chunk_worker(args: Tuple[Path, Path, str, str, str, Optional[int], int, bool, bool, bool, int]) -> Path:
+def _init_chunk_worker(
+    device: str,
+    model_name: str,
+    compile_model: bool,
+    log_queue: Optional[Any] = None,
+    log_level: int = logging.INFO,
+) -> None:
+    """
+    Pool initializer: load the Demucs model once per worker process.
+
+    Workers are reused across chunks and the model stays in demucs_processor's
+    per-process cache, so only worker startup pays the load. When ``log_queue``
+    is given, the worker's log records are sent to the parent process.
+    """
+    if log_queue is not None:
+        init_worker_logging(log_queue, log_level)
+    try:
+        preload_model(model_name, device, compile_model=compile_model)
+    except Exception as e:
+        # The first separation retries the load and reports the error properly
+        logger.debug(f"Could not preload Demucs model in worker: {e}")
+
+
+def _process_chunk_on_stream(**kwargs) -> Path:
+    """
+    Thread-pool worker for GPU chunk processing.
+
+    Runs _process_single_chunk with a CUDA stream of its own as the current
+    stream. Streams are per thread, so concurrent chunks share the process's
+    CUDA context and cached model but queue their kernels independently.
+    """
+    import torch
+
+    stream = torch.cuda.Stream()
+    with torch.cuda.stream(stream):
+        result = _process_single_chunk(**kwargs)
+    stream.synchronize()
+    return result
+
+
+def _process_chunk_worker(
+    args: Tuple[
+        Path, Path, float, Optional[float], str, str, str, Optional[int], int, bool, bool, bool,
+        bool, bool, int
+    ]
+) -> Path:
     """
     Worker function for parallel chunk processing.
 
     This function is called by multiprocessing.Pool to process a single chunk.
-    Each worker runs in a separate process with its own CUDA context.
+    The pool is only used when ``device`` resolves to the CPU (CUDA runs
+    chunks as threads on one context), so workers never touch CUDA.
 
     Args:
-        args: Tuple of (chunk_path, output_path, device, model_name, audio_bitrate,
-                       segment, shifts, watermark, fp16, compile_model, chunk_index)
+        args: Tuple of (input_path, output_path, start, duration, device, model_name,
+                       audio_bitrate, segment, shifts, watermark, fp16, bf16, skip_speech_only,
+                       compile_model, chunk_index)
 
     Returns:
         Path to the processed chunk
     """
-    chunk_path, output_path, device, model_name, audio_bitrate, segment, shifts, watermark, fp16, compile_model, chunk_index = args
-
-    # Import torch here to ensure each process initializes CUDA independently
-    import torch
-    if device != "cpu" and torch.cuda.is_available():
-        torch.cuda.empty_cache()
-        logger.debug(f"Worker {chunk_index}: Initialized CUDA context")
+    (
+        input_path, output_path, start, duration, device, model_name, audio_bitrate, segment,
+        shifts, watermark, fp16, bf16, skip_speech_only, compile_model, chunk_index,
+    ) = args
 
     # Process the chunk
     try:
-        result = _process_single_chunk(
-            input_path=chunk_path,
+        return _process_single_chunk(
+            input_path=input_path,
             output_path=output_path,
+            start=start,
+            duration=duration,
             device=device,
             model_name=model_name,
             audio_bitrate=audio_bitrate,
@@ -55,20 +111,90 @@ def _process_chunk_worker(args: Tuple[Path, Path, str, str, str, Optional[int],
             shifts=shifts,
             watermark=watermark,
             fp16=fp16,
+            bf16=bf16,
+            skip_speech_only=skip_speech_only,
             compile_model=compile_model,
         )
-
-        # Clear CUDA cache after processing
-        if device != "cpu" and torch.cuda.is_available():
-            torch.cuda.empty_cache()
-            logger.debug(f"Worker {chunk_index}: Cleared CUDA cache")
-
-        return result
     except Exception as e:
         logger.error(f"Worker {chunk_index}: Failed to process chunk: {e}")
         raise
 
 
+# Items allowed to wait between two pipeline stages; each holds a chunk's
+# PCM in memory, so keep it small
+_PIPELINE_DEPTH = 1
+# Demucs models run at 44.1 kHz stereo; ffmpeg resamples while decoding
+_DEMUCS_SAMPLE_RATE = 44100
+_END = object()
+
+
+def _pipelined(
+    items: Iterable[Any],
+    stages: List[Callable[[Any], Any]],
+    depth: int = _PIPELINE_DEPTH,
+) -> Iterator[Any]:
+    """
+    Yield ``stages[-1](...stages[0](item))`` for each item, in input order.
+
+    Each stage runs on its own thread, so stage k works on item n while
+    stage k+1 handles item n-1. Bounded queues of ``depth`` between stages
+    apply backpressure. The first exception raised by any stage stops the
+    pipeline and is re-raised here once every stage thread has finished.
+    """
+    failed = threading.Event()
+    errors: List[BaseException] = []
+
+    def put(q: queue.Queue, item: Any) -> bool:
+        while not failed.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def drain(q: queue.Queue) -> Iterator[Any]:
+        while True:
+            try:
+                item = q.get(timeout=0.1)
+            except queue.Empty:
+                if failed.is_set():
+                    return
+                continue
+            if item is _END:
+                return
+            yield item
+
+    def run(stage: Callable[[Any], Any], source: Iterator[Any], sink: queue.Queue) -> None:
+        try:
+            for item in source:
+                if failed.is_set() or not put(sink, stage(item)):
+                    return
+        except BaseException as e:
+            errors.append(e)
+            failed.set()
+        finally:
+            put(sink, _END)
+
+    threads = []
+    source: Iterator[Any] = iter(items)
+    for stage in stages:
+        sink: queue.Queue = queue.Queue(maxsize=depth)
+        threads.append(threading.Thread(target=run, args=(stage, source, sink), daemon=True))
+        source = drain(sink)
+
+    for thread in threads:
+        thread.start()
+    try:
+        yield from source
+    finally:
+        failed.set()
+        for thread in threads:
+            thread.join()
+    if errors:
+        raise errors[0]
+
+
 def validate_prerequisites() -> None:
     """
     Validate that all required tools are available.
@@ -90,58 +216,58 @@ def _process_single_chunk(
     shifts: int,
     watermark: bool,
     fp16: bool,
+    bf16: bool,
     compile_model: bool,
+    skip_speech_only: bool = False,
+    start: Optional[float] = None,
+    duration: Optional[float] = None,
 ) -> Path:
     """
     Process a single video chunk (internal helper function).
 
     This function processes one video chunk through the full pipeline
-    without chunking logic.
+    without chunking logic. The chunk is the ``start``/``duration`` window
+    of ``input_path`` (the whole file when both are None).
 
     Returns:
         Path to the processed chunk
     """
-    # Create temp directory for intermediate files
-    with create_temp_dir() as temp_dir:
-        # Stage 1: Extract audio from video
-        audio_wav = temp_dir / "audio.wav"
-        extract_audio(input_path, audio_wav)
-
-        # Stage 2: Isolate vocals using Demucs AI
-        vocals_wav = temp_dir / "vocals.wav"
-
-        # Clear CUDA cache before heavy processing
-        if device != "cpu":
-            try:
-                import torch
-                if torch.cuda.is_available():
-                    torch.cuda.empty_cache()
-                    logger.debug("Cleared CUDA cache before vocal isolation")
-            except Exception:
-                pass
-
-        isolate_vocals(
-            audio_wav,
-            vocals_wav,
-            device=device,
-            model_name=model_name,
-            progress_callback=None,  # No progress for individual chunks
-            segment=segment,
-            shifts=shifts,
-            fp16=fp16,
-            compile_model=compile_model,
-        )
-
-        # Stage 3: Remux video with processed vocals
-        remux_video(
-            input_path,
-            vocals_wav,
-            output_path,
-            audio_bitrate=audio_bitrate,
-            watermark=watermark,
-        )
-
-        return output_path
+    # The PCM moves through memory (ffmpeg stdout -> Demucs -> ffmpeg stdin);
+    # no intermediate WAV files are written
+    # Stage 1: Extract audio from video
+    audio = extract_audio_array(
+        input_path, sample_rate=_DEMUCS_SAMPLE_RATE, start=start, duration=duration
+    )
+
+    # Stage 2: Isolate vocals using Demucs AI
+    vocals, vocals_rate = separate_vocals(
+        audio,
+        _DEMUCS_SAMPLE_RATE,
+        device=device,
+        model_name=model_name,
+        progress_callback=None,  # No progress for individual chunks
+        segment=segment,
+        shifts=shifts,
+        fp16=fp16,
+        bf16=bf16,
+        skip_when_vocals_only=skip_speech_only,
+        compile_model=compile_model,
+    )
+    del audio
+
+    # Stage 3: Remux video with processed vocals
+    remux_video_array(
+        input_path,
+        vocals,
+        vocals_rate,
+        output_path,
+        audio_bitrate=audio_bitrate,
+        watermark=watermark,
+        start=start,
+        duration=duration,
+    )
+
+    return output_path
 
 
 def _process_video_chunked(
@@ -155,18 +281,23 @@ def _process_video_chunked(
     shifts: int,
     watermark: bool,
     fp16: bool,
+    bf16: bool,
     compile_model: bool,
     chunk_duration: int,
     parallel_chunks: int = 1,
+    skip_speech_only: bool = False,
 ) -> Path:
     """
     Process a video using chunked approach for consistent high-speed performance.
 
-    This splits the video into chunks, processes each chunk (sequentially or in parallel),
-    then concatenates the results.
+    This plans keyframe-aligned time windows, processes each window straight
+    from the source (nothing is split out to disk), then concatenates the results.
+    With one worker the extract/separate/remux stages run as a pipeline across
+    chunks. With more, whole chunks run concurrently: on CUDA as threads with
+    one CUDA stream each, sharing a single loaded model; on CPU in a process pool.
 
     Args:
-        parallel_chunks: Number of chunks to process in parallel (1 = sequential, 2+ = parallel)
+        parallel_chunks: Number of chunks to process in parallel (1 = pipelined, 2+ = concurrent)
 
     Returns:
         Path to the final processed video
@@ -179,33 +310,81 @@ def _process_video_chunked(
     else:
         logger.info(f"Using chunked processing with {chunk_duration}s ({chunk_duration/60:.0f} min) chunks")
 
-    # Create temp directory for chunks and processed chunks
+    # Create temp directory for processed chunks
     with create_temp_dir(prefix="chunks_") as chunks_dir:
-        # Step 1: Split video into chunks
+        # Step 1: Plan chunk windows on keyframes; each stage then seeks
+        # into the source instead of reading a split-out copy
         logger.info("Splitting video into chunks...")
         if progress_callback:
             progress_callback("Split Video", 0)
 
-        chunk_paths = split_video(input_path, chunks_dir, chunk_duration=chunk_duration)
+        windows = plan_chunk_windows(input_path, chunk_duration=chunk_duration)
 
         if progress_callback:
             progress_callback("Split Video", 100)
 
         # Step 2: Process each chunk (sequential or parallel)
         processed_chunks = []
-        num_chunks = len(chunk_paths)
+        num_chunks = len(windows)
+
+        if parallel_chunks > 1 and get_device(device).type == "cuda":
+            # One process, one CUDA context and one copy of the model; each
+            # chunk runs on its own CUDA stream so work from different chunks
+            # can overlap on the GPU
+            logger.info(f"Processing {num_chunks} chunks on {parallel_chunks} CUDA streams...")
+            preload_model(model_name, device, compile_model=compile_model)
+
+            with ThreadPoolExecutor(max_workers=parallel_chunks) as executor:
+                futures = []
+                for i, (start, duration) in enumerate(windows):
+                    processed_chunk_path = chunks_dir / f"processed_chunk_{i:03d}.mp4"
+                    futures.append(executor.submit(
+                        _process_chunk_on_stream,
+                        input_path=input_path,
+                        output_path=processed_chunk_path,
+                        start=start,
+                        duration=duration,
+                        device=device,
+                        model_name=model_name,
+                        audio_bitrate=audio_bitrate,
+                        segment=segment,
+                        shifts=shifts,
+                        watermark=watermark,
+                        fp16=fp16,
+                        bf16=bf16,
+                        skip_speech_only=skip_speech_only,
+                        compile_model=compile_model,
+                    ))
+                    processed_chunks.append(processed_chunk_path)
+
+                try:
+                    for i, future in enumerate(futures):
+                        future.result()
+                        logger.info(f"Completed chunk {i+1}/{num_chunks}")
+
+                        if progress_callback:
+                            overall_progress = int(((i + 1) / num_chunks) * 100)
+                            progress_callback("Process Chunks", overall_progress)
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+
+            logger.info(f"All {num_chunks} chunks processed")
 
-        if parallel_chunks > 1:
-            # Parallel processing using multiprocessing
+        elif parallel_chunks > 1:
+            # CPU: parallel processing using multiprocessing
             logger.info(f"Processing {num_chunks} chunks with {parallel_chunks} workers in parallel...")
 
             # Prepare arguments for each chunk
             chunk_args = []
-            for i, chunk_path in enumerate(chunk_paths):
-                processed_chunk_path = chunks_dir / f"processed_{chunk_path.name}"
+            for i, (start, duration) in enumerate(windows):
+                processed_chunk_path = chunks_dir / f"processed_chunk_{i:03d}.mp4"
                 chunk_args.append((
-                    chunk_path,
+                    input_path,
                     processed_chunk_path,
+                    start,
+                    duration,
                     device,
                     model_name,
                     audio_bitrate,
@@ -213,6 +392,8 @@ def _process_video_chunked(
                     shifts,
                     watermark,
                     fp16,
+                    bf16,
+                    skip_speech_only,
                     compile_model,
                     i + 1,  # chunk index for logging
                 ))
@@ -226,8 +407,15 @@ def _process_video_chunked(
                 # Start method can only be set once; if already set, that's fine
                 pass
 
-            # Create a pool of workers
-            with multiprocessing.Pool(processes=parallel_chunks) as pool:
+            # Create a pool of workers; their log records are written by the
+            # parent's handlers
+            with worker_log_queue() as log_queue, multiprocessing.Pool(
+                processes=parallel_chunks,
+                initializer=_init_chunk_worker,
+                initargs=(
+                    device, model_name, compile_model, log_queue, logger.getEffectiveLevel()
+                ),
+            ) as pool:
                 # Process chunks in parallel
                 results = []
                 for i, args in enumerate(chunk_args):
@@ -246,35 +434,61 @@ def _process_video_chunked(
             logger.info(f"All {num_chunks} chunks processed")
 
         else:
-            # Sequential processing (original behavior)
-            for i, chunk_path in enumerate(chunk_paths):
-                logger.info(f"Processing chunk {i+1}/{num_chunks}: {chunk_path.name}")
-
-                if progress_callback:
-                    overall_progress = int((i / num_chunks) * 100)
-                    progress_callback("Process Chunks", overall_progress)
-
-                # Process this chunk
-                processed_chunk_path = chunks_dir / f"processed_{chunk_path.name}"
-
-                _process_single_chunk(
-                    input_path=chunk_path,
-                    output_path=processed_chunk_path,
+            # One chunk at a time per stage, but the stages overlap: while
+            # Demucs holds the GPU for chunk N, ffmpeg extracts chunk N+1's
+            # audio and remuxes chunk N-1. PCM is handed between stages in memory.
+            def extract_stage(item):
+                i, (start, duration) = item
+                logger.info(f"Processing chunk {i+1}/{num_chunks} (from {start:.1f}s)")
+                audio = extract_audio_array(
+                    input_path, sample_rate=_DEMUCS_SAMPLE_RATE, start=start, duration=duration
+                )
+                return i, (start, duration), audio
+
+            def separate_stage(item):
+                # Single thread: every chunk shares one CUDA context and model
+                i, window, audio = item
+                vocals = separate_vocals(
+                    audio,
+                    _DEMUCS_SAMPLE_RATE,
                     device=device,
                     model_name=model_name,
-                    audio_bitrate=audio_bitrate,
+                    progress_callback=None,  # No progress for individual chunks
                     segment=segment,
                     shifts=shifts,
-                    watermark=watermark,
                     fp16=fp16,
+                    bf16=bf16,
+                    skip_when_vocals_only=skip_speech_only,
                     compile_model=compile_model,
                 )
+                return i, window, vocals
+
+            def remux_stage(item):
+                i, (start, duration), (vocals, vocals_rate) = item
+                processed_chunk_path = chunks_dir / f"processed_chunk_{i:03d}.mp4"
+                remux_video_array(
+                    input_path,
+                    vocals,
+                    vocals_rate,
+                    processed_chunk_path,
+                    audio_bitrate=audio_bitrate,
+                    watermark=watermark,
+                    start=start,
+                    duration=duration,
+                )
+                return i, processed_chunk_path
 
+            if progress_callback:
+                progress_callback("Process Chunks", 0)
+
+            for i, processed_chunk_path in _pipelined(
+                enumerate(windows), [extract_stage, separate_stage, remux_stage]
+            ):
                 processed_chunks.append(processed_chunk_path)
                 logger.info(f"Completed chunk {i+1}/{num_chunks}")
 
-            if progress_callback:
-                progress_callback("Process Chunks", 100)
+                if progress_callback:
+                    progress_callback("Process Chunks", int(((i + 1) / num_chunks) * 100))
 
         # Step 3: Concatenate all processed chunks
         logger.info("Concatenating processed chunks...")
@@ -286,13 +500,6 @@ def _process_video_chunked(
         if progress_callback:
             progress_callback("Concatenate Chunks", 100)
 
-        # Clean up original chunks (processed chunks will be cleaned by temp_dir context)
-        for chunk_path in chunk_paths:
-            try:
-                chunk_path.unlink()
-            except Exception:
-                pass
-
         # Log output info
         output_size = get_file_size_mb(output_path)
         logger.info(f"Output saved: {output_path.name} ({output_size:.1f} MB)")
@@ -311,9 +518,12 @@ def process_video(
     shifts: int = 1,
     watermark: bool = False,
     fp16: bool = False,
+    bf16: bool = False,
     compile_model: bool = False,
+    skip_speech_only: bool = False,
     chunk_duration: Optional[int] = None,
     parallel_chunks: int = 1,
+    ffmpeg_filter: Optional[str] = None,
 ) -> Path:
     """
     Process a video to isolate vocals and remove background music.
@@ -331,9 +541,14 @@ def process_video(
         shifts: Number of random shifts for augmentation (default: 1)
         watermark: Add a small watermark to help avoid Content ID (default: False)
         fp16: Use mixed precision (FP16) for faster GPU inference (default: False)
+        bf16: Use BF16 autocast on GPUs that support it; takes precedence over fp16 (default: False)
         compile_model: Compile model with torch.compile() for faster inference (default: False)
+        skip_speech_only: Skip Demucs for audio a pre-screen finds is already bare
+            speech (default: False)
         chunk_duration: Split video into chunks of this many seconds (None = auto, 0 = disabled)
         parallel_chunks: Number of chunks to process in parallel (default: 1 = sequential)
+        ffmpeg_filter: FFmpeg ``-af`` graph to apply instead of Demucs. Runs as a
+            single fused decode/filter/encode pass with no intermediate WAV.
 
     Returns:
         Path to the processed output file
@@ -347,6 +562,21 @@ def process_video(
     input_size = get_file_size_mb(input_path)
     logger.info(f"Processing: {input_path.name} ({input_size:.1f} MB)")
 
+    if ffmpeg_filter is not None:
+        if watermark:
+            raise ValidationError("ffmpeg_filter cannot be combined with watermark")
+        ensure_ffmpeg_available()
+        validate_input_file(input_path)
+
+        progress.start_stage("Filter Audio")
+        if progress_callback:
+            progress_callback("Filter Audio", 0)
+        extract_filter_remux(input_path, ffmpeg_filter, output_path, audio_bitrate=audio_bitrate)
+        if progress_callback:
+            progress_callback("Filter Audio", 100)
+        progress.complete_stage("Filter Audio")
+        return output_path
+
     # Validate prerequisites
     logger.debug("Validating prerequisites...")
     validate_prerequisites()
@@ -405,94 +635,96 @@ def process_video(
             shifts=shifts,
             watermark=watermark,
             fp16=fp16,
+            bf16=bf16,
+            skip_speech_only=skip_speech_only,
             compile_model=compile_model,
             chunk_duration=effective_chunk_duration,
             parallel_chunks=parallel_chunks,
         )
 
-    # Otherwise, use standard single-video processing
-    # Create temp directory for intermediate files
-    with create_temp_dir() as temp_dir:
-        try:
-            # Stage 1: Extract audio from video
-            progress.start_stage("Extract Audio")
-            if progress_callback:
-                progress_callback("Extract Audio", 0)
-
-            audio_wav = temp_dir / "audio.wav"
-            extract_audio(input_path, audio_wav)
+    # Otherwise, use standard single-video processing. The PCM moves through
+    # memory (ffmpeg stdout -> Demucs -> ffmpeg stdin); no WAV files are written
+    try:
+        # Stage 1: Extract audio from video
+        progress.start_stage("Extract Audio")
+        if progress_callback:
+            progress_callback("Extract Audio", 0)
 
-            if progress_callback:
-                progress_callback("Extract Audio", 100)
-            progress.complete_stage("Extract Audio")
+        audio = extract_audio_array(input_path, sample_rate=_DEMUCS_SAMPLE_RATE)
 
-            # Stage 2: Isolate vocals using Demucs AI
-            progress.start_stage("Isolate Vocals")
-            if progress_callback:
-                progress_callback("Isolate Vocals", 0)
+        if progress_callback:
+            progress_callback("Extract Audio", 100)
+        progress.complete_stage("Extract Audio")
 
-            vocals_wav = temp_dir / "vocals.wav"
+        # Stage 2: Isolate vocals using Demucs AI
+        progress.start_stage("Isolate Vocals")
+        if progress_callback:
+            progress_callback("Isolate Vocals", 0)
 
-            # Clear CUDA cache before heavy processing
-            if device != "cpu":
-                try:
-                    import torch
-                    if torch.cuda.is_available():
-                        torch.cuda.empty_cache()
-                        logger.debug("Cleared CUDA cache before vocal isolation")
-                except Exception:
-                    pass
-
-            # Create a sub-callback for granular Demucs progress
-            def demucs_progress(info: dict):
-                if progress_callback:
-                    progress_callback("Isolate Vocals", info.get('percent', 0), info)
-
-            isolate_vocals(
-                audio_wav,
-                vocals_wav,
-                device=device,
-                model_name=model_name,
-                progress_callback=demucs_progress,
-                segment=segment,
-                shifts=shifts,
-                fp16=fp16,
-                compile_model=compile_model,
-            )
+        # Clear CUDA cache before heavy processing
+        if device != "cpu":
+            try:
+                import torch
+                if torch.cuda.is_available():
+                    torch.cuda.empty_cache()
+                    logger.debug("Cleared CUDA cache before vocal isolation")
+            except Exception:
+                pass
 
+        # Create a sub-callback for granular Demucs progress
+        def demucs_progress(info: dict):
             if progress_callback:
-                progress_callback("Isolate Vocals", 100)
-            progress.complete_stage("Isolate Vocals")
+                progress_callback("Isolate Vocals", info.get('percent', 0), info)
 
-            # Stage 3: Remux video with processed vocals
-            progress.start_stage("Remux Video")
-            if progress_callback:
-                progress_callback("Remux Video", 0)
+        vocals, vocals_rate = separate_vocals(
+            audio,
+            _DEMUCS_SAMPLE_RATE,
+            device=device,
+            model_name=model_name,
+            progress_callback=demucs_progress,
+            segment=segment,
+            shifts=shifts,
+            fp16=fp16,
+            bf16=bf16,
+            skip_when_vocals_only=skip_speech_only,
+            compile_model=compile_model,
+        )
+        del audio
 
-            if watermark:
-                logger.info("Adding watermark to video...")
+        if progress_callback:
+            progress_callback("Isolate Vocals", 100)
+        progress.complete_stage("Isolate Vocals")
 
-            remux_video(
-                input_path,
-                vocals_wav,
-                output_path,
-                audio_bitrate=audio_bitrate,
-                watermark=watermark,
-            )
+        # Stage 3: Remux video with processed vocals
+        progress.start_stage("Remux Video")
+        if progress_callback:
+            progress_callback("Remux Video", 0)
 
-            if progress_callback:
-                progress_callback("Remux Video", 100)
-            progress.complete_stage("Remux Video")
+        if watermark:
+            logger.info("Adding watermark to video...")
+
+        remux_video_array(
+            input_path,
+            vocals,
+            vocals_rate,
+            output_path,
+            audio_bitrate=audio_bitrate,
+            watermark=watermark,
+        )
 
-            # Log output info
-            output_size = get_file_size_mb(output_path)
-            logger.info(f"Output saved: {output_path.name} ({output_size:.1f} MB)")
+        if progress_callback:
+            progress_callback("Remux Video", 100)
+        progress.complete_stage("Remux Video")
 
-            return output_path
+        # Log output info
+        output_size = get_file_size_mb(output_path)
+        logger.info(f"Output saved: {output_path.name} ({output_size:.1f} MB)")
 
-        except YTAudioFilterError:
-            # Re-raise our custom errors
-            raise
-        except Exception as e:
-            # Wrap unexpected errors
-            raise YTAudioFilterError(f"Unexpected error during processing: {e}")
+        return output_path
+
+    except YTAudioFilterError:
+        # Re-raise our custom errors
+        raise
+    except Exception as e:
+        # Wrap unexpected errors
+        raise YTAudioFilterError(f"Unexpected error during processing: {e}")
@@ -29,6 +29,7 @@ See the ``notes`` field of ``data/reciters.json`` for the canonical record.
 from __future__ import annotations
 
 import json
+import shutil
 import urllib.error
 import urllib.request
 from dataclasses import dataclass
@@ -47,6 +48,11 @@ _USER_AGENT = (
     "Mozilla/5.0 (compatible; yt-audio-filter/1.0; "
     "+https://github.com/Affiliat0r/yt-audio-filter)"
 )
+_HEADERS = {"User-Agent": _USER_AGENT}
+
+# Read size for streaming HTTP bodies to disk (copyfileobj's C-level loop).
+# Full-surah MP3s run from ~1 MB to >100 MB, so use large blocks.
+_COPY_BUFFER_SIZE = 4 * 1024 * 1024
 
 
 @dataclass(frozen=True)
@@ -190,18 +196,16 @@ def download_surah(
     url = get_surah_url(surah_number, r)
     logger.info("Downloading surah %d (%s) from %s", surah_number, r.slug, url)
 
-    request = urllib.request.Request(url, headers={"User-Agent": _USER_AGENT})
+    request = urllib.request.Request(url, headers=_HEADERS)
     # Stream into a temp file first, then rename atomically so a half-written
     # file never satisfies the "cached" check on subsequent runs.
     tmp = target.with_suffix(".mp3.part")
     try:
         with urllib.request.urlopen(request, timeout=timeout) as resp:
-            with tmp.open("wb") as out:
-                while True:
-                    chunk = resp.read(64 * 1024)
-                    if not chunk:
-                        break
-                    out.write(chunk)
+            # Unbuffered: copyfileobj already hands over large blocks, so the
+            # BufferedWriter layer would only add an extra memcpy per block.
+            with tmp.open("wb", buffering=0) as out:
+                shutil.copyfileobj(resp, out, _COPY_BUFFER_SIZE)
     except urllib.error.HTTPError as exc:
         tmp.unlink(missing_ok=True)
         raise YouTubeDownloadError(
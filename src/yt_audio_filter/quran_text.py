@@ -60,6 +60,7 @@ _USER_AGENT = (
     "Mozilla/5.0 (compatible; yt-audio-filter/1.0; "
     "+https://github.com/Affiliat0r/yt-audio-filter)"
 )
+_HEADERS = {"User-Agent": _USER_AGENT}
 
 #: Quran.com translation resource id for Dutch (Sofyan Siregar). Documented
 #: so users who ship ``data/translations/dutch.json`` know which id to pass
@@ -172,7 +173,7 @@ def _load_extra_translation(translation_id: int, cache_dir_str: str) -> Dict[str
 
     url = f"{_QURAN_API}/quran/translations/{translation_id}"
     logger.info("Fetching translation %d from Quran.com API: %s", translation_id, url)
-    request = urllib.request.Request(url, headers={"User-Agent": _USER_AGENT})
+    request = urllib.request.Request(url, headers=_HEADERS)
     try:
         with urllib.request.urlopen(request, timeout=60) as resp:
             payload = json.loads(resp.read().decode("utf-8"))
@@ -0,0 +1,16 @@
+"""YouTube URL patterns shared by the CLI and the youtube module.
+
+Plain strings with no imports, so the CLI can recognise a YouTube URL
+without loading youtube.py (and yt-dlp behind it) at startup.
+"""
+
+# YouTube URL patterns
+YOUTUBE_PATTERNS = [
+    r"(?:https?://)?(?:www\.)?youtube\.com/watch\?v=[\w-]+",
+    r"(?:https?://)?(?:www\.)?youtu\.be/[\w-]+",
+    r"(?:https?://)?(?:www\.)?youtube\.com/shorts/[\w-]+",
+    r"(?:https?://)?(?:m\.)?youtube\.com/watch\?v=[\w-]+",
+]
+
+# One alternation of all of the above; compile with re.IGNORECASE
+YOUTUBE_URL_PATTERN = "|".join(f"(?:{p})" for p in YOUTUBE_PATTERNS)
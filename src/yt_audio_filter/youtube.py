@@ -7,11 +7,15 @@ from typing import Callable, List, Literal, Optional
 
 from .exceptions import YouTubeDownloadError, PrerequisiteError, ValidationError
 from .logger import get_logger
+from .url_patterns import YOUTUBE_PATTERNS, YOUTUBE_URL_PATTERN  # noqa: F401 (re-exported)
 
 StreamMode = Literal["video-only", "audio-only", "video+audio"]
 
 logger = get_logger()
 
+# Set once check_ytdlp_available() has succeeded
+_ytdlp_available: bool = False
+
 
 @dataclass
 class VideoMetadata:
@@ -25,13 +29,10 @@ class VideoMetadata:
     view_count: int
     file_path: Path
 
-# YouTube URL patterns
-YOUTUBE_PATTERNS = [
-    r"(?:https?://)?(?:www\.)?youtube\.com/watch\?v=[\w-]+",
-    r"(?:https?://)?(?:www\.)?youtu\.be/[\w-]+",
-    r"(?:https?://)?(?:www\.)?youtube\.com/shorts/[\w-]+",
-    r"(?:https?://)?(?:m\.)?youtube\.com/watch\?v=[\w-]+",
-]
+# Compiled once at import: one alternation instead of N re.match() calls, and
+# the 11-char id pattern behind parse_video_id().
+_YOUTUBE_URL_RE = re.compile(YOUTUBE_URL_PATTERN, re.IGNORECASE)
+_VIDEO_ID_RE = re.compile(r"(?:v=|/shorts/|youtu\.be/)([A-Za-z0-9_-]{11})")
 
 
 def is_youtube_url(input_str: str) -> bool:
@@ -49,11 +50,11 @@ def is_youtube_url(input_str: str) -> bool:
 
     input_str = input_str.strip()
 
-    # Quick check: must contain youtube or youtu.be
-    if "youtube" not in input_str.lower() and "youtu.be" not in input_str.lower():
+    # Quick check: must contain youtube or youtu.be (both contain "youtu")
+    if "youtu" not in input_str.lower():
         return False
 
-    return any(re.match(pattern, input_str, re.IGNORECASE) for pattern in YOUTUBE_PATTERNS)
+    return _YOUTUBE_URL_RE.match(input_str) is not None
 
 
 def validate_youtube_url(url: str) -> None:
@@ -80,15 +81,21 @@ def check_ytdlp_available() -> bool:
     """
     Check if yt-dlp is available and importable.
 
+    A successful import is cached; a failure is retried on the next call.
+
     Returns:
         True if yt-dlp is available, False otherwise
     """
-    try:
-        import yt_dlp
+    global _ytdlp_available
 
-        return True
-    except ImportError:
-        return False
+    if not _ytdlp_available:
+        try:
+            import yt_dlp  # noqa: F401
+
+            _ytdlp_available = True
+        except ImportError:
+            return False
+    return True
 
 
 def ensure_ytdlp_available() -> None:
@@ -105,10 +112,30 @@ def ensure_ytdlp_available() -> None:
         )
 
 
+def parse_video_id(url: str) -> Optional[str]:
+    """
+    Parse the video ID out of a standard watch / youtu.be / shorts URL.
+
+    Purely offline: no validation and no yt-dlp fallback.
+
+    Args:
+        url: YouTube video URL
+
+    Returns:
+        Video ID string, or None if the URL doesn't carry one
+    """
+    match = _VIDEO_ID_RE.search(url)
+    return match.group(1) if match else None
+
+
 def extract_video_id(url: str) -> str:
     """
     Extract the video ID from a YouTube URL without downloading.
 
+    Standard watch / youtu.be / shorts URLs are parsed offline with a
+    precompiled regex; yt-dlp extraction is only used for URLs the regex
+    can't handle.
+
     Args:
         url: YouTube video URL
 
@@ -119,9 +146,13 @@ def extract_video_id(url: str) -> str:
         ValidationError: If URL is not a valid YouTube URL
         YouTubeDownloadError: If video ID extraction fails
     """
-    ensure_ytdlp_available()
     validate_youtube_url(url)
 
+    video_id = parse_video_id(url)
+    if video_id:
+        return video_id
+
+    ensure_ytdlp_available()
     import yt_dlp
 
     ydl_opts = {
@@ -137,10 +168,6 @@ def extract_video_id(url: str) -> str:
                 raise YouTubeDownloadError("Failed to extract video information")
             return info.get("id", "unknown")
     except Exception as e:
-        # Fallback: try to extract from URL pattern
-        match = re.search(r"(?:v=|/shorts/|youtu\.be/)([a-zA-Z0-9_-]{11})", url)
-        if match:
-            return match.group(1)
         raise YouTubeDownloadError(f"Failed to extract video ID: {e}")
 
 
@@ -1,14 +1,46 @@
-"""Fetch lightweight YouTube metadata (title, channel, description, tags) without downloading."""
+"""Fetch lightweight YouTube metadata (title, channel, description, tags) without downloading.
 
-from dataclasses import dataclass, field
-from typing import List, Optional
+Results are cached per video id: in a small in-process LRU, and on disk as
+JSON under the project's ``cache/youtube_meta/`` with a 7-day TTL, since title/channel/tags of a
+published video rarely change and each yt-dlp extraction is a network
+round-trip plus a heavyweight ``YoutubeDL`` setup.
+"""
+
+import json
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
 
 from .exceptions import YouTubeDownloadError
 from .logger import get_logger
-from .youtube import ensure_ytdlp_available, validate_youtube_url
+from .youtube import ensure_ytdlp_available, parse_video_id, validate_youtube_url
 
 logger = get_logger()
 
+# Anchored at the project root so the cache doesn't follow the working directory
+DEFAULT_META_CACHE_DIR = Path(__file__).resolve().parents[2] / "cache" / "youtube_meta"
+DEFAULT_META_TTL_SECONDS = 7 * 24 * 3600  # 7 days
+
+# In-process LRU memo: video_id -> asdict(YouTubeMetadata)
+_MEMO_MAX_ENTRIES = 64
+_memo: OrderedDict[str, Dict] = OrderedDict()
+
+
+def _memo_get(video_id: str) -> Optional[Dict]:
+    data = _memo.get(video_id)
+    if data is not None:
+        _memo.move_to_end(video_id)
+    return data
+
+
+def _memo_put(video_id: str, data: Dict) -> None:
+    _memo[video_id] = data
+    _memo.move_to_end(video_id)
+    while len(_memo) > _MEMO_MAX_ENTRIES:
+        _memo.popitem(last=False)
+
 
 @dataclass
 class YouTubeMetadata:
@@ -21,11 +53,68 @@ class YouTubeMetadata:
     duration: int = 0
 
 
-def fetch_yt_metadata(url: str) -> YouTubeMetadata:
-    """Fetch a YouTube video's metadata without downloading the media."""
-    ensure_ytdlp_available()
+def _from_dict(d: Dict) -> YouTubeMetadata:
+    return YouTubeMetadata(
+        video_id=str(d["video_id"]),
+        title=str(d.get("title") or ""),
+        channel=str(d.get("channel") or ""),
+        uploader=str(d.get("uploader") or ""),
+        description=str(d.get("description") or ""),
+        tags=list(d.get("tags") or []),
+        duration=int(d.get("duration") or 0),
+    )
+
+
+def _read_disk_cache(path: Path, ttl_seconds: int) -> Optional[Dict]:
+    try:
+        if time.time() - path.stat().st_mtime > ttl_seconds:
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    return data if isinstance(data, dict) and "video_id" in data else None
+
+
+def _write_disk_cache(path: Path, data: Dict) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        tmp.replace(path)
+    except OSError as e:
+        logger.debug(f"Could not write metadata cache {path}: {e}")
+
+
+def fetch_yt_metadata(
+    url: str,
+    cache_dir: Optional[Path] = DEFAULT_META_CACHE_DIR,
+    ttl_seconds: int = DEFAULT_META_TTL_SECONDS,
+) -> YouTubeMetadata:
+    """Fetch a YouTube video's metadata without downloading the media.
+
+    Cache hits (in-process, then ``cache_dir/<video_id>.json`` younger than
+    ``ttl_seconds``) skip yt-dlp entirely. Pass ``cache_dir=None`` to
+    disable caching and always fetch fresh metadata.
+    """
     validate_youtube_url(url)
 
+    video_id = parse_video_id(url)
+    cache_path = Path(cache_dir) / f"{video_id}.json" if cache_dir and video_id else None
+
+    if cache_path is not None:
+        cached = _memo_get(video_id)
+        if cached is None:
+            cached = _read_disk_cache(cache_path, ttl_seconds)
+            if cached is not None:
+                _memo_put(video_id, cached)
+        if cached is not None:
+            logger.debug(f"Using cached metadata for {video_id}")
+            return _from_dict(cached)
+
+    ensure_ytdlp_available()
+
     import yt_dlp
 
     ydl_opts = {
@@ -50,7 +139,7 @@ def fetch_yt_metadata(url: str) -> YouTubeMetadata:
             raise
         raise YouTubeDownloadError(f"Failed to fetch metadata for {url}: {e}")
 
-    return YouTubeMetadata(
+    meta = YouTubeMetadata(
         video_id=info.get("id", "unknown"),
         title=info.get("title") or "",
         channel=info.get("channel") or info.get("uploader") or "",
@@ -59,3 +148,10 @@ def fetch_yt_metadata(url: str) -> YouTubeMetadata:
         tags=info.get("tags") or [],
         duration=int(info.get("duration") or 0),
     )
+
+    if cache_path is not None:
+        data = asdict(meta)
+        _memo_put(video_id, data)
+        _write_disk_cache(cache_path, data)
+
+    return meta
@@ -1,10 +1,14 @@
 """YTDownloader GUI automation for downloading YouTube videos."""
 
+import functools
+import os
+import re
 import subprocess
+import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from .exceptions import YouTubeDownloadError
 from .logger import get_logger
@@ -13,8 +17,9 @@ logger = get_logger()
 
 # Check for pywinauto
 try:
-    from pywinauto import Application
+    from pywinauto import Application, Desktop
     from pywinauto.keyboard import send_keys
+    from pywinauto.uia_defines import IUIA
     import pyperclip
     PYWINAUTO_AVAILABLE = True
 except ImportError:
@@ -34,6 +39,31 @@ try:
 except ImportError:
     PYAUTOGUI_AVAILABLE = False
 
+# Check for watchdog (file-system events instead of polling for the download)
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+# Check for pywin32 (exclusive-open probe for a finished download)
+try:
+    import pywintypes
+    import win32con
+    import win32file
+    WIN32FILE_AVAILABLE = True
+except ImportError:
+    WIN32FILE_AVAILABLE = False
+
+# Check for comtypes (UIA event subscription; installed alongside pywinauto)
+try:
+    import comtypes
+    import comtypes.client
+    COMTYPES_AVAILABLE = True
+except ImportError:
+    COMTYPES_AVAILABLE = False
+
 
 @dataclass
 class YTDownloadResult:
@@ -42,6 +72,458 @@ class YTDownloadResult:
     title: str
 
 
+# Possible window titles for YTDownloader (Electron app), plus a partial match
+_WINDOW_TITLES = frozenset({"YtDownloader", "ytDownloader", "YTDownloader", "yt Downloader"})
+_WINDOW_TITLE_RE = re.compile(r".*[Yy]t.*[Dd]ownload.*")
+
+
+# UIA property ids (UIAutomationClient.h)
+_UIA_PROCESS_ID_PROPERTY_ID = 30002
+_UIA_NAME_PROPERTY_ID = 30005
+_UIA_NATIVE_WINDOW_HANDLE_PROPERTY_ID = 30020
+
+
+def _top_level_windows(pid: Optional[int] = None) -> List[Tuple[str, int]]:
+    """(name, handle) of every top-level window, fetched in one UIA call.
+
+    A CacheRequest for the two properties makes FindAllBuildCache return
+    them with the elements, so reading them afterwards is local instead of
+    one cross-process COM call per property per window.
+    """
+    uia = IUIA()
+    request = uia.iuia.CreateCacheRequest()
+    request.AddProperty(_UIA_NAME_PROPERTY_ID)
+    request.AddProperty(_UIA_NATIVE_WINDOW_HANDLE_PROPERTY_ID)
+    condition = (
+        uia.iuia.CreatePropertyCondition(_UIA_PROCESS_ID_PROPERTY_ID, pid)
+        if pid else uia.true_condition
+    )
+    elements = uia.root.FindAllBuildCache(uia.tree_scope["children"], condition, request)
+    found = []
+    for i in range(elements.Length):
+        element = elements.GetElement(i)
+        found.append((element.CachedName or "", element.CachedNativeWindowHandle))
+    return found
+
+
+def _desktop_windows(pid: Optional[int] = None) -> List[Tuple[str, int]]:
+    """(name, handle) of every top-level window via pywinauto's Desktop."""
+    desktop = Desktop(backend="uia")
+    windows = desktop.windows(process=pid) if pid else desktop.windows()
+    return [(w.element_info.name or "", w.element_info.handle) for w in windows]
+
+
+def _running_ytdownloader_pid() -> Optional[int]:
+    """PID of a running YTDownloader's main process, or None.
+
+    YTDownloader is an Electron app: its renderer, GPU and utility helpers
+    share the image name but own no top-level window. They are children of
+    the main process, so the match whose parent isn't YTDownloader wins.
+    """
+    if not PSUTIL_AVAILABLE:
+        return None
+    # Only name/ppid are prefetched; proc.info is a plain dict (access errors
+    # become None), and psutil >= 6 reuses cached Process objects across
+    # process_iter() calls
+    parents = {}
+    for proc in psutil.process_iter(['name', 'ppid']):
+        name = proc.info['name']
+        if name and 'ytdownloader' in name.lower():
+            parents[proc.pid] = proc.info['ppid']
+    for pid, ppid in parents.items():
+        if ppid not in parents:
+            return pid
+    return next(iter(parents), None)
+
+
+def _connect_to_window(pid: Optional[int] = None):
+    """Find the YTDownloader top-level window in one pass; return (app, window).
+
+    Names and handles of all top-level windows are fetched together and
+    matched locally, instead of one connect() sweep with its own timeout
+    per candidate title. With ``pid`` only that process's windows are
+    enumerated.
+    """
+    try:
+        windows = _top_level_windows(pid)
+    except Exception as e:
+        logger.debug(f"Cached UIA lookup failed, enumerating windows: {e}")
+        try:
+            windows = _desktop_windows(pid)
+        except Exception as e:
+            logger.debug(f"Could not enumerate windows: {e}")
+            return None, None
+
+    partial = None
+    for name, window_handle in windows:
+        if name in _WINDOW_TITLES:
+            handle = window_handle
+            break
+        if partial is None and _WINDOW_TITLE_RE.match(name):
+            partial = window_handle
+    else:
+        handle = partial
+
+    if not handle:
+        return None, None
+    try:
+        app = Application(backend="uia").connect(handle=handle)
+        return app, app.window(handle=handle)
+    except Exception:
+        return None, None
+
+
+def _wait_for_main_window(timeout: float, retry_interval: float = 0.5):
+    """Retry _connect_to_window() until the window shows up and accepts input.
+
+    Returns (app, window), or (None, None) once ``timeout`` has elapsed.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        app, window = _connect_to_window()
+        remaining = deadline - time.monotonic()
+        if window is not None:
+            try:
+                window.wait("exists visible enabled", timeout=max(remaining, 0.1),
+                            retry_interval=0.2)
+            except Exception as e:
+                logger.debug(f"YTDownloader window not ready yet: {e}")
+            return app, window
+        if remaining <= 0:
+            return None, None
+        time.sleep(min(retry_interval, remaining))
+
+
+# A finished download: at least this big and unchanged for this long
+_MIN_DOWNLOAD_BYTES = 1_000_000
+_STABLE_SECONDS = 2.0
+# Existing files modified this recently count as a (re)download in progress
+_RECENT_SECONDS = 30.0
+# Poll interval: starts short, grows while nothing changes, resets on growth
+_POLL_MIN = 0.5
+_POLL_MAX = 8.0
+_POLL_GROWTH = 1.5
+
+
+def _scan_mp4s(directory: Path) -> Dict[str, Tuple[int, float]]:
+    """Map each .mp4 name in ``directory`` to (size, mtime) with one scandir pass."""
+    found = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".mp4"):
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue  # Removed or renamed mid-scan
+                    found[entry.name] = (st.st_size, st.st_mtime)
+    except OSError:
+        pass  # Directory missing or unreadable
+    return found
+
+
+def _writer_has_closed(path: Path) -> bool:
+    """True if ``path`` can be opened with no sharing, i.e. nothing holds it open.
+
+    An exclusive CreateFile fails with ERROR_SHARING_VIOLATION while the
+    downloader (or its ffmpeg merge step) still has a handle, whatever share
+    mode that handle allows. Without pywin32 this always answers False and
+    the caller falls back to waiting for the size to settle.
+    """
+    if not WIN32FILE_AVAILABLE:
+        return False
+    try:
+        handle = win32file.CreateFile(
+            str(path), win32con.GENERIC_READ, 0, None, win32con.OPEN_EXISTING, 0, None
+        )
+    except pywintypes.error:
+        return False  # Sharing violation (still being written) or gone
+    handle.Close()
+    return True
+
+
+def _snapshot_mp4s(directories: List[Path]) -> Dict[Path, Dict[str, int]]:
+    """Baseline for the download wait: directory -> {.mp4 name: size}."""
+    return {
+        d: {name: size for name, (size, _mtime) in _scan_mp4s(d).items()}
+        for d in directories
+    }
+
+
+class _DownloadWatcher:
+    """Wake the download wait when an .mp4 changes in any watched directory.
+
+    Backed by watchdog (ReadDirectoryChangesW on Windows); use as a context
+    manager and call :meth:`wait` in place of ``time.sleep``.
+    """
+
+    def __init__(self, directories: List[Path]):
+        self._changed = threading.Event()
+        handler = FileSystemEventHandler()
+        handler.on_any_event = self._on_event
+        self._observer = Observer()
+        for d in directories:
+            if d.is_dir():
+                self._observer.schedule(handler, str(d), recursive=False)
+
+    def _on_event(self, event) -> None:
+        path = getattr(event, "dest_path", "") or event.src_path
+        if str(path).endswith(".mp4"):
+            self._changed.set()
+
+    def __enter__(self) -> "_DownloadWatcher":
+        self._observer.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._observer.stop()
+        self._observer.join()
+
+    def wait(self, timeout: float) -> None:
+        """Block until an .mp4 event arrives or ``timeout`` elapses."""
+        self._changed.wait(timeout)
+        self._changed.clear()
+
+
+# UIA constants (UIAutomationClient.h)
+_UIA_WINDOW_OPENED_EVENT_ID = 20016
+_UIA_TREE_SCOPE_SUBTREE = 7
+# Dialog titles YTDownloader uses when a download fails
+_ERROR_TITLE_RE = re.compile(r"(?i)\b(error|failed)\b")
+
+
+class _ErrorWindowWatcher:
+    """Record the first error dialog YTDownloader opens, via UIA events.
+
+    Subscribes to WindowOpened on the desktop root, so UIA calls back the
+    moment a dialog appears instead of the window tree being re-queried on
+    a timer. With ``pid`` only that process's windows count. Inert (the
+    reason stays None) when comtypes or UIAutomationCore is unavailable.
+
+    The subscription lives on a dedicated thread joined to the COM
+    multithreaded apartment: UIA then calls the handler from its own worker
+    threads, whereas a handler registered from the STA main thread only
+    fires while that thread pumps messages, which the download wait never does.
+    """
+
+    def __init__(self, pid: Optional[int] = None):
+        self._pid = pid
+        self._reason: Optional[str] = None
+        self._stop = threading.Event()
+        self._ready = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def reason(self) -> Optional[str]:
+        """Title of the error window seen so far, or None."""
+        return self._reason
+
+    def _on_window_opened(self, sender) -> None:
+        try:
+            if self._pid and sender.CurrentProcessId != self._pid:
+                return
+            name = sender.CurrentName or ""
+        except Exception:
+            return  # Window closed before it could be read
+        if self._reason is None and _ERROR_TITLE_RE.search(name):
+            logger.debug(f"YTDownloader error window opened: {name}")
+            self._reason = name
+
+    def _subscribe(self) -> None:
+        """Thread body: register the handler in the MTA and hold it until exit."""
+        try:
+            comtypes.CoInitializeEx(comtypes.COINIT_MULTITHREADED)
+        except Exception as e:
+            logger.debug(f"UIA event subscription unavailable: {e}")
+            self._ready.set()
+            return
+        try:
+            comtypes.client.GetModule("UIAutomationCore.dll")
+            from comtypes.gen import UIAutomationClient as uia_client
+
+            watcher = self
+
+            class _Handler(comtypes.COMObject):
+                _com_interfaces_ = [uia_client.IUIAutomationEventHandler]
+
+                def IUIAutomationEventHandler_HandleAutomationEvent(self, sender, event_id):
+                    watcher._on_window_opened(sender)
+
+            uia = comtypes.client.CreateObject(
+                uia_client.CUIAutomation, interface=uia_client.IUIAutomation
+            )
+            handler = _Handler()
+            uia.AddAutomationEventHandler(
+                _UIA_WINDOW_OPENED_EVENT_ID,
+                uia.GetRootElement(),
+                _UIA_TREE_SCOPE_SUBTREE,
+                None,
+                handler,
+            )
+            self._ready.set()
+            self._stop.wait()
+            try:
+                uia.RemoveAllEventHandlers()
+            except Exception:
+                pass
+        except Exception as e:
+            logger.debug(f"UIA event subscription unavailable: {e}")
+        finally:
+            self._ready.set()
+            uia = handler = None  # Release the COM references inside the apartment
+            comtypes.CoUninitialize()
+
+    def __enter__(self) -> "_ErrorWindowWatcher":
+        if not COMTYPES_AVAILABLE:
+            return self
+        self._thread = threading.Thread(
+            target=self._subscribe, name="uia-error-watcher", daemon=True
+        )
+        self._thread.start()
+        # Don't start the download wait before the handler is in place
+        self._ready.wait(timeout=10)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+            self._thread = None
+
+
+def _wait_for_new_download(
+    directories: List[Path],
+    existing_files: Dict[Path, Dict[str, int]],
+    timeout: float,
+    abort: Optional[Callable[[], Optional[str]]] = None,
+) -> Optional[Path]:
+    """Wait for a new (or freshly rewritten) .mp4 whose size has settled.
+
+    Uses file-system events when watchdog is installed, otherwise polling.
+    ``abort`` is checked every tick; a non-None reason ends the wait with
+    YouTubeDownloadError.
+    """
+    if WATCHDOG_AVAILABLE:
+        try:
+            with _DownloadWatcher(directories) as watcher:
+                return _poll_for_new_download(
+                    directories, existing_files, timeout, watcher.wait, abort
+                )
+        except OSError as e:
+            logger.debug(f"File watcher unavailable, polling instead: {e}")
+    return _poll_for_new_download(directories, existing_files, timeout, time.sleep, abort)
+
+
+def _poll_for_new_download(
+    directories: List[Path],
+    existing_files: Dict[Path, Dict[str, int]],
+    timeout: float,
+    wait: Callable[[float], None],
+    abort: Optional[Callable[[], Optional[str]]] = None,
+) -> Optional[Path]:
+    """Scan for a settled download, calling ``wait(seconds)`` between scans.
+
+    Each tick stats every candidate once and compares against the previous
+    tick, so no extra sleep is needed to test stability. A file unchanged
+    for one tick that no process holds open counts as done straight away. The interval backs
+    off while nothing grows and snaps back when a download moves; with an
+    event-driven ``wait`` a change ends the interval early.
+
+    ``existing_files`` is the :func:`_snapshot_mp4s` baseline; files are
+    tracked by name per directory and a Path is only built for the winner.
+    """
+    deadline = time.monotonic() + timeout
+    # directory -> name -> (size, monotonic time that size was first seen)
+    last_seen: Dict[Path, Dict[str, Tuple[int, float]]] = {d: {} for d in directories}
+    delay = _POLL_MIN
+
+    while True:
+        reason = abort() if abort is not None else None
+        if reason is not None:
+            raise YouTubeDownloadError("YTDownloader reported an error", reason)
+
+        now = time.monotonic()
+        wall_now = time.time()
+        changed = False
+
+        for d in directories:
+            baseline = existing_files.get(d, {})
+            seen = last_seen[d]
+            for name, (size, mtime) in _scan_mp4s(d).items():
+                if baseline.get(name) == size and wall_now - mtime >= _RECENT_SECONDS:
+                    continue
+
+                previous = seen.get(name)
+                if previous is None or previous[0] != size:
+                    seen[name] = (size, now)
+                    changed = True
+                    logger.debug(
+                        "Download in progress: %s (%.1f MB)", name, size / 1024 / 1024
+                    )
+                elif size > _MIN_DOWNLOAD_BYTES and (
+                    now - previous[1] >= _STABLE_SECONDS or _writer_has_closed(d / name)
+                ):
+                    logger.info(f"Download complete: {name}")
+                    return d / name
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+
+        delay = _POLL_MIN if changed else min(delay * _POLL_GROWTH, _POLL_MAX)
+        wait(min(delay, remaining))
+
+
+def _wait_for_button(window, label: str, timeout: float):
+    """Wait for an enabled, visible button captioned ``label``; return it or None.
+
+    The caption match ignores case and surrounding whitespace. Uses
+    pywinauto's waiter on a single child_window() spec, so each retry is one
+    targeted UIA lookup instead of a sweep over every descendant.
+    """
+    button = window.child_window(
+        title_re=rf"(?i)^\s*{re.escape(label)}\s*$", control_type="Button"
+    )
+    try:
+        return button.wait("exists visible enabled", timeout=timeout, retry_interval=0.2)
+    except Exception:
+        logger.debug(f"{label} button not exposed via UIA")
+        return None
+
+
+# Machine-wide install; per-user installs go under %LOCALAPPDATA%\Programs
+_DEFAULT_EXE = Path(r"C:\Program Files\YTDownloader\YTDownloader.exe")
+_EXE_ENV_VAR = "YT_DOWNLOADER_EXE"
+
+
+@functools.lru_cache(maxsize=1)
+def find_ytdownloader_exe() -> Optional[Path]:
+    """
+    Locate YTDownloader.exe, cheapest source first.
+
+    Checks the YT_DOWNLOADER_EXE environment variable, then the executable
+    of an already running YTDownloader process, and only then stats the
+    default install locations. The answer is cached for the process.
+
+    Returns:
+        Path to the executable if found, None otherwise
+    """
+    env = os.environ.get(_EXE_ENV_VAR)
+    if env and Path(env).is_file():
+        return Path(env)
+
+    if PSUTIL_AVAILABLE:
+        for proc in psutil.process_iter(['name', 'exe']):
+            name, exe = proc.info['name'], proc.info['exe']
+            if name and exe and 'ytdownloader' in name.lower():
+                return Path(exe)
+
+    candidates = [_DEFAULT_EXE]
+    local_appdata = os.environ.get("LOCALAPPDATA")
+    if local_appdata:
+        candidates.append(Path(local_appdata) / "Programs" / "ytdownloader" / "YTDownloader.exe")
+    return next((path for path in candidates if path.is_file()), None)
+
+
 def download_with_ytdownloader(
     url: str,
     output_dir: Path,
@@ -54,7 +536,7 @@ def download_with_ytdownloader(
     Args:
         url: YouTube video URL
         output_dir: Directory to save the downloaded video
-        exe_path: Path to YTDownloader.exe (default: C:\\Program Files\\YTDownloader\\YTDownloader.exe)
+        exe_path: Path to YTDownloader.exe (default: find_ytdownloader_exe())
         timeout: Maximum time to wait for download in seconds
 
     Returns:
@@ -69,11 +551,14 @@ def download_with_ytdownloader(
             "Install with: pip install pywinauto pyperclip"
         )
 
-    # Default exe path
     if exe_path is None:
-        exe_path = Path(r"C:\Program Files\YTDownloader\YTDownloader.exe")
-
-    if not exe_path.exists():
+        exe_path = find_ytdownloader_exe()
+        if exe_path is None:
+            raise YouTubeDownloadError(
+                "YTDownloader not found",
+                f"Expected at: {_DEFAULT_EXE} (or set {_EXE_ENV_VAR})"
+            )
+    elif not exe_path.exists():
         raise YouTubeDownloadError(
             "YTDownloader not found",
             f"Expected at: {exe_path}"
@@ -96,67 +581,40 @@ def download_with_ytdownloader(
             for entry in history:
                 if entry.get('url') == url:
                     file_path = Path(entry.get('filePath', ''))
-                    if file_path.exists() and file_path.stat().st_size > 1000000:
+                    try:
+                        size = file_path.stat().st_size  # one stat, not exists() + stat()
+                    except OSError:
+                        continue
+                    if size > _MIN_DOWNLOAD_BYTES:
                         logger.info(f"Video already downloaded: {file_path.name}")
                         return YTDownloadResult(
                             video_path=file_path,
                             title=file_path.stem
                         )
         except Exception as e:
-            logger.debug(f"Could not check download history: {e}")
+            logger.debug("Could not check download history: %s", e)
 
     logger.info(f"Starting YTDownloader from: {exe_path}")
 
     # Get existing mp4 files before download
     possible_dirs = [output_dir, downloads_dir]
-    existing_files = {}
-    for d in possible_dirs:
-        if d.exists():
-            existing_files[d] = set(d.glob("*.mp4"))
+    existing_files = _snapshot_mp4s(possible_dirs)
 
     # Copy URL to clipboard
     pyperclip.copy(url)
     logger.info("Copied URL to clipboard")
 
     # Check if YTDownloader is already running
-    existing_process = None
-    if PSUTIL_AVAILABLE:
-        for proc in psutil.process_iter(['pid', 'name']):
-            try:
-                if proc.info['name'] and 'YTDownloader' in proc.info['name']:
-                    existing_process = proc.info['pid']
-                    logger.info(f"Found existing YTDownloader instance (PID: {existing_process})")
-                    break
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
-
-    # Possible window titles for YTDownloader (Electron app)
-    possible_titles = ['YtDownloader', 'ytDownloader', 'YTDownloader', 'yt Downloader']
-
-    def try_connect():
-        """Try to connect to an existing YTDownloader window."""
-        for title in possible_titles:
-            try:
-                app = Application(backend="uia").connect(title=title, timeout=3)
-                main_window = app.window(title=title)
-                return app, main_window
-            except Exception:
-                continue
-        # Also try title_re pattern for partial match
-        try:
-            app = Application(backend="uia").connect(title_re='.*[Yy]t.*[Dd]ownload.*', timeout=3)
-            windows = app.windows()
-            if windows:
-                return app, windows[0]
-        except Exception:
-            pass
-        return None, None
-
+    existing_process = _running_ytdownloader_pid()
     app, main_window = None, None
 
     if existing_process:
+        logger.info(f"Found existing YTDownloader instance (PID: {existing_process})")
         # Try to connect to existing process
-        app, main_window = try_connect()
+        app, main_window = _connect_to_window(existing_process)
+        if not main_window:
+            # The PID may still be a window-less helper; match by title instead
+            app, main_window = _connect_to_window()
         if main_window:
             main_window.set_focus()
             time.sleep(0.5)
@@ -165,15 +623,9 @@ def download_with_ytdownloader(
         # Launch YTDownloader using explorer.exe (simulates double-click, works for Electron apps)
         logger.info("Launching YTDownloader.exe...")
         subprocess.Popen(['explorer.exe', str(exe_path)])
-        time.sleep(8)  # Wait for Electron app to start
 
-        # Try to connect
-        app, main_window = try_connect()
-
-        if not main_window:
-            # Wait a bit more and try again
-            time.sleep(5)
-            app, main_window = try_connect()
+        # Returns as soon as the window is usable instead of a fixed 8s + 5s
+        app, main_window = _wait_for_main_window(timeout=15)
 
         if not main_window:
             raise YouTubeDownloadError(
@@ -191,13 +643,19 @@ def download_with_ytdownloader(
         logger.info("Pasting URL with Ctrl+V...")
         send_keys('^v')  # Ctrl+V
 
-        # Wait for video info to load
+        # Wait for video info to load: a targeted UIA query for the Download
+        # button returns as soon as it is ready (the old fixed 8s sleep is the
+        # worst case when the button is never exposed)
         logger.info("Waiting for video info to load...")
-        time.sleep(8)  # Give time for the video info dialog to appear
+        download_button = _wait_for_button(main_window, "Download", timeout=8)
 
-        # Click the Download button using pyautogui (Electron apps don't expose internal controls via UIA)
         logger.info("Clicking Download button...")
-        if PYAUTOGUI_AVAILABLE:
+        if download_button is not None:
+            download_button.click_input()
+            logger.info("Clicked Download button")
+        elif PYAUTOGUI_AVAILABLE:
+            # Electron builds that don't expose internal controls via UIA:
+            # click around where the button is drawn
             rect = main_window.rectangle()
             center_x = (rect.left + rect.right) // 2
 
@@ -222,55 +680,14 @@ def download_with_ytdownloader(
         # Wait for download to complete
         logger.info(f"Waiting for download to complete (timeout: {timeout}s)...")
 
-        download_start = time.time()
-        new_file = None
-
-        while time.time() - download_start < timeout:
-            # Check for new mp4 files
-            for d in possible_dirs:
-                if not d.exists():
-                    continue
-                current_files = set(d.glob("*.mp4"))
-                new_files = current_files - existing_files.get(d, set())
-
-                if new_files:
-                    # Check if file is still being written
-                    potential_file = list(new_files)[0]
-                    try:
-                        size1 = potential_file.stat().st_size
-                        time.sleep(2)
-                        size2 = potential_file.stat().st_size
-
-                        if size1 == size2 and size1 > 1000000:  # At least 1MB and stable
-                            new_file = potential_file
-                            logger.info(f"Download complete: {new_file.name}")
-                            break
-                        else:
-                            logger.debug(f"Download in progress: {potential_file.name} ({size2/1024/1024:.1f} MB)")
-                    except:
-                        pass
-
-                # Also check for recently modified files
-                for f in d.glob("*.mp4"):
-                    try:
-                        if time.time() - f.stat().st_mtime < 30:  # Modified in last 30 seconds
-                            size1 = f.stat().st_size
-                            time.sleep(2)
-                            size2 = f.stat().st_size
-                            if size1 == size2 and size1 > 1000000:
-                                new_file = f
-                                logger.info(f"Download complete: {new_file.name}")
-                                break
-                    except:
-                        pass
-
-                if new_file:
-                    break
-
-            if new_file:
-                break
-
-            time.sleep(3)
+        try:
+            pid = main_window.element_info.process_id
+        except Exception:
+            pid = existing_process
+        with _ErrorWindowWatcher(pid) as error_watcher:
+            new_file = _wait_for_new_download(
+                possible_dirs, existing_files, timeout, abort=error_watcher.reason
+            )
 
         if new_file is None:
             raise YouTubeDownloadError(
@@ -287,7 +704,8 @@ def download_with_ytdownloader(
                 new_file = dest
                 logger.info(f"Moved to: {dest}")
 
-        logger.info(f"Downloaded: {new_file.name} ({new_file.stat().st_size/1024/1024:.1f} MB)")
+        size_mb = new_file.stat().st_size / 1024 / 1024
+        logger.info(f"Downloaded: {new_file.name} ({size_mb:.1f} MB)")
 
         return YTDownloadResult(
             video_path=new_file,
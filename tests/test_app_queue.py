@@ -0,0 +1,76 @@
+"""Unit tests for yt_audio_filter.app.state.queue."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from yt_audio_filter.app.state import queue as queue_mod
+from yt_audio_filter.app.state.queue import QueueManager, QueueStatus
+
+
+@pytest.fixture
+def manager(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> QueueManager:
+    monkeypatch.setattr(queue_mod, "QUEUE_FILE", tmp_path / "data" / "queue.json")
+    return QueueManager()
+
+
+def test_save_writes_queue_file_atomically(manager: QueueManager, tmp_path: Path) -> None:
+    manager.add("https://www.youtube.com/watch?v=abcdefghijk", "One")
+    path = tmp_path / "data" / "queue.json"
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert [d["title"] for d in data] == ["One"]
+    assert not (tmp_path / "data" / "queue.json.tmp").exists()
+
+
+def test_claim_pending_batch_flips_status_and_respects_limit(manager: QueueManager) -> None:
+    for i in range(3):
+        manager.add(f"https://www.youtube.com/watch?v=video{i:06d}", f"T{i}")
+
+    claimed = manager.claim_pending_batch(2)
+
+    assert [item.title for item in claimed] == ["T0", "T1"]
+    assert all(item.status == QueueStatus.PROCESSING for item in claimed)
+    assert [item.title for item in manager.get_pending()] == ["T2"]
+
+
+def test_claim_pending_batch_never_returns_same_item_twice(manager: QueueManager) -> None:
+    manager.add("https://www.youtube.com/watch?v=abcdefghijk", "Only")
+
+    first = manager.claim_pending_batch(2)
+    second = manager.claim_pending_batch(2)
+
+    assert len(first) == 1
+    assert second == []
+
+
+def test_add_and_add_batch_derive_thumbnail_from_url(manager: QueueManager) -> None:
+    item = manager.add("https://www.youtube.com/watch?v=abcdefghijk&t=5", "One")
+    batch = manager.add_batch(
+        [
+            {"url": "https://youtu.be/ABCDEFGHIJK", "title": "Two"},
+            {"url": "https://example.com/video", "title": "Three"},
+        ]
+    )
+    assert item.thumbnail_url == "https://i.ytimg.com/vi/abcdefghijk/hqdefault.jpg"
+    assert batch[0].thumbnail_url == "https://i.ytimg.com/vi/ABCDEFGHIJK/hqdefault.jpg"
+    assert batch[1].thumbnail_url == ""
+
+
+def test_update_status_skips_save_when_nothing_changed(
+    manager: QueueManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    item = manager.add("https://www.youtube.com/watch?v=abcdefghijk", "One")
+    manager.update_status(item.id, QueueStatus.PROCESSING, progress=40, current_stage="Isolate")
+
+    saves = []
+    monkeypatch.setattr(manager, "_save", lambda durable=True: saves.append(durable))
+    manager.update_status(item.id, QueueStatus.PROCESSING, progress=40, current_stage="Isolate")
+    assert saves == []
+
+    manager.update_status(item.id, QueueStatus.PROCESSING, progress=41)
+    assert saves == [False]  # progress tick: replaced, not fsynced
+
+    manager.update_status(item.id, QueueStatus.PROCESSING, progress=42, current_stage="Remux")
+    manager.update_status(item.id, QueueStatus.COMPLETED, progress=100)
+    assert saves == [False, True, True]
@@ -241,8 +241,9 @@ def test_build_ayah_audio_orchestration(tmp_path: Path) -> None:
 
     # Each ayah is downloaded once per range invocation. Range A downloads
     # 1:1 and 1:2 once; range B downloads 112:1 once. Even though the
-    # block repeats 3x, we don't redundant-download.
-    assert download_calls == [
+    # block repeats 3x, we don't redundant-download. Downloads run
+    # concurrently, so only the set of calls is deterministic.
+    assert sorted(download_calls) == [
         ("alafasy", 1, 1),
         ("alafasy", 1, 2),
         ("alafasy", 112, 1),
@@ -0,0 +1,74 @@
+"""Unit tests for argument handling in yt_audio_filter.cli."""
+
+from pathlib import Path
+
+import pytest
+
+from yt_audio_filter import cli
+
+
+def test_parse_args_resolves_relative_paths_per_call(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+
+    monkeypatch.chdir(tmp_path / "a")
+    first = cli.parse_args(["video.mp4", "-o", "out.mp4"])
+    first.extra = "mutated by an earlier run"
+    monkeypatch.chdir(tmp_path / "b")
+    second = cli.parse_args(["video.mp4", "-o", "out.mp4"])
+
+    assert second is not first
+    assert second.input == tmp_path / "b" / "video.mp4"
+    assert second.output == tmp_path / "b" / "out.mp4"
+    assert not hasattr(second, "extra")
+
+
+def test_ensure_dir_recreates_a_deleted_directory(tmp_path: Path) -> None:
+    target = tmp_path / "output"
+
+    cli._ensure_dir(target)
+    target.rmdir()  # e.g. removed by the app's cleanup
+    cli._ensure_dir(target)
+
+    assert target.is_dir()
+
+
+def test_local_youtube_url_check_matches_youtube_module() -> None:
+    from yt_audio_filter import url_patterns, youtube
+    from yt_audio_filter.youtube import is_youtube_url
+
+    assert youtube.YOUTUBE_PATTERNS is url_patterns.YOUTUBE_PATTERNS
+
+    for value in (
+        "https://www.youtube.com/watch?v=jNQXAC9IVRw",
+        "youtu.be/jNQXAC9IVRw",
+        "https://m.youtube.com/watch?v=jNQXAC9IVRw",
+        "HTTPS://YOUTUBE.COM/shorts/abc",
+        "  https://youtu.be/x  ",
+        "https://m.youtube.com/shorts/abc",
+        "https://youtube.com/playlist?list=PL1",
+        "video.mp4",
+        "my_youtube_clip.mp4",
+    ):
+        assert cli._is_youtube_url(value) == is_youtube_url(value), value
+
+
+def test_package_import_defers_submodules() -> None:
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, yt_audio_filter.cli; "
+        "print(sorted(m for m in ('yt_audio_filter.youtube', 'yt_audio_filter.ffmpeg_path') "
+        "if m in sys.modules))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert out.stdout.strip() == "[]"
+
+
+def test_skip_speech_only_flag_defaults_off() -> None:
+    assert cli.parse_args(["video.mp4"]).skip_speech_only is False
+    assert cli.parse_args(["video.mp4", "--skip-speech-only"]).skip_speech_only is True
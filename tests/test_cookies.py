@@ -0,0 +1,193 @@
+"""Unit tests for the Netscape cookie writers."""
+
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+from yt_audio_filter.cookie_extractor import write_netscape_cookies
+from yt_audio_filter.cookie_refresh import cookies_to_netscape
+
+COOKIES = [
+    {"domain": ".youtube.com", "path": "/", "secure": True, "expires": 1700000000.5,
+     "name": "YSC", "value": "abc"},
+    {"domain": "accounts.google.com", "name": "SID", "value": "xyz"},
+]
+
+
+def test_write_netscape_cookies_formats_lines(tmp_path: Path) -> None:
+    out = tmp_path / "cookies.txt"
+    write_netscape_cookies(COOKIES, out)
+
+    lines = out.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "# Netscape HTTP Cookie File"
+    assert lines[3] == ".youtube.com\tTRUE\t/\tTRUE\t1700000000\tYSC\tabc"
+    assert lines[4] == "accounts.google.com\tFALSE\t/\tFALSE\t0\tSID\txyz"
+
+
+def test_cookies_to_netscape_gives_session_cookies_future_expiry() -> None:
+    text = cookies_to_netscape([{"domain": ".youtube.com", "name": "a", "value": "b"}])
+
+    fields = text.splitlines()[-1].split("\t")
+    assert fields[0] == ".youtube.com"
+    assert int(fields[4]) > 1700000000
+    assert text.endswith("\n")
+
+
+def test_write_netscape_cookies_keeps_only_youtube_domains(tmp_path: Path) -> None:
+    out = tmp_path / "cookies.txt"
+    cookies = COOKIES + [
+        {"domain": ".doubleclick.net", "name": "IDE", "value": "1"},
+        {"domain": "youtube.com.evil.example", "name": "X", "value": "1"},
+        {"domain": "rr1.googlevideo.com", "name": "Y", "value": "1"},
+    ]
+    write_netscape_cookies(cookies, out)
+
+    names = [line.split("\t")[5] for line in out.read_text().splitlines()[3:]]
+    assert names == ["YSC", "SID", "Y"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permission bits")
+def test_write_netscape_cookies_is_owner_only(tmp_path: Path) -> None:
+    out = tmp_path / "cookies.txt"
+    out.write_text("stale")
+    out.chmod(0o644)
+
+    write_netscape_cookies(COOKIES, out)
+
+    assert stat.S_IMODE(out.stat().st_mode) == 0o600
+    assert "stale" not in out.read_text()
+
+
+def test_browser_pool_closes_each_event_loops_browser(monkeypatch: pytest.MonkeyPatch) -> None:
+    import asyncio
+    import types
+
+    from yt_audio_filter import cookie_extractor
+
+    events = []
+
+    class _Browser:
+        def __init__(self, n: int) -> None:
+            self.n = n
+
+        def is_connected(self) -> bool:
+            return True
+
+        async def close(self) -> None:
+            events.append(("close", self.n))
+
+    class _Playwright:
+        def __init__(self) -> None:
+            self.chromium = self
+
+        async def launch(self, **kwargs):
+            return _Browser(len(events))
+
+        async def stop(self) -> None:
+            events.append(("stop",))
+
+    class _Starter:
+        async def start(self):
+            events.append(("start",))
+            return _Playwright()
+
+    fake = types.ModuleType("playwright.async_api")
+    fake.async_playwright = _Starter
+    monkeypatch.setitem(sys.modules, "playwright", types.ModuleType("playwright"))
+    monkeypatch.setitem(sys.modules, "playwright.async_api", fake)
+    pool = cookie_extractor._PlaywrightPool()
+
+    async def use_twice():
+        first = await pool.get_browser()
+        assert await pool.get_browser() is first  # shared within the loop
+
+    asyncio.run(use_twice())
+    asyncio.run(use_twice())
+
+    assert events == [("start",), ("close", 1), ("stop",), ("start",), ("close", 4), ("stop",)]
+    assert pool._by_loop == {}
+
+
+def test_refresh_replaces_corrupt_state_and_saves_it_owner_only(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import asyncio
+    import json
+    import types
+
+    from yt_audio_filter import cookie_refresh
+
+    state_path = tmp_path / "yt_state.json"
+    state_path.write_text('{"cookies": [', encoding="utf-8")  # truncated write
+    contexts = []
+
+    class _Page:
+        url = "https://www.youtube.com/"
+
+        async def goto(self, *args, **kwargs) -> None:
+            pass
+
+        async def wait_for_selector(self, *args, **kwargs) -> None:
+            pass
+
+        async def query_selector(self, selector):
+            return object()
+
+        async def fill(self, *args) -> None:
+            pass
+
+        async def click(self, *args) -> None:
+            pass
+
+        async def wait_for_timeout(self, ms) -> None:
+            pass
+
+    class _Context:
+        async def route(self, *args) -> None:
+            pass
+
+        async def new_page(self):
+            return _Page()
+
+        async def cookies(self):
+            return COOKIES
+
+        async def storage_state(self, path=None):
+            assert path is None  # written by us, not by Playwright
+            return {"cookies": COOKIES, "origins": []}
+
+    class _Browser:
+        async def new_context(self, **kwargs):
+            contexts.append(kwargs)
+            return _Context()
+
+        async def close(self) -> None:
+            pass
+
+    class _Playwright:
+        async def __aenter__(self):
+            return types.SimpleNamespace(chromium=self)
+
+        async def __aexit__(self, *exc) -> None:
+            pass
+
+        async def launch(self, headless):
+            return _Browser()
+
+    fake = types.ModuleType("playwright.async_api")
+    fake.async_playwright = _Playwright
+    monkeypatch.setitem(sys.modules, "playwright", types.ModuleType("playwright"))
+    monkeypatch.setitem(sys.modules, "playwright.async_api", fake)
+
+    ok = asyncio.run(
+        cookie_refresh.refresh_youtube_cookies(
+            "me@example.com", "pw", tmp_path / "cookies.txt", state_path=state_path
+        )
+    )
+
+    assert ok
+    assert contexts[0]["storage_state"] is None
+    assert json.loads(state_path.read_text(encoding="utf-8"))["origins"] == []
+    assert stat.S_IMODE(state_path.stat().st_mode) == 0o600
@@ -0,0 +1,210 @@
+"""Unit tests for the speech pre-screen in yt_audio_filter.demucs_processor."""
+
+import io
+import threading
+import types
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sf = pytest.importorskip("soundfile")
+demucs_processor = pytest.importorskip("yt_audio_filter.demucs_processor")
+
+SR = 16000
+
+
+def _speech_like() -> np.ndarray:
+    """Voice-band tones broken up by pauses, like spoken phrases."""
+    t = np.arange(SR * 4) / SR
+    audio = np.zeros_like(t, dtype=np.float32)
+    for k in range(4):
+        seg = slice(k * SR, int((k + 0.7) * SR))
+        audio[seg] = 0.3 * np.sin(2 * np.pi * (700 + 100 * k) * t[seg])
+    return audio
+
+
+def _music_like() -> np.ndarray:
+    """Continuous bass + treble bed with no pauses."""
+    t = np.arange(SR * 4) / SR
+    return (0.3 * np.sin(2 * np.pi * 110 * t) + 0.1 * np.sin(2 * np.pi * 5000 * t)).astype(
+        np.float32
+    )
+
+
+def test_speech_ratio_separates_speech_from_music() -> None:
+    assert demucs_processor._speech_ratio(_speech_like(), SR) >= demucs_processor.SPEECH_ONLY_RATIO
+    assert demucs_processor._speech_ratio(_music_like(), SR) < 0.5
+    mixed = _speech_like() + _music_like()
+    assert demucs_processor._speech_ratio(np.stack([mixed, mixed], axis=1), SR) < 0.5
+
+
+def test_isolate_vocals_skips_model_for_speech_only(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    src = tmp_path / "in.wav"
+    out = tmp_path / "out.wav"
+    sf.write(str(src), _speech_like(), SR)
+
+    def _no_model(*args, **kwargs):
+        raise AssertionError("Demucs model should not be loaded")
+
+    monkeypatch.setattr(demucs_processor, "_load_model", _no_model)
+    result = demucs_processor.isolate_vocals(src, out, device="cpu", skip_when_vocals_only=True)
+
+    assert result == out
+    data, rate = sf.read(str(out))
+    assert rate == SR
+    assert len(data) == SR * 4
+
+
+def test_separate_vocals_passes_speech_only_pcm_through(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def _no_model(*args, **kwargs):
+        raise AssertionError("Demucs model should not be loaded")
+
+    monkeypatch.setattr(demucs_processor, "_load_model", _no_model)
+    pcm = (np.stack([_speech_like()] * 2) * 32767).astype(np.int16)
+
+    vocals, rate = demucs_processor.separate_vocals(
+        pcm, SR, device="cpu", skip_when_vocals_only=True
+    )
+
+    assert rate == SR
+    np.testing.assert_array_equal(vocals, pcm)
+
+
+def test_read_audio_channels_first_matches_soundfile(tmp_path: Path) -> None:
+    src = tmp_path / "stereo.wav"
+    rng = np.random.default_rng(0)
+    data = rng.uniform(-0.5, 0.5, size=(5000, 2)).astype(np.float32)
+    sf.write(str(src), data, SR, subtype="FLOAT")
+
+    out, rate = demucs_processor._read_audio_channels_first(src, blocksize=1024)
+
+    assert rate == SR
+    assert out.shape == (2, 5000)
+    assert out.flags["C_CONTIGUOUS"]
+    np.testing.assert_array_equal(out, data.T)
+
+
+def test_progress_capture_tqdm_throttles_callbacks(monkeypatch: pytest.MonkeyPatch) -> None:
+    reports = []
+    monkeypatch.setattr(
+        demucs_processor._progress_state, "callback", reports.append, raising=False
+    )
+
+    bar = demucs_processor.ProgressCaptureTqdm(total=1000, file=io.StringIO())
+    for _ in range(1000):
+        bar.update(1)
+
+    # All 1000 ticks land inside one throttle window except the forced final one
+    assert [r["percent"] for r in reports] == [0, 100]
+
+
+def test_separate_vocals_is_safe_to_run_concurrently(monkeypatch: pytest.MonkeyPatch) -> None:
+    torch = pytest.importorskip("torch")
+    tqdm_module = types.SimpleNamespace(tqdm=object())
+    original = tqdm_module.tqdm
+    both_running = threading.Barrier(2, timeout=5)
+
+    class _FakeModel:
+        samplerate = SR
+        sources = ["drums", "bass", "other", "vocals"]
+
+    def fake_apply_model(model, mix, device, progress, shifts):
+        both_running.wait()  # both threads are inside the patch now
+        for _ in tqdm_module.tqdm(range(10), file=io.StringIO()):
+            pass
+        both_running.wait()
+        return torch.zeros((1, 4) + tuple(mix.shape[1:]))
+
+    demucs_apply = types.SimpleNamespace(tqdm=tqdm_module)
+    monkeypatch.setattr(
+        demucs_processor, "_get_demucs_apply", lambda: (fake_apply_model, demucs_apply)
+    )
+    monkeypatch.setattr(demucs_processor, "_load_model", lambda *args, **kwargs: _FakeModel())
+
+    reports = {"a": [], "b": []}
+    errors = []
+
+    def run(name: str) -> None:
+        try:
+            demucs_processor.separate_vocals(
+                np.zeros((2, SR), dtype=np.float32), SR, device="cpu",
+                progress_callback=reports[name].append if name == "a" else None,
+            )
+        except Exception as e:  # pragma: no cover - surfaced below
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(name,)) for name in reports]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert tqdm_module.tqdm is original
+    assert reports["a"] and reports["a"][-1]["percent"] == 100
+    assert reports["b"] == []
+
+
+def test_separate_vocals_scales_int16_pcm_to_float(monkeypatch: pytest.MonkeyPatch) -> None:
+    torch = pytest.importorskip("torch")
+    seen = []
+
+    class _FakeModel:
+        samplerate = SR
+        sources = ["drums", "bass", "other", "vocals"]
+
+    def fake_apply_model(model, mix, device, progress, shifts):
+        seen.append(mix)
+        return torch.zeros((1, 4) + tuple(mix.shape[1:]))
+
+    demucs_apply = types.SimpleNamespace(tqdm=types.SimpleNamespace(tqdm=object()))
+    monkeypatch.setattr(
+        demucs_processor, "_get_demucs_apply", lambda: (fake_apply_model, demucs_apply)
+    )
+    monkeypatch.setattr(demucs_processor, "_load_model", lambda *args, **kwargs: _FakeModel())
+
+    interleaved = np.array([[16384, -32768], [0, 8192]], dtype=np.int16)
+    demucs_processor.separate_vocals(interleaved.T, SR, device="cpu")
+
+    assert seen[0].dtype == torch.float32
+    np.testing.assert_allclose(seen[0][0].numpy(), [[0.5, 0.0], [-1.0, 0.25]])
+
+
+def test_model_cache_evicts_least_recently_used(monkeypatch: pytest.MonkeyPatch) -> None:
+    pretrained = pytest.importorskip("demucs.pretrained")
+
+    class _FakeModel:
+        samplerate = 44100
+
+        def __init__(self, name: str) -> None:
+            self.name = name
+            self.on_cpu = False
+
+        def to(self, device):
+            return self
+
+        def eval(self):
+            return self
+
+        def cpu(self):
+            self.on_cpu = True
+            return self
+
+    monkeypatch.setattr(pretrained, "get_model", _FakeModel)
+    demucs_processor.clear_model_cache()
+    cpu = demucs_processor.get_device("cpu")
+
+    a = demucs_processor._load_model("a", cpu)
+    demucs_processor._load_model("b", cpu)
+    assert demucs_processor._load_model("a", cpu) is a  # refreshes "a"
+    demucs_processor._load_model("c", cpu)
+
+    names = [key[0] for key in demucs_processor._model_cache]
+    assert names == ["a", "c"]
+    assert not a.on_cpu
+    demucs_processor.clear_model_cache()
@@ -76,7 +76,7 @@ def test_metadata_failure_does_not_break_download(tmp_path: Path) -> None:
     to-have."""
     out = tmp_path / "cache"
     out.mkdir()
-    # 11-char video id so ``extract_video_id``'s regex fallback can
+    # 11-char video id so ``extract_video_id``'s offline regex can
     # parse it without yt-dlp lookup (which would itself fail in the
     # test env on a junk id).
     fake_file = out / "video_xyz12345abc.mp4"
@@ -5,9 +5,19 @@ from __future__ import annotations
 
 from unittest.mock import patch
 
+import pytest
+
 from yt_audio_filter.ffmpeg import check_cuda_filters_available
 
 
+@pytest.fixture(autouse=True)
+def _fresh_probe():
+    """The probe is memoized per process; each test sees a fresh one."""
+    check_cuda_filters_available.cache_clear()
+    yield
+    check_cuda_filters_available.cache_clear()
+
+
 class _FakeResult:
     def __init__(self, stdout: str = "", stderr: str = "") -> None:
         self.stdout = stdout
@@ -86,3 +96,15 @@ def test_cuda_filters_returns_false_on_subprocess_error() -> None:
 
     with patch("subprocess.run", side_effect=fake_run):
         assert check_cuda_filters_available() is False
+
+
+def test_cuda_filters_probe_runs_once_per_process() -> None:
+    def fake_run(cmd, *args, **kwargs):
+        if "-filters" in cmd:
+            return _FakeResult(stdout="scale_cuda overlay_cuda hwupload_cuda")
+        return _FakeResult(stdout="Hardware acceleration methods:\ncuda\n")
+
+    with patch("subprocess.run", side_effect=fake_run) as run:
+        assert check_cuda_filters_available() is True
+        assert check_cuda_filters_available() is True
+    assert run.call_count == 2  # -filters and -hwaccels, once
@@ -0,0 +1,71 @@
+"""Unit tests for bundled FFmpeg discovery in yt_audio_filter.ffmpeg_path."""
+
+from pathlib import Path
+
+import pytest
+
+from yt_audio_filter import ffmpeg_path
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    ffmpeg_path.find_bundled_ffmpeg.cache_clear()
+    yield
+    ffmpeg_path.find_bundled_ffmpeg.cache_clear()
+
+
+def test_find_bundled_ffmpeg_returns_first_dir_with_executable(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    empty = tmp_path / "empty"
+    empty.mkdir()
+    (empty / "ffprobe").write_bytes(b"")
+    bundled = tmp_path / "bin"
+    bundled.mkdir()
+    (bundled / "ffmpeg.exe").write_bytes(b"")
+    monkeypatch.setattr(
+        ffmpeg_path, "_BUNDLED_FFMPEG_DIRS", (tmp_path / "missing", empty, bundled)
+    )
+
+    assert ffmpeg_path.find_bundled_ffmpeg() == bundled
+    (bundled / "ffmpeg.exe").unlink()
+    assert ffmpeg_path.find_bundled_ffmpeg() == bundled  # cached
+
+
+def test_find_bundled_ffmpeg_none_when_absent(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(ffmpeg_path, "_BUNDLED_FFMPEG_DIRS", (tmp_path,))
+    assert ffmpeg_path.find_bundled_ffmpeg() is None
+
+
+def test_which_retries_a_miss_and_caches_a_hit(monkeypatch: pytest.MonkeyPatch) -> None:
+    from yt_audio_filter import ffmpeg
+
+    installed = {}
+    lookups = []
+
+    def fake_which(name):
+        lookups.append(name)
+        return installed.get(name)
+
+    monkeypatch.setattr(ffmpeg_path.shutil, "which", fake_which)
+    monkeypatch.setattr(ffmpeg_path, "_BUNDLED_FFMPEG_DIRS", ())
+    monkeypatch.setattr(ffmpeg_path, "_setup_done", False)
+    monkeypatch.setattr(ffmpeg_path, "_which_cache", {})
+    monkeypatch.setattr(ffmpeg, "_ffmpeg_found", False)
+    monkeypatch.setattr(
+        ffmpeg.subprocess, "run", lambda *a, **k: (_ for _ in ()).throw(FileNotFoundError())
+    )
+
+    assert ffmpeg_path.get_ffmpeg_path() is None
+    assert ffmpeg.check_ffmpeg_available() is False
+
+    installed["ffmpeg"] = "/usr/bin/ffmpeg"
+    assert ffmpeg.check_ffmpeg_available() is True
+    assert ffmpeg_path.get_ffmpeg_path() == Path("/usr/bin/ffmpeg")
+
+    lookups.clear()
+    assert ffmpeg.check_ffmpeg_available() is True
+    assert ffmpeg_path.get_ffmpeg_path() == Path("/usr/bin/ffmpeg")
+    assert lookups == []
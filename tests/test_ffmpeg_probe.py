@@ -0,0 +1,491 @@
+"""Unit tests for ``yt_audio_filter.ffmpeg``: the cached ffprobe behind
+``get_audio_info`` / ``get_video_duration`` and the chunk/segment helpers."""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from yt_audio_filter import ffmpeg
+from yt_audio_filter.exceptions import FFmpegError
+
+PROBE_OUT = json.dumps(
+    {
+        "streams": [
+            {"codec_type": "video", "codec_name": "h264"},
+            {"codec_type": "audio", "codec_name": "aac", "sample_rate": "48000", "channels": 2},
+        ],
+        "format": {"duration": "12.5"},
+    }
+)
+
+
+_REAL_EXECUTABLE = ffmpeg._executable
+
+
+class _FakeResult:
+    def __init__(self, stdout: str = "", stderr: str = "", returncode: int = 0) -> None:
+        self.stdout = stdout
+        self.stderr = stderr
+        self.returncode = returncode
+
+
+@pytest.fixture(autouse=True)
+def _clear_probe_cache(monkeypatch: pytest.MonkeyPatch):
+    # Exercise the ffprobe path even where PyAV happens to be installed, and
+    # keep bare executable names in commands where FFmpeg is on PATH
+    monkeypatch.setattr(ffmpeg, "_import_av", lambda: None)
+    monkeypatch.setattr(ffmpeg, "_executable", lambda name: name)
+    ffmpeg._probe_cached.cache_clear()
+    yield
+    ffmpeg._probe_cached.cache_clear()
+
+
+def test_audio_info_and_duration_share_one_ffprobe(tmp_path: Path) -> None:
+    video = tmp_path / "in.mp4"
+    video.write_bytes(b"x")
+
+    with patch("subprocess.run", return_value=_FakeResult(PROBE_OUT.encode())) as run:
+        info = ffmpeg.get_audio_info(video)
+        duration = ffmpeg.get_video_duration(video)
+        ffmpeg.get_audio_info(video)
+
+    assert run.call_count == 1
+    assert "text" not in run.call_args.kwargs
+    assert info == {"sample_rate": 48000, "channels": 2, "codec": "aac", "duration": 12.5}
+    assert duration == 12.5
+
+
+def test_modified_file_is_probed_again(tmp_path: Path) -> None:
+    video = tmp_path / "in.mp4"
+    video.write_bytes(b"x")
+
+    with patch("subprocess.run", return_value=_FakeResult(PROBE_OUT)) as run:
+        ffmpeg.get_video_duration(video)
+        video.write_bytes(b"longer")
+        os.utime(video, ns=(1, 1))
+        ffmpeg.get_video_duration(video)
+
+    assert run.call_count == 2
+
+
+def test_failed_probe_is_not_cached(tmp_path: Path) -> None:
+    video = tmp_path / "in.mp4"
+    video.write_bytes(b"x")
+
+    with patch("subprocess.run", return_value=_FakeResult(stderr=b"boom", returncode=1)) as run:
+        assert ffmpeg.get_audio_info(video) == {}
+        with pytest.raises(FFmpegError):
+            ffmpeg.get_video_duration(video)
+
+    assert run.call_count == 2
+
+
+def test_split_video_runs_one_segment_muxer_pass(tmp_path: Path) -> None:
+    video = tmp_path / "talk.mp4"
+    video.write_bytes(b"x")
+    out_dir = tmp_path / "chunks"
+    out_dir.mkdir()
+    (out_dir / "talk_chunk_009.mp4").write_bytes(b"stale")
+
+    def fake_run(cmd, *args, **kwargs):
+        assert cmd[cmd.index("-f") + 1] == "segment"
+        for i in range(3):
+            (out_dir / f"talk_chunk_{i:03d}.mp4").write_bytes(b"c")
+        return _FakeResult()
+
+    with patch("subprocess.run", side_effect=fake_run) as run:
+        chunks = ffmpeg.split_video(video, out_dir, chunk_duration=60)
+
+    assert run.call_count == 1
+    assert [c.name for c in chunks] == [f"talk_chunk_{i:03d}.mp4" for i in range(3)]
+
+
+def test_remove_segments_extracts_all_keep_ranges_in_one_run(tmp_path: Path) -> None:
+    video = tmp_path / "in.mp4"
+    video.write_bytes(b"x")
+    calls = []
+
+    def fake_run(cmd, *args, **kwargs):
+        calls.append(cmd)
+        if "-show_entries" in cmd:
+            return _FakeResult(PROBE_OUT)  # 12.5s long
+        if b"inpoint" in (kwargs.get("input") or b""):
+            return _FakeResult(stderr=b"concat demuxer rejected input", returncode=1)
+        return _FakeResult()
+
+    with patch("subprocess.run", side_effect=fake_run):
+        ffmpeg.remove_segments(video, tmp_path / "out.mp4", [(2.0, 4.0), (8.0, 9.0)])
+
+    extract = [c for c in calls if "-ss" in c]
+    assert len(extract) == 1
+    cmd = extract[0]
+    assert cmd.count("-i") == 1
+    starts = [float(cmd[i + 1]) for i, arg in enumerate(cmd) if arg == "-ss"]
+    durations = [float(cmd[i + 1]) for i, arg in enumerate(cmd) if arg == "-t"]
+    assert starts == [0.0, 4.0, 9.0]
+    assert durations == [2.0, 4.0, 3.5]
+
+
+def test_extract_filter_remux_is_a_single_fused_command(tmp_path: Path) -> None:
+    with patch.object(ffmpeg, "_run_ffmpeg_nonblocking", return_value=(0, "")) as run:
+        ffmpeg.extract_filter_remux(
+            tmp_path / "in.mp4", "lowpass=f=3000", tmp_path / "out.mp4", audio_bitrate="128k"
+        )
+
+    assert run.call_count == 1
+    cmd = run.call_args.args[0]
+    assert cmd[cmd.index("-af") + 1] == "lowpass=f=3000"
+    assert cmd[cmd.index("-c:v") + 1] == "copy"
+    assert cmd[cmd.index("-b:a") + 1] == "128k"
+    assert not any(arg.endswith(".wav") for arg in cmd)
+
+
+def test_remove_segments_falls_back_to_parallel_per_segment_runs(tmp_path: Path) -> None:
+    video = tmp_path / "in.mp4"
+    video.write_bytes(b"x")
+    calls = []
+
+    def fake_run(cmd, *args, **kwargs):
+        calls.append(cmd)
+        if "-show_entries" in cmd:
+            return _FakeResult(PROBE_OUT)
+        if b"inpoint" in (kwargs.get("input") or b""):
+            return _FakeResult(stderr=b"concat demuxer rejected input", returncode=1)
+        if cmd.count("-ss") > 1:
+            return _FakeResult(stderr=b"multi-output unsupported", returncode=1)
+        return _FakeResult()
+
+    with patch("subprocess.run", side_effect=fake_run):
+        ffmpeg.remove_segments(
+            video, tmp_path / "out.mp4", [(2.0, 4.0), (8.0, 9.0)], max_workers=2
+        )
+
+    per_segment = [c for c in calls if c.count("-ss") == 1]
+    assert sorted(float(c[c.index("-ss") + 1]) for c in per_segment) == [0.0, 4.0, 9.0]
+    # Input seeking: -ss precedes -i in the fallback commands
+    assert all(c.index("-ss") < c.index("-i") for c in per_segment)
+    assert all("-noaccurate_seek" in c and "+fastseek" in c for c in per_segment)
+
+
+def test_check_nvenc_available_probes_once() -> None:
+    ffmpeg.check_nvenc_available.cache_clear()
+    try:
+        with patch("subprocess.run", return_value=_FakeResult(" V..... h264_nvenc")) as run:
+            assert ffmpeg.check_nvenc_available() is True
+            assert ffmpeg.check_nvenc_available() is True
+        assert run.call_count == 1
+    finally:
+        ffmpeg.check_nvenc_available.cache_clear()
+
+
+def test_watermark_uses_cuda_decode_when_filters_available(tmp_path: Path) -> None:
+    with patch.object(ffmpeg, "check_nvenc_available", return_value=True), patch.object(
+        ffmpeg, "check_cuda_filters_available", return_value=True
+    ), patch("subprocess.run", return_value=_FakeResult()), patch.object(
+        ffmpeg, "_run_ffmpeg_nonblocking", return_value=(0, "")
+    ) as run:
+        ffmpeg.remux_video(
+            tmp_path / "in.mp4", tmp_path / "a.wav", tmp_path / "out.mp4", watermark=True
+        )
+
+    cmd = run.call_args.args[0]
+    assert cmd.index("-hwaccel") < cmd.index("-i")
+    graph = cmd[cmd.index("-filter_complex") + 1]
+    assert "scale_cuda=" in graph and graph.index("hwdownload") < graph.index("drawbox")
+    assert "hwupload_cuda[v]" in graph
+    assert cmd[cmd.index("-c:v") + 1] == "h264_nvenc"
+
+
+def test_watermark_retries_on_cpu_filters_when_cuda_graph_fails(tmp_path: Path) -> None:
+    results = iter([(1, "Impossible to convert between the formats"), (0, "")])
+    with patch.object(ffmpeg, "check_nvenc_available", return_value=True), patch.object(
+        ffmpeg, "check_cuda_filters_available", return_value=True
+    ), patch("subprocess.run", return_value=_FakeResult()), patch.object(
+        ffmpeg, "_run_ffmpeg_nonblocking", side_effect=lambda *a, **k: next(results)
+    ) as run:
+        ffmpeg.remux_video(
+            tmp_path / "in.mp4", tmp_path / "a.wav", tmp_path / "out.mp4", watermark=True
+        )
+
+    cuda_cmd, cpu_cmd = (call.args[0] for call in run.call_args_list)
+    assert "-hwaccel" in cuda_cmd
+    assert "-hwaccel" not in cpu_cmd
+    graph = cpu_cmd[cpu_cmd.index("-filter_complex") + 1]
+    assert "scale=w=iw*0.75" in graph and "cuda" not in graph
+    # Still NVENC: only decode/scaling fell back to the CPU
+    assert cpu_cmd[cpu_cmd.index("-c:v") + 1] == "h264_nvenc"
+
+
+def test_run_ffmpeg_keeps_stderr_as_bytes_until_failure() -> None:
+    ok = _FakeResult(stderr=b"")
+    with patch("subprocess.run", return_value=ok) as run:
+        assert ffmpeg._run_ffmpeg(["ffmpeg", "-i", "in.mp4", "out.mp4"], timeout=5) == (0, "")
+
+    cmd = run.call_args.args[0]
+    assert cmd[:4] == ["ffmpeg", "-loglevel", "error", "-nostats"]
+    assert run.call_args.kwargs["stdout"] is subprocess.DEVNULL
+    assert "text" not in run.call_args.kwargs
+
+    with patch("subprocess.run", return_value=_FakeResult(stderr=b"bad \xff", returncode=1)):
+        assert ffmpeg._run_ffmpeg(["ffmpeg"], timeout=5) == (1, "bad \ufffd")
+
+
+def test_async_helpers_run_concurrently_on_asyncio_subprocesses(tmp_path: Path) -> None:
+    import asyncio
+
+    class _FakeAsyncProc:
+        def __init__(self, cmd) -> None:
+            self.cmd = cmd
+            self.returncode = 0
+
+        async def communicate(self):
+            await asyncio.sleep(0)
+            return (PROBE_OUT.encode() if self.cmd[0] == "ffprobe" else None), b""
+
+    spawned = []
+
+    async def fake_exec(*cmd, **kwargs):
+        spawned.append((cmd, kwargs))
+        return _FakeAsyncProc(cmd)
+
+    async def main():
+        return await asyncio.gather(
+            ffmpeg.get_video_duration_async(tmp_path / "in.mp4"),
+            ffmpeg.extract_audio_async(tmp_path / "in.mp4", tmp_path / "a.wav"),
+            ffmpeg.remux_video_async(tmp_path / "in.mp4", tmp_path / "a.wav", tmp_path / "o.mp4"),
+        )
+
+    with patch("asyncio.create_subprocess_exec", side_effect=fake_exec):
+        duration, audio, out = asyncio.run(main())
+
+    assert (duration, audio, out) == (12.5, tmp_path / "a.wav", tmp_path / "o.mp4")
+    assert [cmd[0] for cmd, _ in spawned] == ["ffprobe", "ffmpeg", "ffmpeg"]
+    assert spawned[1][1]["stdout"] is asyncio.subprocess.DEVNULL
+
+
+def test_concatenate_videos_pipes_list_without_temp_file(tmp_path: Path) -> None:
+    parts = [tmp_path / "a.mp4", tmp_path / "b.mp4"]
+    with patch("subprocess.run", return_value=_FakeResult(stderr=b"")) as run:
+        ffmpeg.concatenate_videos(parts, tmp_path / "out.mp4")
+
+    cmd = run.call_args.args[0]
+    assert cmd[cmd.index("-i") + 1] == "pipe:0"
+    listing = run.call_args.kwargs["input"].decode("utf-8").splitlines()
+    assert listing == [f"file '{p.resolve().as_posix()}'" for p in parts]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_remove_segments_copies_keep_ranges_in_one_concat_run(tmp_path: Path) -> None:
+    video = tmp_path / "in.mp4"
+    video.write_bytes(b"x")
+    calls = []
+
+    def fake_run(cmd, *args, **kwargs):
+        calls.append((cmd, kwargs))
+        if "-show_entries" in cmd:
+            return _FakeResult(PROBE_OUT)
+        return _FakeResult(stderr=b"")
+
+    with patch("subprocess.run", side_effect=fake_run):
+        ffmpeg.remove_segments(video, tmp_path / "out.mp4", [(2.0, 4.0), (8.0, 9.0)])
+
+    ffmpeg_calls = [(c, kw) for c, kw in calls if c[0] == "ffmpeg"]
+    assert len(ffmpeg_calls) == 1
+    cmd, kwargs = ffmpeg_calls[0]
+    assert cmd[cmd.index("-f") + 1] == "concat"
+    listing = kwargs["input"].decode("utf-8")
+    assert listing.count("file ") == 3
+    assert "inpoint 4.0\noutpoint 8.0" in listing
+    assert not (tmp_path / "temp_segments").exists()
+
+
+def test_remove_segments_reencode_uses_trim_concat_filter(tmp_path: Path) -> None:
+    video = tmp_path / "in.mp4"
+    video.write_bytes(b"x")
+    calls = []
+
+    def fake_run(cmd, *args, **kwargs):
+        calls.append(cmd)
+        if "-show_entries" in cmd:
+            return _FakeResult(PROBE_OUT)
+        return _FakeResult(stderr=b"")
+
+    with patch.object(ffmpeg, "check_nvenc_available", return_value=False), patch(
+        "subprocess.run", side_effect=fake_run
+    ):
+        ffmpeg.remove_segments(
+            video, tmp_path / "out.mp4", [(2.0, 4.0), (8.0, 9.0)], reencode=True
+        )
+
+    (cmd,) = [c for c in calls if c[0] == "ffmpeg"]
+    graph = cmd[cmd.index("-filter_complex") + 1]
+    assert "trim=start=4.0:end=8.0" in graph and "atrim=start=9.0:end=12.5" in graph
+    assert graph.endswith("concat=n=3:v=1:a=1[v][a]")
+    assert cmd[cmd.index("-c:v") + 1] == "libx264"
+
+
+def test_probe_uses_pyav_in_process_when_available(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from types import SimpleNamespace
+
+    audio = SimpleNamespace(
+        type="audio", codec_context=SimpleNamespace(name="opus", sample_rate=48000, channels=2)
+    )
+    video = SimpleNamespace(type="video", codec_context=SimpleNamespace(name="vp9"))
+
+    class _Container:
+        streams = [video, audio]
+        duration = 7_250_000
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    fake_av = SimpleNamespace(open=lambda path: _Container(), time_base=1_000_000)
+    monkeypatch.setattr(ffmpeg, "_import_av", lambda: fake_av)
+    media = tmp_path / "in.webm"
+    media.write_bytes(b"x")
+
+    with patch("subprocess.run") as run:
+        info = ffmpeg.get_audio_info(media)
+        duration = ffmpeg.get_video_duration(media)
+
+    run.assert_not_called()
+    assert info == {"sample_rate": 48000, "channels": 2, "codec": "opus", "duration": 7.25}
+    assert duration == 7.25
+
+
+def test_watermark_toggles_drawbox_with_sendcmd_script(tmp_path: Path) -> None:
+    video = tmp_path / "in.mp4"
+    video.write_bytes(b"x")
+    seen = {}
+
+    def fake_ffmpeg(cmd, timeout, input=None):
+        graph = cmd[cmd.index("-filter_complex") + 1]
+        script = Path(graph.split("sendcmd=f='")[1].split("'")[0])
+        seen["graph"] = graph
+        seen["script"] = script
+        seen["lines"] = script.read_text(encoding="utf-8").splitlines()
+        return 0, ""
+
+    # 12.5s probe -> ~11.9s of output after the speed-up
+    with patch.object(ffmpeg, "check_nvenc_available", return_value=False), patch(
+        "subprocess.run", return_value=_FakeResult(PROBE_OUT.encode())
+    ), patch.object(ffmpeg, "_run_ffmpeg_nonblocking", side_effect=fake_ffmpeg):
+        ffmpeg.remux_video(video, tmp_path / "a.wav", tmp_path / "out.mp4", watermark=True)
+
+    assert "drawbox=enable=0:" in seen["graph"]
+    assert "mod(t," not in seen["graph"]
+    assert [line.split()[0] for line in seen["lines"]] == [
+        "0.000-0.150", "5.000-5.150", "10.000-10.150"
+    ]
+    assert not seen["script"].exists()
+
+
+def test_run_ffmpeg_nonblocking_keeps_only_stderr_tail(monkeypatch: pytest.MonkeyPatch) -> None:
+    class _FakePopen:
+        def __init__(self, cmd, **kwargs) -> None:
+            self.cmd = cmd
+            self.kwargs = kwargs
+            lines = b"".join(b"frame %d\n" % i for i in range(1000))
+            self.stderr = io.BytesIO(lines + b"Conversion failed!\n")
+
+        def wait(self, timeout=None):
+            return 1
+
+    monkeypatch.setattr(ffmpeg, "_STDERR_TAIL_LINES", 3)
+    with patch("subprocess.Popen", side_effect=_FakePopen) as popen:
+        returncode, stderr = ffmpeg._run_ffmpeg_nonblocking(["ffmpeg", "-i", "x"], timeout=5)
+
+    assert returncode == 1
+    assert stderr == "frame 998\nframe 999\nConversion failed!\n"
+    assert popen.call_args.args[0][:2] == ["ffmpeg", "-nostats"]
+    assert popen.call_args.kwargs["stdout"] is subprocess.DEVNULL
+
+
+def test_module_exposes_feature_complete_api() -> None:
+    import inspect
+
+    assert "watermark" in inspect.signature(ffmpeg.remux_video).parameters
+    for name in ("check_nvenc_available", "split_video", "concatenate_videos", "remove_segments"):
+        assert callable(getattr(ffmpeg, name))
+
+
+def test_executable_resolves_absolute_path_or_keeps_name(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(
+        ffmpeg._EXECUTABLE_LOOKUPS, "ffprobe", lambda: Path("/opt/ffmpeg/bin/ffprobe")
+    )
+    monkeypatch.setitem(ffmpeg._EXECUTABLE_LOOKUPS, "ffmpeg", lambda: None)
+
+    monkeypatch.setattr(ffmpeg, "_executable", _REAL_EXECUTABLE)
+
+    assert ffmpeg._executable("ffprobe") == str(Path("/opt/ffmpeg/bin/ffprobe"))
+    assert ffmpeg._executable("ffmpeg") == "ffmpeg"
+    assert ffmpeg._probe_cmd("in.mp4")[0] == str(Path("/opt/ffmpeg/bin/ffprobe"))
+
+
+def test_plan_chunk_windows_starts_each_chunk_on_a_keyframe(tmp_path: Path) -> None:
+    packets = "".join(
+        f"packet,{10.0 + t:.6f},{'K_' if t % 4 == 0 else '__'}\n" for t in range(0, 30)
+    )
+    out = (packets + "format,10.000000\n").encode()
+
+    with patch("subprocess.run", return_value=_FakeResult(out)) as run:
+        windows = ffmpeg.plan_chunk_windows(tmp_path / "in.mp4", chunk_duration=10)
+
+    cmd = run.call_args.args[0]
+    assert cmd[0] == "ffprobe" and "packet=pts_time,flags" in cmd
+    # Keyframes every 4s (relative to the 10s container start): cuts at 12 and 24
+    assert windows == [(0.0, 12.0), (12.0, 12.0), (24.0, None)]
+
+
+def test_windowed_extract_and_remux_seek_the_video_input(tmp_path: Path) -> None:
+    src = tmp_path / "in.mp4"
+    with patch.object(ffmpeg, "_run_ffmpeg_nonblocking", return_value=(0, "")) as run:
+        ffmpeg.extract_audio(src, tmp_path / "a.wav", start=12.0, duration=12.0)
+        ffmpeg.remux_video(src, tmp_path / "v.wav", tmp_path / "out.mp4", start=12.0)
+
+    extract_cmd, remux_cmd = (call.args[0] for call in run.call_args_list)
+    i = extract_cmd.index("-i")
+    assert extract_cmd[i - 4:i] == ["-ss", "12.000000", "-t", "12.000000"]
+    i = remux_cmd.index("-i")
+    assert remux_cmd[i - 2:i] == ["-ss", "12.000000"] and remux_cmd[i + 1] == str(src)
+    # The vocals input is not seeked
+    assert remux_cmd[i + 2:i + 4] == ["-i", str(tmp_path / "v.wav")]
+
+
+def test_audio_moves_through_memory_between_extract_and_remux(tmp_path: Path) -> None:
+    np = pytest.importorskip("numpy")
+    interleaved = np.array([[16384, -16384], [8192, -8192], [0, 32767]], dtype="<i2")
+    proc = MagicMock(returncode=0)
+    proc.stdout = io.BytesIO(interleaved.tobytes())
+    proc.stderr = io.BytesIO(b"")
+    proc.wait.return_value = 0
+
+    with patch("subprocess.Popen", return_value=proc) as popen:
+        audio = ffmpeg.extract_audio_array(tmp_path / "in.mp4", start=12.0, duration=3.0)
+
+    cmd = popen.call_args.args[0]
+    assert cmd[-3:] == ["-f", "s16le", "pipe:1"] and "-ss" in cmd
+    assert popen.call_args.kwargs["bufsize"] == ffmpeg._PIPE_SIZE
+    assert audio.shape == (2, 3) and audio.dtype == np.int16
+    np.testing.assert_array_equal(audio, interleaved.T)
+
+    vocals = np.array([[1, 2, 3], [-1, -2, -3]], dtype=np.int16)
+    with patch.object(ffmpeg, "_run_ffmpeg_nonblocking", return_value=(0, "")) as run:
+        ffmpeg.remux_video_array(tmp_path / "in.mp4", vocals, 44100, tmp_path / "out.mp4")
+
+    cmd = run.call_args.args[0]
+    i = cmd.index("pipe:0")
+    assert cmd[i - 7:i - 1] == ["-f", "s16le", "-ar", "44100", "-ac", "2"]
+    assert bytes(run.call_args.kwargs["input"]) == vocals.T.astype("<i2").tobytes()
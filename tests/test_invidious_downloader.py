@@ -0,0 +1,285 @@
+"""Unit tests for the Invidious API helpers in yt_audio_filter.invidious_downloader."""
+
+import time
+from urllib.error import URLError
+
+import pytest
+
+from yt_audio_filter import invidious_downloader as inv
+
+
+def test_extract_video_id_handles_common_url_shapes() -> None:
+    for url in (
+        "https://www.youtube.com/watch?v=jNQXAC9IVRw&t=3",
+        "https://youtu.be/jNQXAC9IVRw",
+        "https://www.youtube.com/shorts/jNQXAC9IVRw",
+    ):
+        assert inv.extract_video_id(url) == "jNQXAC9IVRw"
+    with pytest.raises(ValueError):
+        inv.extract_video_id("https://example.com/")
+
+
+def test_best_video_format_prefers_highest_bitrate_mp4() -> None:
+    formats = [
+        {"type": "audio/mp4", "bitrate": 900},
+        {"type": "video/webm", "bitrate": 800},
+        {"type": "video/mp4; codecs=avc1", "bitrate": 300, "itag": 1},
+        {"type": "video/mp4; codecs=avc1", "bitrate": 500, "itag": 2},
+    ]
+
+    assert inv._best_video_format(formats)["itag"] == 2
+    assert inv._best_video_format(formats[:2])["type"] == "video/webm"
+    assert inv._best_video_format(formats[:1]) is None
+
+
+def test_first_video_info_returns_first_acceptable_answer(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(inv, "INVIDIOUS_API_URLS", ["https://dead", "https://slow", "https://ok"])
+
+    def fake_fetch(api_base: str, video_id: str) -> dict:
+        if api_base == "https://dead":
+            raise URLError("refused")
+        if api_base == "https://slow":
+            time.sleep(2)
+            return {"adaptiveFormats": ["slow"]}
+        return {"adaptiveFormats": ["fast"]}
+
+    monkeypatch.setattr(inv, "_fetch_video_info", fake_fetch)
+
+    start = time.monotonic()
+    info, api_base, _ = inv._first_video_info("id", lambda i: "adaptiveFormats" in i)
+
+    assert (info, api_base) == ({"adaptiveFormats": ["fast"]}, "https://ok")
+    assert time.monotonic() - start < 1.5  # did not wait for the slow instance
+
+
+def test_first_video_info_reports_last_error_when_all_fail(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(inv, "INVIDIOUS_API_URLS", ["https://a"])
+
+    def fake_fetch(api_base: str, video_id: str) -> dict:
+        raise URLError("refused")
+
+    monkeypatch.setattr(inv, "_fetch_video_info", fake_fetch)
+
+    assert inv._first_video_info("id", lambda i: True) == (
+        None,
+        None,
+        "Connection error to https://a: refused",
+    )
+
+
+def test_progress_reader_counts_through_copyfileobj() -> None:
+    import io
+    import shutil
+
+    body = io.BytesIO(b"x" * 25)
+    step = inv._PROGRESS_STEP
+    reader = inv._ProgressReader(body, start=5, total=30)
+    out = io.BytesIO()
+
+    shutil.copyfileobj(reader, out, length=4)
+
+    assert reader.count == 30
+    assert out.getvalue() == b"x" * 25
+    assert reader._next_log == 5 + step  # below the first 10 MB step
+
+
+def test_api_get_reuses_keep_alive_connection_and_gunzips(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import gzip
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    connections = []
+
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self) -> None:
+            super().setup()
+            connections.append(self.client_address)
+
+        def do_GET(self) -> None:
+            assert "gzip" in self.headers.get("Accept-Encoding", "")
+            body = gzip.compress(b'{"title": "ok"}')
+            self.send_response(200)
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(inv, "_idle_connections", {})
+    try:
+        base = f"http://127.0.0.1:{server.server_port}"
+        assert inv._api_get(f"{base}/api/v1/videos/a") == b'{"title": "ok"}'
+        assert inv._api_get(f"{base}/api/v1/videos/b") == b'{"title": "ok"}'
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert len(connections) == 1
+
+
+def test_candidate_sources_are_capped_and_prefer_answering_instance() -> None:
+    api = inv.INVIDIOUS_API_URLS[2]
+    urls = inv._candidate_sources("https://direct/video", "jNQXAC9IVRw", 137, api)
+
+    assert len(urls) == inv._MAX_PROBE_SOURCES
+    assert urls[0] == "https://direct/video"
+    assert urls[1].startswith(f"{api}/latest_version?id=jNQXAC9IVRw&itag=137")
+    assert inv._candidate_sources("https://direct/video", "x", None, api) == [
+        "https://direct/video"
+    ]
+
+
+_INFO = {
+    "title": "t",
+    "adaptiveFormats": [{"type": "video/mp4", "url": "https://cdn/v", "bitrate": 1}],
+}
+
+
+class _FakeResponse:
+    def __init__(self, status: int, body: bytes, content_range: str = "") -> None:
+        import io
+
+        self.status = status
+        self._body = io.BytesIO(body)
+        self.headers = {"Content-Length": str(len(body)), "Content-Range": content_range}
+        self.closed = False
+
+    def read(self, size: int = -1) -> bytes:
+        return self._body.read(size)
+
+    def close(self) -> None:
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+@pytest.mark.parametrize("restart_status", [200, 206])
+def test_download_restarts_when_resume_range_is_ignored(
+    tmp_path, monkeypatch: pytest.MonkeyPatch, restart_status: int
+) -> None:
+    full = bytes(range(256)) * 1024  # 256 KiB
+    head = full[: inv._PROBE_BYTES]
+    requests = []
+
+    def fake_urlopen(req, timeout):
+        requests.append(req.get_header("Range"))
+        if req.get_header("Range"):
+            if restart_status == 200:
+                return _FakeResponse(200, full)
+            return _FakeResponse(206, full[1000:], f"bytes 1000-{len(full) - 1}/{len(full)}")
+        return _FakeResponse(200, full)
+
+    monkeypatch.setattr(inv, "_first_video_info", lambda *a, **k: (_INFO, "https://api", None))
+    monkeypatch.setattr(
+        inv, "_pick_fastest_source", lambda urls, timeout: ("https://cdn/v", head, True)
+    )
+    monkeypatch.setattr(inv, "urlopen", fake_urlopen)
+
+    result = inv.download_with_invidious("https://youtu.be/jNQXAC9IVRw", tmp_path)
+
+    assert result.file_path.read_bytes() == full
+    expected = [f"bytes={len(head)}-"] + ([None] if restart_status == 206 else [])
+    assert requests == expected
+
+
+def test_download_appends_matching_partial_content(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    full = bytes(range(256)) * 1024
+    head = full[: inv._PROBE_BYTES]
+    tail = _FakeResponse(206, full[len(head):], f"bytes {len(head)}-{len(full) - 1}/{len(full)}")
+
+    monkeypatch.setattr(inv, "_first_video_info", lambda *a, **k: (_INFO, "https://api", None))
+    monkeypatch.setattr(
+        inv, "_pick_fastest_source", lambda urls, timeout: ("https://cdn/v", head, True)
+    )
+    monkeypatch.setattr(inv, "urlopen", lambda req, timeout: tail)
+
+    result = inv.download_with_invidious("https://youtu.be/jNQXAC9IVRw", tmp_path)
+
+    assert result.file_path.read_bytes() == full
+    assert tail.closed
+
+
+def test_api_get_follows_redirects_and_caps_idle_connections(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            if self.path.startswith("/old"):
+                self.send_response(308)
+                self.send_header("Location", "/new")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            body = b'{"title": "moved"}'
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(inv, "_idle_connections", {})
+    try:
+        base = f"http://127.0.0.1:{server.server_port}"
+        assert inv._api_get(f"{base}/old/api") == b'{"title": "moved"}'
+
+        host = f"127.0.0.1:{server.server_port}"
+        extra = [inv.HTTPConnection(host) for _ in range(inv._MAX_IDLE_PER_HOST + 2)]
+        for conn in extra:
+            inv._release("http", host, conn)
+        assert len(inv._idle_connections[("http", host)]) == inv._MAX_IDLE_PER_HOST
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_api_get_uses_urlopen_when_a_proxy_is_configured(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import gzip
+    import io
+
+    opened = []
+
+    class _Response(io.BytesIO):
+        headers = {"Content-Encoding": "gzip"}
+
+    def fake_urlopen(req, timeout):
+        opened.append(req.full_url)
+        return _Response(gzip.compress(b"{}"))
+
+    def no_pool(*args):
+        raise AssertionError("proxied requests must not use the direct pool")
+
+    monkeypatch.setattr(inv, "getproxies", lambda: {"https": "http://proxy:3128"})
+    monkeypatch.setattr(inv, "urlopen", fake_urlopen)
+    monkeypatch.setattr(inv, "_connection", no_pool)
+
+    assert inv._api_get("https://yewtu.be/api/v1/videos/x") == b"{}"
+    assert opened == ["https://yewtu.be/api/v1/videos/x"]
@@ -0,0 +1,95 @@
+"""Unit tests for yt_audio_filter.logger."""
+
+import contextlib
+import io
+import logging
+import logging.handlers
+
+import pytest
+
+from yt_audio_filter.logger import (
+    ProgressLogger,
+    _stop_listener,
+    init_worker_logging,
+    setup_logger,
+    shutdown_logging,
+    worker_log_queue,
+)
+
+
+def test_progress_logger_formats_stage_messages(caplog: pytest.LogCaptureFixture) -> None:
+    progress = ProgressLogger(logging.getLogger("test_progress"))
+
+    with caplog.at_level(logging.INFO, logger="test_progress"):
+        progress.start_stage("Extract Audio")
+        progress.complete_stage("Extract Audio")
+        progress.start_stage("Isolate Vocals")
+
+    assert caplog.messages == [
+        "[1/3] Extract Audio...",
+        "[1/3] Extract Audio complete",
+        "[2/3] Isolate Vocals...",
+    ]
+
+
+def test_setup_logger_emits_through_background_listener() -> None:
+    stream = io.StringIO()
+    with contextlib.redirect_stderr(stream):
+        logger = setup_logger(name="test_queue_logger")
+    try:
+        assert [type(h) for h in logger.handlers] == [logging.handlers.QueueHandler]
+        logger.info("queued message")
+        logger.debug("filtered out")
+    finally:
+        _stop_listener(logger)
+
+    assert stream.getvalue() == "INFO: queued message\n"
+
+    # Reconfiguring replaces the listener instead of stacking another one
+    first = logger._listener
+    logger = setup_logger(quiet=True, name="test_queue_logger")
+    assert logger._listener is not first and len(logger.handlers) == 1
+    _stop_listener(logger)
+
+
+def test_worker_log_queue_forwards_records_to_app_handlers() -> None:
+    records = []
+
+    class _Collect(logging.Handler):
+        def emit(self, record: logging.LogRecord) -> None:
+            records.append(record.getMessage())
+
+    app = logging.getLogger("test_worker_app")
+    app.handlers[:] = [_Collect()]
+    worker = logging.getLogger("test_worker_app")
+
+    with worker_log_queue("test_worker_app") as log_queue:
+        init_worker_logging(log_queue, logging.INFO, name="test_worker_app")
+        worker.info("from worker")
+
+    assert records == ["from worker"]
+    app.handlers.clear()
+    app.propagate = True
+
+
+def test_shutdown_logging_flushes_and_keeps_logger_usable(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import atexit
+
+    registered = []
+    monkeypatch.setattr(atexit, "register", registered.append)
+    stream = io.StringIO()
+    with contextlib.redirect_stderr(stream):
+        setup_logger(name="test_shutdown_logger")
+        logger = setup_logger(name="test_shutdown_logger")
+    assert registered == []  # the exit hook is installed once, at import
+
+    logger.info("before shutdown")
+    shutdown_logging()
+    assert stream.getvalue() == "INFO: before shutdown\n"
+
+    logger.info("after shutdown")
+    assert stream.getvalue().endswith("INFO: after shutdown\n")
+    shutdown_logging()
+    logger.handlers.clear()
@@ -0,0 +1,244 @@
+"""Unit tests for chunk scheduling in yt_audio_filter.pipeline."""
+
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+pipeline = pytest.importorskip("yt_audio_filter.pipeline")
+
+
+def _temp_dir_factory(root: Path):
+    @contextmanager
+    def _create_temp_dir(prefix: str = "tmp_"):
+        path = root / "chunks"
+        path.mkdir()
+        yield path
+
+    return _create_temp_dir
+
+
+def test_pipelined_keeps_order_and_overlaps_stages() -> None:
+    second_extracted = threading.Event()
+
+    def extract(i: int) -> int:
+        if i == 1:
+            second_extracted.set()
+        return i
+
+    def separate(i: int) -> int:
+        # Chunk 1 is extracted while chunk 0 is still being separated
+        if i == 0:
+            assert second_extracted.wait(5)
+        return i * 10
+
+    results = list(pipeline._pipelined(range(4), [extract, separate, lambda x: x + 1]))
+
+    assert results == [1, 11, 21, 31]
+
+
+def test_pipelined_reraises_first_stage_error() -> None:
+    seen = []
+
+    def boom(i: int) -> int:
+        if i == 2:
+            raise ValueError("stage failed")
+        return i
+
+    with pytest.raises(ValueError, match="stage failed"):
+        for item in pipeline._pipelined(range(100), [boom, seen.append]):
+            pass
+
+    # Upstream stops feeding once a stage fails
+    assert len(seen) <= 2
+
+
+def test_process_video_chunked_pipelines_stages(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls = []
+
+    windows = [(0.0, 60.0), (60.0, 61.5), (121.5, None)]
+
+    def fake_extract(src, sample_rate, start, duration):
+        calls.append(("extract", (start, duration)))
+        return f"pcm@{start}"
+
+    def fake_separate(audio, sample_rate, **kwargs):
+        calls.append(("separate", audio))
+        return f"vocals:{audio}", sample_rate
+
+    def fake_remux(src, vocals, rate, out, start, duration, **kwargs):
+        assert src.name == "in.mp4" and vocals == f"vocals:pcm@{start}"
+        calls.append(("remux", (start, duration)))
+        out.write_bytes(b"m")
+
+    concatenated = []
+    monkeypatch.setattr(pipeline, "create_temp_dir", _temp_dir_factory(tmp_path))
+    monkeypatch.setattr(pipeline, "plan_chunk_windows", lambda path, chunk_duration: windows)
+    monkeypatch.setattr(pipeline, "extract_audio_array", fake_extract)
+    monkeypatch.setattr(pipeline, "separate_vocals", fake_separate)
+    monkeypatch.setattr(pipeline, "remux_video_array", fake_remux)
+    monkeypatch.setattr(
+        pipeline, "concatenate_videos", lambda paths, out: concatenated.extend(paths)
+    )
+    monkeypatch.setattr(pipeline, "get_file_size_mb", lambda path: 0.0)
+
+    progress = []
+    pipeline._process_video_chunked(
+        input_path=tmp_path / "in.mp4",
+        output_path=tmp_path / "out.mp4",
+        device="cpu",
+        model_name="htdemucs",
+        audio_bitrate="192k",
+        progress_callback=lambda stage, pct: progress.append((stage, pct)),
+        segment=None,
+        shifts=1,
+        watermark=False,
+        fp16=False,
+        bf16=False,
+        compile_model=False,
+        chunk_duration=60,
+    )
+
+    assert [p.name for p in concatenated] == [f"processed_chunk_{i:03d}.mp4" for i in range(3)]
+    assert [window for stage, window in calls if stage == "extract"] == windows
+    assert [window for stage, window in calls if stage == "remux"] == windows
+    assert ("Process Chunks", 100) in progress
+    # Nothing but the processed chunks touches the disk
+    assert sorted(p.name for p in (tmp_path / "chunks").iterdir()) == [
+        p.name for p in concatenated
+    ]
+
+
+def test_init_chunk_worker_preloads_model_and_tolerates_failure(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    loads = []
+    monkeypatch.setattr(
+        pipeline, "preload_model", lambda *args, **kwargs: loads.append((args, kwargs))
+    )
+
+    pipeline._init_chunk_worker("cuda", "htdemucs", False)
+
+    assert loads == [(("htdemucs", "cuda"), {"compile_model": False})]
+
+    def _fail(*args, **kwargs):
+        raise RuntimeError("no GPU")
+
+    monkeypatch.setattr(pipeline, "preload_model", _fail)
+    pipeline._init_chunk_worker("cuda", "htdemucs", False)  # must not raise
+
+
+def test_parallel_chunks_on_cuda_use_threads_and_one_model(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    class _Cuda:
+        type = "cuda"
+
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("GPU chunks should not spawn worker processes")
+
+    preloads = []
+    processed = []
+    concatenated = []
+    monkeypatch.setattr(pipeline, "create_temp_dir", _temp_dir_factory(tmp_path))
+    windows = [(i * 60.0, 60.0) for i in range(4)]
+    monkeypatch.setattr(pipeline, "plan_chunk_windows", lambda path, chunk_duration: windows)
+    monkeypatch.setattr(pipeline, "get_device", lambda device: _Cuda())
+    monkeypatch.setattr(pipeline, "preload_model", lambda *a, **k: preloads.append(a))
+    monkeypatch.setattr(
+        pipeline, "_process_chunk_on_stream", lambda **kw: processed.append(kw["start"])
+    )
+    monkeypatch.setattr(pipeline.multiprocessing, "Pool", no_pool)
+    monkeypatch.setattr(
+        pipeline, "concatenate_videos", lambda paths, out: concatenated.extend(paths)
+    )
+    monkeypatch.setattr(pipeline, "get_file_size_mb", lambda path: 0.0)
+
+    pipeline._process_video_chunked(
+        input_path=tmp_path / "in.mp4",
+        output_path=tmp_path / "out.mp4",
+        device="cuda",
+        model_name="htdemucs",
+        audio_bitrate="192k",
+        progress_callback=None,
+        segment=None,
+        shifts=1,
+        watermark=False,
+        fp16=False,
+        bf16=False,
+        compile_model=False,
+        chunk_duration=60,
+        parallel_chunks=2,
+    )
+
+    assert preloads == [("htdemucs", "cuda")]
+    assert sorted(processed) == [0.0, 60.0, 120.0, 180.0]
+    assert [p.name for p in concatenated] == [f"processed_chunk_{i:03d}.mp4" for i in range(4)]
+
+
+@pytest.mark.parametrize("device", ["cpu", "auto"])
+def test_chunk_worker_never_touches_cuda(monkeypatch: pytest.MonkeyPatch, device: str) -> None:
+    torch = pytest.importorskip("torch")
+    processed = []
+
+    def _no_cuda(*args, **kwargs):
+        raise AssertionError("pool workers only run on the CPU")
+
+    monkeypatch.setattr(torch.cuda, "is_available", _no_cuda)
+    monkeypatch.setattr(torch.cuda, "empty_cache", _no_cuda)
+    monkeypatch.setattr(
+        pipeline, "_process_single_chunk", lambda **kw: processed.append(kw) or kw["output_path"]
+    )
+
+    args = (
+        Path("in.mp4"), Path("out.mp4"), 0.0, 60.0, device, "htdemucs", "192k", None, 1, False,
+        False, False, False, False, 0,
+    )
+
+    assert pipeline._process_chunk_worker(args) == Path("out.mp4")
+    assert processed[0]["start"] == 0.0 and processed[0]["device"] == device
+
+
+def test_process_video_moves_audio_through_memory(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls = []
+
+    def fake_extract(src, sample_rate):
+        calls.append(("extract", sample_rate))
+        return "pcm"
+
+    def fake_separate(audio, sample_rate, **kwargs):
+        calls.append(("separate", audio))
+        assert kwargs["skip_when_vocals_only"] is True
+        return "vocals", 44100
+
+    def fake_remux(src, vocals, rate, out, **kwargs):
+        calls.append(("remux", vocals, rate))
+        out.write_bytes(b"m")
+
+    monkeypatch.setattr(pipeline, "validate_prerequisites", lambda: None)
+    monkeypatch.setattr(pipeline, "validate_input_file", lambda path: None)
+    monkeypatch.setattr(pipeline, "get_audio_info", lambda path: None)
+    monkeypatch.setattr(pipeline, "get_video_duration", lambda path: 120.0)
+    monkeypatch.setattr(pipeline, "get_file_size_mb", lambda path: 0.0)
+    monkeypatch.setattr(pipeline, "create_temp_dir", _temp_dir_factory(tmp_path))
+    monkeypatch.setattr(pipeline, "extract_audio_array", fake_extract)
+    monkeypatch.setattr(pipeline, "separate_vocals", fake_separate)
+    monkeypatch.setattr(pipeline, "remux_video_array", fake_remux)
+
+    out = pipeline.process_video(
+        tmp_path / "in.mp4", tmp_path / "out.mp4", device="cpu", skip_speech_only=True
+    )
+
+    assert out == tmp_path / "out.mp4"
+    assert calls == [
+        ("extract", pipeline._DEMUCS_SAMPLE_RATE),
+        ("separate", "pcm"),
+        ("remux", "vocals", 44100),
+    ]
+    assert not (tmp_path / "chunks").exists()  # no temp dir, no WAV round trip
@@ -0,0 +1,98 @@
+"""Unit tests for yt_audio_filter.app.subprocess_runner."""
+
+import threading
+
+import pytest
+
+from yt_audio_filter.app import subprocess_runner
+
+
+class _FakeProcess:
+    def __init__(self) -> None:
+        self.stopped = threading.Event()
+        self.signals = []
+
+    def poll(self):
+        return 1 if self.stopped.is_set() else None
+
+    def send_signal(self, sig) -> None:
+        self.signals.append(sig)
+        self.stopped.set()
+
+    def terminate(self) -> None:
+        self.signals.append("terminate")
+        self.stopped.set()
+
+
+def test_stop_interrupts_running_children(monkeypatch: pytest.MonkeyPatch) -> None:
+    started = threading.Event()
+    processes = []
+
+    def fake_run(url, progress_callback=None, on_process=None):
+        process = _FakeProcess()
+        processes.append(process)
+        on_process(process)
+        started.set()
+        assert process.stopped.wait(5)
+        return {"success": False, "video_id": None, "error": "stopped", "uploaded_url": None}
+
+    monkeypatch.setattr(subprocess_runner, "run_processing_subprocess", fake_run)
+    processor = subprocess_runner.ParallelBatchProcessor(max_workers=1)
+
+    worker = threading.Thread(
+        target=processor.process_batch, args=([{"id": "a", "url": "u"}],)
+    )
+    worker.start()
+    assert started.wait(5)
+    processor.stop()
+    worker.join(5)
+
+    assert not worker.is_alive()
+    assert len(processes[0].signals) == 1
+    assert processor._processes == {}
+
+
+def test_child_started_after_stop_is_interrupted_immediately() -> None:
+    processor = subprocess_runner.ParallelBatchProcessor()
+    processor.stop()
+    process = _FakeProcess()
+
+    processor._track_process("a", process)
+
+    assert process.stopped.is_set()
+
+
+def test_progress_throttle_delivers_last_held_update() -> None:
+    pushed = []
+    delivered = threading.Event()
+
+    def push(item_id, stage, pct):
+        pushed.append((stage, pct))
+        if pct == 97:
+            delivered.set()
+
+    throttle = subprocess_runner._ProgressThrottle(push, interval=0.05)
+    throttle.update("a", "Isolate Vocals", 40)
+    throttle.update("a", "Isolate Vocals", 40)  # repeat: dropped
+    throttle.update("a", "Isolate Vocals", 60)  # held...
+    throttle.update("a", "Isolate Vocals", 97)  # ...replaced, then flushed
+
+    assert delivered.wait(5)
+    assert pushed == [("Isolate Vocals", 40), ("Isolate Vocals", 97)]
+
+    throttle.update("a", "Remux Video", 70)  # stage change: immediate
+    throttle.update("a", "Remux Video", 100)  # completion: immediate
+    assert pushed[-2:] == [("Remux Video", 70), ("Remux Video", 100)]
+
+
+def test_progress_throttle_forget_cancels_held_update() -> None:
+    pushed = []
+    throttle = subprocess_runner._ProgressThrottle(
+        lambda *args: pushed.append(args), interval=0.05
+    )
+    throttle.update("a", "Upload", 80)
+    throttle.update("a", "Upload", 90)
+    throttle.forget("a")
+
+    threading.Event().wait(0.15)
+    assert pushed == [("a", "Upload", 80)]
@@ -0,0 +1,86 @@
+"""Unit tests for yt_audio_filter.yt_metadata caching."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from yt_audio_filter import yt_metadata
+from yt_audio_filter.yt_metadata import fetch_yt_metadata
+
+URL = "https://www.youtube.com/watch?v=abcdefghijk"
+
+
+@pytest.fixture(autouse=True)
+def _clear_memo():
+    yt_metadata._memo.clear()
+    yield
+    yt_metadata._memo.clear()
+
+
+def _fake_yt_dlp(info: dict) -> SimpleNamespace:
+    ydl = MagicMock()
+    ydl.__enter__.return_value.extract_info.return_value = info
+    return SimpleNamespace(YoutubeDL=MagicMock(return_value=ydl))
+
+
+def test_second_call_is_served_from_disk_cache(tmp_path: Path) -> None:
+    fake = _fake_yt_dlp(
+        {"id": "abcdefghijk", "title": "T", "channel": "C", "tags": ["a"], "duration": 42}
+    )
+    with patch.dict(sys.modules, {"yt_dlp": fake}):
+        first = fetch_yt_metadata(URL, cache_dir=tmp_path)
+    assert (tmp_path / "abcdefghijk.json").exists()
+
+    yt_metadata._memo.clear()
+    with patch.dict(sys.modules, {"yt_dlp": _fake_yt_dlp(None)}):
+        second = fetch_yt_metadata(URL, cache_dir=tmp_path)
+
+    assert fake.YoutubeDL.call_count == 1
+    assert second == first
+    assert second.tags == ["a"]
+    assert second.duration == 42
+
+
+def test_expired_disk_cache_is_refetched(tmp_path: Path) -> None:
+    fake = _fake_yt_dlp({"id": "abcdefghijk", "title": "Old"})
+    with patch.dict(sys.modules, {"yt_dlp": fake}):
+        fetch_yt_metadata(URL, cache_dir=tmp_path)
+
+    yt_metadata._memo.clear()
+    fresh = _fake_yt_dlp({"id": "abcdefghijk", "title": "New"})
+    with patch.dict(sys.modules, {"yt_dlp": fresh}):
+        meta = fetch_yt_metadata(URL, cache_dir=tmp_path, ttl_seconds=-1)
+
+    assert meta.title == "New"
+    assert fresh.YoutubeDL.call_count == 1
+
+
+def test_memo_is_bounded_and_skipped_without_cache_dir(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(yt_metadata, "_MEMO_MAX_ENTRIES", 2)
+    for vid in ("aaaaaaaaaaa", "bbbbbbbbbbb", "ccccccccccc"):
+        with patch.dict(sys.modules, {"yt_dlp": _fake_yt_dlp({"id": vid})}):
+            fetch_yt_metadata(f"https://youtu.be/{vid}", cache_dir=tmp_path)
+    assert list(yt_metadata._memo) == ["bbbbbbbbbbb", "ccccccccccc"]
+
+    yt_metadata._memo.clear()
+    fake = _fake_yt_dlp({"id": "abcdefghijk", "title": "Fresh"})
+    with patch.dict(sys.modules, {"yt_dlp": fake}):
+        fetch_yt_metadata(URL, cache_dir=None)
+        fetch_yt_metadata(URL, cache_dir=None)
+    assert fake.YoutubeDL.call_count == 2
+    assert not yt_metadata._memo
+
+
+def test_default_cache_dir_does_not_follow_cwd(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    assert yt_metadata.DEFAULT_META_CACHE_DIR.is_absolute()
+    assert not yt_metadata.DEFAULT_META_CACHE_DIR.is_relative_to(tmp_path)
@@ -0,0 +1,370 @@
+"""Unit tests for the download-detection helpers in yt_audio_filter.ytdownloader."""
+
+import os
+import re
+import time
+from pathlib import Path
+
+import pytest
+
+from yt_audio_filter import ytdownloader
+
+
+class _FakeClock:
+    """Deterministic monotonic clock; sleep() advances it and runs a hook."""
+
+    def __init__(self, on_sleep=None) -> None:
+        self.now = 1000.0
+        self.sleeps = []
+        self.on_sleep = on_sleep
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+        if self.on_sleep:
+            self.on_sleep(len(self.sleeps))
+
+
+def test_scan_mp4s_lists_only_mp4_with_size(tmp_path: Path) -> None:
+    (tmp_path / "a.mp4").write_bytes(b"x" * 10)
+    (tmp_path / "notes.txt").write_bytes(b"x")
+
+    found = ytdownloader._scan_mp4s(tmp_path)
+
+    assert list(found) == ["a.mp4"]
+    assert found["a.mp4"][0] == 10
+    assert ytdownloader._scan_mp4s(tmp_path / "missing") == {}
+    assert ytdownloader._snapshot_mp4s([tmp_path]) == {tmp_path: {"a.mp4": 10}}
+
+
+def test_wait_for_new_download_returns_once_size_settles(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    old = tmp_path / "old.mp4"
+    old.write_bytes(b"x")
+    stale = time.time() - 3600
+    os.utime(old, (stale, stale))
+    target = tmp_path / "new.mp4"
+
+    def grow(n: int) -> None:
+        if n <= 3:
+            with open(target, "ab") as f:
+                f.write(b"\0" * 600_000)
+
+    clock = _FakeClock(grow)
+    monkeypatch.setattr(ytdownloader, "WATCHDOG_AVAILABLE", False)
+    monkeypatch.setattr(ytdownloader.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(ytdownloader.time, "sleep", clock.sleep)
+
+    result = ytdownloader._wait_for_new_download(
+        [tmp_path], ytdownloader._snapshot_mp4s([tmp_path]), timeout=60
+    )
+
+    assert result == target
+    # Backs off while idle, snaps to the shortest interval while the file
+    # grows, then backs off again until it has been stable for 2s
+    assert clock.sleeps == [0.75, 0.5, 0.5, 0.5, 0.75, 1.125]
+
+
+def test_wait_for_new_download_times_out(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = _FakeClock()
+    monkeypatch.setattr(ytdownloader, "WATCHDOG_AVAILABLE", False)
+    monkeypatch.setattr(ytdownloader.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(ytdownloader.time, "sleep", clock.sleep)
+
+    assert ytdownloader._wait_for_new_download([tmp_path], {}, timeout=20) is None
+    assert max(clock.sleeps) <= ytdownloader._POLL_MAX
+
+
+def test_wait_for_new_download_uses_file_events_when_available(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    waits = []
+
+    class _FakeWatcher:
+        def __init__(self, directories) -> None:
+            assert directories == [tmp_path]
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc) -> None:
+            pass
+
+        def wait(self, timeout: float) -> None:
+            waits.append(timeout)
+            clock.now += timeout
+            target = tmp_path / "new.mp4"
+            if not target.exists():
+                target.write_bytes(b"\0" * 2_000_000)
+
+    clock = _FakeClock()
+    monkeypatch.setattr(ytdownloader, "WATCHDOG_AVAILABLE", True)
+    monkeypatch.setattr(ytdownloader, "_DownloadWatcher", _FakeWatcher, raising=False)
+    monkeypatch.setattr(ytdownloader.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(ytdownloader.time, "sleep", clock.sleep)
+
+    assert ytdownloader._wait_for_new_download([tmp_path], {}, 60) == tmp_path / "new.mp4"
+    assert waits and clock.sleeps == []
+
+
+def test_wait_for_new_download_stops_on_error_window(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    clock = _FakeClock()
+    monkeypatch.setattr(ytdownloader, "WATCHDOG_AVAILABLE", False)
+    monkeypatch.setattr(ytdownloader.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(ytdownloader.time, "sleep", clock.sleep)
+
+    watcher = ytdownloader._ErrorWindowWatcher(pid=42)
+
+    class _Window:
+        def __init__(self, pid: int, name: str) -> None:
+            self.CurrentProcessId = pid
+            self.CurrentName = name
+
+    watcher._on_window_opened(_Window(7, "Error"))  # another process
+    watcher._on_window_opened(_Window(42, "Settings"))
+    assert watcher.reason() is None
+
+    clock.on_sleep = lambda n: n == 2 and watcher._on_window_opened(
+        _Window(42, "Download failed")
+    )
+    with pytest.raises(ytdownloader.YouTubeDownloadError, match="reported an error"):
+        ytdownloader._wait_for_new_download([tmp_path], {}, 600, abort=watcher.reason)
+    assert len(clock.sleeps) == 2
+
+
+def test_error_window_watcher_subscribes_in_mta_and_aborts_the_wait(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import sys
+    import threading
+    import types
+
+    calls = []
+    subscribed = {}
+
+    class _Uia:
+        def GetRootElement(self):
+            return "root"
+
+        def AddAutomationEventHandler(self, event_id, element, scope, cache, handler):
+            calls.append(("add", threading.current_thread().name))
+            subscribed["handler"] = handler
+
+        def RemoveAllEventHandlers(self):
+            calls.append(("remove", threading.current_thread().name))
+
+    fake_comtypes = types.SimpleNamespace(
+        COINIT_MULTITHREADED=0,
+        CoInitializeEx=lambda flags: calls.append(("init", flags)),
+        CoUninitialize=lambda: calls.append(("uninit", None)),
+        COMObject=object,
+        client=types.SimpleNamespace(
+            GetModule=lambda name: None, CreateObject=lambda *a, **k: _Uia()
+        ),
+    )
+    uia_client = types.SimpleNamespace(
+        IUIAutomationEventHandler=object, CUIAutomation=object, IUIAutomation=object
+    )
+    fake_gen = types.SimpleNamespace(UIAutomationClient=uia_client)
+    monkeypatch.setitem(sys.modules, "comtypes.gen", fake_gen)
+    monkeypatch.setattr(ytdownloader, "COMTYPES_AVAILABLE", True)
+    monkeypatch.setattr(ytdownloader, "comtypes", fake_comtypes, raising=False)
+    monkeypatch.setattr(ytdownloader, "WATCHDOG_AVAILABLE", False)
+
+    class _Window:
+        CurrentProcessId = 42
+        CurrentName = "Download failed"
+
+    def fire() -> None:
+        # UIA delivers the event from one of its own worker threads
+        event = threading.Thread(
+            target=subscribed["handler"].IUIAutomationEventHandler_HandleAutomationEvent,
+            args=(_Window(), ytdownloader._UIA_WINDOW_OPENED_EVENT_ID),
+        )
+        event.start()
+        event.join()
+
+    clock = _FakeClock(on_sleep=lambda n: n == 1 and fire())
+    monkeypatch.setattr(ytdownloader.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(ytdownloader.time, "sleep", clock.sleep)
+
+    with pytest.raises(ytdownloader.YouTubeDownloadError, match="reported an error"):
+        with ytdownloader._ErrorWindowWatcher(pid=42) as watcher:
+            ytdownloader._wait_for_new_download([tmp_path], {}, 600, abort=watcher.reason)
+
+    assert calls == [
+        ("init", 0),
+        ("add", "uia-error-watcher"),
+        ("remove", "uia-error-watcher"),
+        ("uninit", None),
+    ]
+
+
+def test_find_ytdownloader_exe_prefers_env_then_running_process(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    exe = tmp_path / "YTDownloader.exe"
+    exe.write_bytes(b"")
+    running = tmp_path / "running" / "YTDownloader.exe"
+
+    class _Proc:
+        info = {"name": "YTDownloader.exe", "exe": str(running)}
+
+    class _FakePsutil:
+        @staticmethod
+        def process_iter(attrs):
+            assert attrs == ["name", "exe"]
+            return [_Proc()]
+
+    monkeypatch.setattr(ytdownloader, "PSUTIL_AVAILABLE", True)
+    monkeypatch.setattr(ytdownloader, "psutil", _FakePsutil, raising=False)
+    find = ytdownloader.find_ytdownloader_exe
+
+    monkeypatch.setenv("YT_DOWNLOADER_EXE", str(exe))
+    find.cache_clear()
+    assert find() == exe
+
+    monkeypatch.delenv("YT_DOWNLOADER_EXE")
+    find.cache_clear()
+    assert find() == running
+    find.cache_clear()
+
+
+def test_wait_for_main_window_retries_until_window_appears(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    clock = _FakeClock()
+    monkeypatch.setattr(ytdownloader.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(ytdownloader.time, "sleep", clock.sleep)
+
+    waited = []
+
+    class _Window:
+        def wait(self, criteria, timeout, retry_interval):
+            waited.append(criteria)
+
+    window = _Window()
+    results = iter([(None, None), (None, None), ("app", window)])
+    monkeypatch.setattr(ytdownloader, "_connect_to_window", lambda: next(results))
+
+    assert ytdownloader._wait_for_main_window(timeout=15) == ("app", window)
+    assert clock.sleeps == [0.5, 0.5]
+    assert waited == ["exists visible enabled"]
+
+    monkeypatch.setattr(ytdownloader, "_connect_to_window", lambda: (None, None))
+    assert ytdownloader._wait_for_main_window(timeout=2) == (None, None)
+
+
+def test_connect_to_window_prefers_exact_title_and_falls_back_to_desktop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    connected = []
+
+    class _FakeApp:
+        def __init__(self, backend: str) -> None:
+            pass
+
+        def connect(self, handle: int):
+            connected.append(handle)
+            return self
+
+        def window(self, handle: int):
+            return ("window", handle)
+
+    def _uia_unavailable(pid):
+        raise OSError("no UIA")
+
+    windows = [("Mail", 1), ("My ytDownloader helper", 2), ("YTDownloader", 3)]
+    monkeypatch.setattr(ytdownloader, "Application", _FakeApp, raising=False)
+    monkeypatch.setattr(ytdownloader, "_top_level_windows", _uia_unavailable)
+    monkeypatch.setattr(ytdownloader, "_desktop_windows", lambda pid: windows)
+
+    app, window = ytdownloader._connect_to_window(42)
+
+    assert window == ("window", 3)
+    assert connected == [3]
+
+    monkeypatch.setattr(ytdownloader, "_top_level_windows", lambda pid: windows[:2])
+    assert ytdownloader._connect_to_window()[1] == ("window", 2)
+    monkeypatch.setattr(ytdownloader, "_top_level_windows", lambda pid: windows[:1])
+    assert ytdownloader._connect_to_window() == (None, None)
+
+
+def test_wait_for_button_matches_caption_and_returns_none_on_timeout() -> None:
+    specs = []
+
+    class _Spec:
+        def __init__(self, ready: bool) -> None:
+            self.ready = ready
+
+        def wait(self, criteria, timeout, retry_interval):
+            if not self.ready:
+                raise TimeoutError
+            return "button"
+
+    class _Window:
+        def __init__(self, ready: bool) -> None:
+            self.ready = ready
+
+        def child_window(self, title_re, control_type):
+            specs.append((title_re, control_type))
+            return _Spec(self.ready)
+
+    assert ytdownloader._wait_for_button(_Window(True), "Download", timeout=1) == "button"
+    assert ytdownloader._wait_for_button(_Window(False), "Save", timeout=1) is None
+
+    pattern = re.compile(specs[0][0])
+    assert specs[0][1] == "Button"
+    assert pattern.match(" DOWNLOAD ") and not pattern.match("Download all")
+
+
+def test_wait_for_new_download_finishes_early_once_writer_closes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    target = tmp_path / "new.mp4"
+    target.write_bytes(b"\0" * 2_000_000)
+
+    clock = _FakeClock()
+    monkeypatch.setattr(ytdownloader, "WATCHDOG_AVAILABLE", False)
+    monkeypatch.setattr(ytdownloader.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(ytdownloader.time, "sleep", clock.sleep)
+    monkeypatch.setattr(ytdownloader, "_writer_has_closed", lambda path: path == target)
+
+    assert ytdownloader._wait_for_new_download([tmp_path], {}, timeout=60) == target
+    # Seen once, unchanged on the next tick and released: no 2s settle wait
+    assert clock.sleeps == [0.5]
+
+
+def test_running_pid_prefers_main_process_over_electron_helpers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class _Proc:
+        def __init__(self, pid: int, name: str, ppid: int) -> None:
+            self.pid = pid
+            self.info = {"name": name, "ppid": ppid}
+
+    procs = [
+        _Proc(11, "YTDownloader.exe", 10),  # GPU helper, listed first
+        _Proc(12, "YTDownloader.exe", 10),  # renderer
+        _Proc(10, "YTDownloader.exe", 4),  # main process (parent: explorer)
+        _Proc(5, "explorer.exe", 1),
+    ]
+
+    class _FakePsutil:
+        @staticmethod
+        def process_iter(attrs):
+            assert attrs == ["name", "ppid"]
+            return procs
+
+    monkeypatch.setattr(ytdownloader, "PSUTIL_AVAILABLE", True)
+    monkeypatch.setattr(ytdownloader, "psutil", _FakePsutil, raising=False)
+
+    assert ytdownloader._running_ytdownloader_pid() == 10
+    procs[:] = procs[3:]
+    assert ytdownloader._running_ytdownloader_pid() is None